@@ -0,0 +1,145 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-17 09:12:04.118532
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('users',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('hashed_password', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('role', sa.String(), nullable=False),
+    sa.Column('company', sa.String(), nullable=True),
+    sa.Column('avatar_url', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_verified', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('google_id', sa.String(), nullable=True),
+    sa.Column('linkedin_id', sa.String(), nullable=True),
+    sa.Column('phone', sa.String(), nullable=True),
+    sa.Column('location', sa.String(), nullable=True),
+    sa.Column('bio', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('google_id'),
+    sa.UniqueConstraint('linkedin_id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_table('job_postings',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('company', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('requirements', sa.JSON(), nullable=False),
+    sa.Column('location', sa.String(), nullable=False),
+    sa.Column('employment_type', sa.String(), nullable=False),
+    sa.Column('salary_min', sa.Integer(), nullable=True),
+    sa.Column('salary_max', sa.Integer(), nullable=True),
+    sa.Column('salary_currency', sa.String(), nullable=True),
+    sa.Column('skill_weights', sa.JSON(), nullable=False),
+    sa.Column('cutoff_percentage', sa.Float(), nullable=False),
+    sa.Column('max_candidates', sa.Integer(), nullable=False),
+    sa.Column('active_days', sa.Integer(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('enable_waitlist', sa.Boolean(), nullable=True),
+    sa.Column('waitlist_duration', sa.Integer(), nullable=True),
+    sa.Column('waitlist_message', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('selected_candidates', sa.Integer(), nullable=True),
+    sa.Column('rejected_candidates', sa.Integer(), nullable=True),
+    sa.Column('total_applications', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('recruiter_id', sa.UUID(), nullable=False),
+    sa.ForeignKeyConstraint(['recruiter_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('conversations',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('ended_at', sa.DateTime(), nullable=True),
+    sa.Column('duration', sa.Integer(), nullable=True),
+    sa.Column('final_analysis', sa.JSON(), nullable=True),
+    sa.Column('sentiment_score', sa.Float(), nullable=True),
+    sa.Column('confidence_score', sa.Float(), nullable=True),
+    sa.Column('candidate_id', sa.UUID(), nullable=False),
+    sa.Column('job_id', sa.UUID(), nullable=False),
+    sa.ForeignKeyConstraint(['candidate_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['job_id'], ['job_postings.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('job_applications',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('applied_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('reviewed_at', sa.DateTime(), nullable=True),
+    sa.Column('source', sa.String(), nullable=True),
+    sa.Column('referrer', sa.String(), nullable=True),
+    sa.Column('job_id', sa.UUID(), nullable=False),
+    sa.Column('candidate_id', sa.UUID(), nullable=False),
+    sa.ForeignKeyConstraint(['candidate_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['job_id'], ['job_postings.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('candidates',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('phone', sa.String(), nullable=True),
+    sa.Column('location', sa.String(), nullable=False),
+    sa.Column('cv_filename', sa.String(), nullable=True),
+    sa.Column('cv_file_path', sa.String(), nullable=True),
+    sa.Column('cv_file_size', sa.Integer(), nullable=True),
+    sa.Column('scores', sa.JSON(), nullable=False),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('applied_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('reviewed_at', sa.DateTime(), nullable=True),
+    sa.Column('feedback', sa.JSON(), nullable=True),
+    sa.Column('assessment_duration', sa.Integer(), nullable=True),
+    sa.Column('conversation_id', sa.UUID(), nullable=True),
+    sa.Column('job_id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=True),
+    sa.ForeignKeyConstraint(['conversation_id'], ['conversations.id'], ),
+    sa.ForeignKeyConstraint(['job_id'], ['job_postings.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('conversation_messages',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('sender', sa.String(), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('timestamp', sa.DateTime(), nullable=True),
+    sa.Column('analysis', sa.JSON(), nullable=True),
+    sa.Column('audio_file_path', sa.String(), nullable=True),
+    sa.Column('audio_duration', sa.Float(), nullable=True),
+    sa.Column('transcription_confidence', sa.Float(), nullable=True),
+    sa.Column('conversation_id', sa.UUID(), nullable=False),
+    sa.ForeignKeyConstraint(['conversation_id'], ['conversations.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('conversation_messages')
+    op.drop_table('candidates')
+    op.drop_table('job_applications')
+    op.drop_table('conversations')
+    op.drop_table('job_postings')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
@@ -0,0 +1,66 @@
+"""Add indexes for service query filters and convert JSON columns to JSONB
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 11:05:37.480912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = [
+    ('job_postings', 'requirements', False),
+    ('job_postings', 'skill_weights', False),
+    ('conversations', 'final_analysis', True),
+    ('candidates', 'scores', False),
+    ('candidates', 'feedback', True),
+    ('conversation_messages', 'analysis', True),
+]
+
+
+def upgrade() -> None:
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(table, column,
+                        existing_type=sa.JSON(),
+                        type_=postgresql.JSONB(astext_type=sa.Text()),
+                        existing_nullable=nullable,
+                        postgresql_using=f'{column}::jsonb')
+
+    op.create_index(op.f('ix_job_postings_recruiter_id'), 'job_postings', ['recruiter_id'], unique=False)
+    op.create_index('ix_job_postings_status_expires_at', 'job_postings', ['status', 'expires_at'], unique=False)
+    op.create_index('ix_candidates_job_id_status', 'candidates', ['job_id', 'status'], unique=False)
+    op.create_index('ix_candidates_job_id_overall_score', 'candidates', ['job_id', sa.text("CAST(scores ->> 'overall' AS FLOAT)")], unique=False)
+    op.create_index(op.f('ix_candidates_user_id'), 'candidates', ['user_id'], unique=False)
+    op.create_index('ix_job_applications_job_id_status', 'job_applications', ['job_id', 'status'], unique=False)
+    op.create_index(op.f('ix_job_applications_candidate_id'), 'job_applications', ['candidate_id'], unique=False)
+    op.create_index(op.f('ix_conversations_candidate_id'), 'conversations', ['candidate_id'], unique=False)
+    op.create_index(op.f('ix_conversations_job_id'), 'conversations', ['job_id'], unique=False)
+    op.create_index('ix_conversation_messages_conversation_id_timestamp', 'conversation_messages', ['conversation_id', 'timestamp'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_conversation_messages_conversation_id_timestamp', table_name='conversation_messages')
+    op.drop_index(op.f('ix_conversations_job_id'), table_name='conversations')
+    op.drop_index(op.f('ix_conversations_candidate_id'), table_name='conversations')
+    op.drop_index(op.f('ix_job_applications_candidate_id'), table_name='job_applications')
+    op.drop_index('ix_job_applications_job_id_status', table_name='job_applications')
+    op.drop_index(op.f('ix_candidates_user_id'), table_name='candidates')
+    op.drop_index('ix_candidates_job_id_overall_score', table_name='candidates')
+    op.drop_index('ix_candidates_job_id_status', table_name='candidates')
+    op.drop_index('ix_job_postings_status_expires_at', table_name='job_postings')
+    op.drop_index(op.f('ix_job_postings_recruiter_id'), table_name='job_postings')
+
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(table, column,
+                        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                        type_=sa.JSON(),
+                        existing_nullable=nullable,
+                        postgresql_using=f'{column}::json')
@@ -0,0 +1,58 @@
+"""Add typed and weighted score columns to candidates
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 11:48:12.907366
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+SCORE_KEYS = ['overall', 'technical', 'soft', 'leadership', 'communication']
+SKILLS = ['technical', 'soft', 'leadership', 'communication']
+
+
+def upgrade() -> None:
+    for key in SCORE_KEYS + ['weighted']:
+        op.add_column('candidates', sa.Column(f'{key}_score', sa.Float(), nullable=True))
+
+    # Same formula as app.services.scoring.weighted_score
+    op.execute(
+        "UPDATE candidates SET "
+        + ", ".join(f"{key}_score = COALESCE((scores ->> '{key}')::float, 0)" for key in SCORE_KEYS)
+    )
+    weights = ", ".join(f"COALESCE((skill_weights ->> '{skill}')::float, 0) AS {skill}" for skill in SKILLS)
+    weighted_sum = " + ".join(f"w.{skill} * c.{skill}_score" for skill in SKILLS)
+    total = " + ".join(f"w.{skill}" for skill in SKILLS)
+    op.execute(
+        f"UPDATE candidates AS c SET weighted_score = CASE WHEN {total} > 0 "
+        f"THEN ({weighted_sum}) / ({total}) ELSE c.overall_score END "
+        f"FROM (SELECT id, {weights} FROM job_postings) AS w WHERE w.id = c.job_id"
+    )
+
+    for key in SCORE_KEYS + ['weighted']:
+        op.alter_column('candidates', f'{key}_score', existing_type=sa.Float(), nullable=False)
+
+    op.drop_index('ix_candidates_job_id_overall_score', table_name='candidates')
+    op.drop_index('ix_candidates_job_id_status', table_name='candidates')
+    op.create_index('ix_candidates_job_id_weighted_score', 'candidates', ['job_id', 'weighted_score', 'id'], unique=False)
+    op.create_index('ix_candidates_job_id_status_weighted_score', 'candidates', ['job_id', 'status', 'weighted_score', 'id'], unique=False)
+    op.create_index('ix_candidates_job_id_overall_score', 'candidates', ['job_id', 'overall_score'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_candidates_job_id_overall_score', table_name='candidates')
+    op.drop_index('ix_candidates_job_id_status_weighted_score', table_name='candidates')
+    op.drop_index('ix_candidates_job_id_weighted_score', table_name='candidates')
+    op.create_index('ix_candidates_job_id_status', 'candidates', ['job_id', 'status'], unique=False)
+    op.create_index('ix_candidates_job_id_overall_score', 'candidates', ['job_id', sa.text("CAST(scores ->> 'overall' AS FLOAT)")], unique=False)
+
+    for key in reversed(SCORE_KEYS + ['weighted']):
+        op.drop_column('candidates', f'{key}_score')
@@ -0,0 +1,44 @@
+"""Add (sort key, id) indexes for keyset-paginated job and application lists
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 12:31:54.260194
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_job_postings_created_at', 'job_postings', ['created_at', 'id'], unique=False)
+    op.create_index('ix_job_postings_status_created_at', 'job_postings', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_job_postings_recruiter_id_created_at', 'job_postings', ['recruiter_id', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_job_postings_status_expires_at', table_name='job_postings')
+    op.drop_index('ix_job_postings_recruiter_id', table_name='job_postings')
+
+    op.create_index('ix_job_applications_job_id_applied_at', 'job_applications', ['job_id', 'applied_at', 'id'], unique=False)
+    op.create_index('ix_job_applications_job_id_status_applied_at', 'job_applications', ['job_id', 'status', 'applied_at', 'id'], unique=False)
+    op.create_index('ix_job_applications_candidate_id_applied_at', 'job_applications', ['candidate_id', 'applied_at', 'id'], unique=False)
+    op.drop_index('ix_job_applications_job_id_status', table_name='job_applications')
+    op.drop_index('ix_job_applications_candidate_id', table_name='job_applications')
+
+
+def downgrade() -> None:
+    op.create_index('ix_job_applications_candidate_id', 'job_applications', ['candidate_id'], unique=False)
+    op.create_index('ix_job_applications_job_id_status', 'job_applications', ['job_id', 'status'], unique=False)
+    op.drop_index('ix_job_applications_candidate_id_applied_at', table_name='job_applications')
+    op.drop_index('ix_job_applications_job_id_status_applied_at', table_name='job_applications')
+    op.drop_index('ix_job_applications_job_id_applied_at', table_name='job_applications')
+
+    op.create_index('ix_job_postings_recruiter_id', 'job_postings', ['recruiter_id'], unique=False)
+    op.create_index('ix_job_postings_status_expires_at', 'job_postings', ['status', 'expires_at'], unique=False)
+    op.drop_index('ix_job_postings_recruiter_id_created_at', table_name='job_postings')
+    op.drop_index('ix_job_postings_status_created_at', table_name='job_postings')
+    op.drop_index('ix_job_postings_created_at', table_name='job_postings')
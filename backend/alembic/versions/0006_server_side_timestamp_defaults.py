@@ -0,0 +1,40 @@
+"""Generate row timestamps with server-side defaults
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 13:20:41.583102
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+# Same expression as app.models.functions.utcnow on PostgreSQL
+UTCNOW = sa.text("TIMEZONE('utc', clock_timestamp())")
+
+TIMESTAMP_COLUMNS = [
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('job_postings', 'created_at'),
+    ('job_postings', 'updated_at'),
+    ('candidates', 'applied_at'),
+    ('job_applications', 'applied_at'),
+    ('conversations', 'started_at'),
+    ('conversation_messages', 'timestamp'),
+]
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.DateTime(), server_default=UTCNOW)
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.DateTime(), server_default=None)
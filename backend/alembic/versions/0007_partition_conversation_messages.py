@@ -0,0 +1,100 @@
+"""Partition conversation_messages by month and track archived transcripts
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 16:02:18.240517
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+COLUMNS = """
+    id UUID NOT NULL,
+    sender VARCHAR NOT NULL,
+    message TEXT NOT NULL,
+    "timestamp" TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT TIMEZONE('utc', clock_timestamp()),
+    analysis JSONB,
+    audio_file_path VARCHAR,
+    audio_duration FLOAT,
+    transcription_confidence FLOAT,
+    conversation_id UUID NOT NULL"""
+
+COLUMN_NAMES = "id, sender, message, analysis, audio_file_path, audio_duration, transcription_confidence, conversation_id"
+
+INDEX = 'ix_conversation_messages_conversation_id_timestamp'
+
+
+def _rename_old_table() -> None:
+    # Constraint and index names are global per schema; free them for the new table
+    op.rename_table('conversation_messages', 'conversation_messages_old')
+    op.execute('ALTER TABLE conversation_messages_old RENAME CONSTRAINT conversation_messages_pkey TO conversation_messages_old_pkey')
+    op.execute('ALTER TABLE conversation_messages_old RENAME CONSTRAINT conversation_messages_conversation_id_fkey '
+               'TO conversation_messages_old_conversation_id_fkey')
+    op.execute(f'ALTER INDEX {INDEX} RENAME TO ix_conversation_messages_old_conversation_id_timestamp')
+
+
+def upgrade() -> None:
+    op.add_column('conversations', sa.Column('archive_segment', sa.String(), nullable=True))
+    op.add_column('conversations', sa.Column('archive_offset', sa.BigInteger(), nullable=True))
+    op.add_column('conversations', sa.Column('archive_length', sa.Integer(), nullable=True))
+
+    _rename_old_table()
+    op.execute(f"""
+        CREATE TABLE conversation_messages ({COLUMNS},
+            CONSTRAINT conversation_messages_pkey PRIMARY KEY (id, "timestamp"),
+            CONSTRAINT conversation_messages_conversation_id_fkey FOREIGN KEY (conversation_id) REFERENCES conversations (id)
+        ) PARTITION BY RANGE ("timestamp")
+    """)
+    op.execute(f'CREATE INDEX {INDEX} ON conversation_messages (conversation_id, "timestamp")')
+    op.execute('CREATE TABLE conversation_messages_default PARTITION OF conversation_messages DEFAULT')
+    # Monthly partitions from the oldest message through two months ahead;
+    # app.services.message_partitions keeps creating them from here on
+    op.execute("""
+        DO $$
+        DECLARE
+            part_month date := date_trunc('month', COALESCE(
+                (SELECT min("timestamp") FROM conversation_messages_old), TIMEZONE('utc', now())))::date;
+            last_month date := (date_trunc('month', TIMEZONE('utc', now())) + interval '2 months')::date;
+        BEGIN
+            WHILE part_month <= last_month LOOP
+                EXECUTE format('CREATE TABLE %I PARTITION OF conversation_messages FOR VALUES FROM (%L) TO (%L)',
+                               'conversation_messages_p' || to_char(part_month, 'YYYYMM'), part_month, part_month + interval '1 month');
+                part_month := (part_month + interval '1 month')::date;
+            END LOOP;
+        END $$
+    """)
+    op.execute(f"""
+        INSERT INTO conversation_messages ({COLUMN_NAMES}, "timestamp")
+        SELECT {COLUMN_NAMES}, COALESCE("timestamp", TIMEZONE('utc', now())) FROM conversation_messages_old
+    """)
+    op.drop_table('conversation_messages_old')
+
+
+def downgrade() -> None:
+    _rename_old_table()
+    op.execute(f"""
+        CREATE TABLE conversation_messages ({COLUMNS},
+            CONSTRAINT conversation_messages_pkey PRIMARY KEY (id),
+            CONSTRAINT conversation_messages_conversation_id_fkey FOREIGN KEY (conversation_id) REFERENCES conversations (id)
+        )
+    """)
+    op.execute(f'CREATE INDEX {INDEX} ON conversation_messages (conversation_id, "timestamp")')
+    op.execute(f"""
+        INSERT INTO conversation_messages ({COLUMN_NAMES}, "timestamp")
+        SELECT {COLUMN_NAMES}, "timestamp" FROM conversation_messages_old
+    """)
+    # Dropping the partitioned table drops its partitions
+    op.drop_table('conversation_messages_old')
+    op.alter_column('conversation_messages', 'timestamp', existing_type=sa.DateTime(), nullable=True)
+
+    # Archived transcripts are not restored; their segment files stay on disk
+    op.drop_column('conversations', 'archive_length')
+    op.drop_column('conversations', 'archive_offset')
+    op.drop_column('conversations', 'archive_segment')
@@ -0,0 +1,35 @@
+"""Track updated_at on candidates and conversations for ETag version probes
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 18:11:52.904316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+# Same expression as app.models.functions.utcnow on PostgreSQL
+UTCNOW = sa.text("TIMEZONE('utc', clock_timestamp())")
+
+
+def upgrade() -> None:
+    # Added nullable without a default, then given one, so existing rows are not
+    # rewritten; they keep NULL until their next update
+    for table in ('candidates', 'conversations'):
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.alter_column(table, 'updated_at', existing_type=sa.DateTime(), server_default=UTCNOW)
+    # Version probe for a job's candidate list: count(*) and max(updated_at)
+    op.create_index('ix_candidates_job_id_updated_at', 'candidates', ['job_id', 'updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_candidates_job_id_updated_at', table_name='candidates')
+    op.drop_column('conversations', 'updated_at')
+    op.drop_column('candidates', 'updated_at')
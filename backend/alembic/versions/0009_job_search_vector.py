@@ -0,0 +1,36 @@
+"""Full-text search vector on job postings
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 20:37:05.118264
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+# Same expression as app.models.job.SEARCH_VECTOR_EXPRESSION
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(jsonb_to_tsvector('english', coalesce(requirements, '[]'::jsonb), '[\"string\"]'), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    # A stored generated column: PostgreSQL keeps it current on every insert
+    # and update, including ones that bypass the job services
+    op.add_column('job_postings', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR, persisted=True)))
+    op.create_index('ix_job_postings_search_vector', 'job_postings', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_postings_search_vector', table_name='job_postings')
+    op.drop_column('job_postings', 'search_vector')
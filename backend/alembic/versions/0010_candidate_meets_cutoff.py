@@ -0,0 +1,32 @@
+"""Store whether each candidate meets the job's cutoff
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17 21:14:52.406718
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('candidates', sa.Column('meets_cutoff', sa.Boolean(), nullable=True))
+
+    # Same rule as app.services.scoring.meets_cutoff
+    op.execute(
+        "UPDATE candidates AS c SET meets_cutoff = c.weighted_score >= j.cutoff_percentage "
+        "FROM job_postings AS j WHERE j.id = c.job_id"
+    )
+
+    op.alter_column('candidates', 'meets_cutoff', existing_type=sa.Boolean(), nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_column('candidates', 'meets_cutoff')
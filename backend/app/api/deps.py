@@ -1,27 +1,38 @@
-from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status
+import hmac
+from typing import AsyncGenerator, Generator, Optional
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
 from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core import security
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import SessionLocal, async_read_session, get_async_db, get_db, read_session
+from app.core.revocation import is_shared as revocations_shared, is_token_revoked
 from app.models.user import User
-from app.schemas.auth import TokenData
+from app.schemas.auth import TokenData, Principal
+from app.services import user_cache
 
 security_scheme = HTTPBearer()
+optional_security_scheme = HTTPBearer(auto_error=False)
 
-def get_current_user(
-    db: Session = Depends(get_db),
+async def get_token_data(
     credentials: HTTPAuthorizationCredentials = Depends(security_scheme)
-) -> User:
+) -> TokenData:
     try:
         payload = jwt.decode(
             credentials.credentials, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        token_data = TokenData(username=payload.get("sub"))
+        token_data = TokenData(
+            username=payload.get("sub"),
+            role=payload.get("role"),
+            is_active=payload.get("active"),
+            token_version=payload.get("ver"),
+        )
         if token_data.username is None:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -32,12 +43,99 @@ def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    
-    user = db.query(User).filter(User.id == token_data.username).first()
+
+    if token_data.token_version is not None and is_token_revoked(token_data.username, token_data.token_version):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
+    return token_data
+
+def get_token_subject(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security_scheme),
+) -> Optional[str]:
+    """
+    Subject of the bearer token if one is present and valid; never rejects the request.
+    """
+    if credentials is None:
+        return None
+    return security.verify_token(credentials.credentials)
+
+def get_read_db(
+    user_id: Optional[str] = Depends(get_token_subject),
+) -> Generator[Session, None, None]:
+    db = read_session(user_id=user_id)
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db(
+    user_id: Optional[str] = Depends(get_token_subject),
+) -> AsyncGenerator[AsyncSession, None]:
+    async with async_read_session(user_id=user_id) as db:
+        yield db
+
+def get_current_user(
+    db: Session = Depends(get_db),
+    token_data: TokenData = Depends(get_token_data),
+) -> User:
+    user = user_cache.get_user(db, user_id=token_data.username)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    if token_data.token_version is not None and token_data.token_version < user.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
+    return user
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db),
+    token_data: TokenData = Depends(get_token_data),
+) -> User:
+    user = await user_cache.get_user_async(db, user_id=token_data.username)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    if token_data.token_version is not None and token_data.token_version < user.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
     return user
 
+def _principal_from_db(token_data: TokenData) -> Principal:
+    # Read past the user cache: another worker's deactivation or role change
+    # must show up on the next request
+    db = SessionLocal()
+    try:
+        user = db.execute(
+            select(User.id, User.role, User.is_active, User.token_version).where(User.id == token_data.username)
+        ).first()
+    finally:
+        db.close()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    if token_data.token_version is not None and token_data.token_version < user.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
+    return Principal(id=user.id, role=user.role, is_active=user.is_active)
+
+async def get_current_principal(
+    token_data: TokenData = Depends(get_token_data),
+) -> Principal:
+    if token_data.role is None or token_data.is_active is None or not revocations_shared():
+        # Tokens issued before role/active claims were added, or no Redis to
+        # carry revocations to the other workers: check the user's row
+        return await run_in_threadpool(_principal_from_db, token_data)
+    return Principal(
+        id=token_data.username,
+        role=token_data.role,
+        is_active=token_data.is_active,
+    )
+
 def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -45,9 +143,23 @@ def get_current_active_user(
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
-def get_current_recruiter(
-    current_user: User = Depends(get_current_active_user),
+async def get_current_active_user_async(
+    current_user: User = Depends(get_current_user_async),
 ) -> User:
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+async def get_current_active_principal(
+    current_user: Principal = Depends(get_current_principal),
+) -> Principal:
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+async def get_current_recruiter(
+    current_user: Principal = Depends(get_current_active_principal),
+) -> Principal:
     if current_user.role != "recruiter":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -55,12 +167,26 @@ def get_current_recruiter(
         )
     return current_user
 
-def get_current_candidate(
-    current_user: User = Depends(get_current_active_user),
-) -> User:
+async def get_current_candidate(
+    current_user: Principal = Depends(get_current_active_principal),
+) -> Principal:
     if current_user.role != "candidate":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
-    return current_user
\ No newline at end of file
+    return current_user
+
+def verify_internal_token(
+    x_internal_token: Optional[str] = Header(None),
+) -> None:
+    """
+    Internal endpoints are only served to callers presenting INTERNAL_API_TOKEN;
+    with no token configured they reject every request.
+    """
+    expected = settings.INTERNAL_API_TOKEN
+    if not expected or x_internal_token is None or not hmac.compare_digest(x_internal_token, expected):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
@@ -1,5 +1,11 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, users, jobs, candidates, conversations, applications
+from app.api.v1.endpoints import internal
+from app.core.config import settings
+
+if settings.DATABASE_ASYNC:
+    from app.api.v1.endpoints.aio import auth, users, jobs, candidates, conversations, applications
+else:
+    from app.api.v1.endpoints import auth, users, jobs, candidates, conversations, applications
 
 api_router = APIRouter()
 
@@ -8,4 +14,7 @@ api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
 api_router.include_router(candidates.router, prefix="/candidates", tags=["candidates"])
 api_router.include_router(conversations.router, prefix="/conversations", tags=["conversations"])
-api_router.include_router(applications.router, prefix="/applications", tags=["applications"])
\ No newline at end of file
+api_router.include_router(applications.router, prefix="/applications", tags=["applications"])
+
+if settings.ENABLE_INTERNAL_ENDPOINTS:
+    api_router.include_router(internal.router, prefix="/internal", tags=["internal"])
\ No newline at end of file
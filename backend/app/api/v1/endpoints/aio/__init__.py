@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+from fastapi.routing import APIRoute
+
+def overlay(sync_router: APIRouter, async_router: APIRouter) -> APIRouter:
+    """
+    The routes of sync_router in their original order, with every route that
+    async_router defines for the same path and methods swapped for the async
+    one. Keeping the original order matters: a static path such as /my-jobs
+    must still be tried before /{job_id}.
+    """
+    def route_key(route):
+        methods = frozenset(route.methods or ()) if isinstance(route, APIRoute) else None
+        return route.path, methods
+
+    overrides = {route_key(route): route for route in async_router.routes}
+    router = APIRouter()
+    for route in sync_router.routes:
+        router.routes.append(overrides.pop(route_key(route), route))
+    router.routes.extend(overrides.values())
+    return router
@@ -0,0 +1,122 @@
+from typing import Any, List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from app.api import deps
+from app.api.v1.endpoints import applications
+from app.api.v1.endpoints.aio import overlay
+from app.core.database import get_async_db
+from app.core.responses import schema_response
+from app.schemas.auth import Principal
+from app.schemas.application import JobApplication as ApplicationSchema, JobApplicationCreate, JobApplicationUpdate
+from app.schemas.pagination import Page
+from app.services.applications import APPLICATION_ORDER
+from app.services.aio.applications import create_application, get_application_for_user, get_applications_by_user, get_applications_by_job, update_application
+
+async_router = APIRouter()
+
+@async_router.post("/", response_model=ApplicationSchema)
+async def create_job_application(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    application_in: JobApplicationCreate,
+    current_user: Principal = Depends(deps.get_current_candidate),
+) -> Any:
+    """
+    Create new job application
+    """
+    return await create_application(db, application_create=application_in, candidate_id=current_user.id)
+
+@async_router.get("/my-applications", response_model=Union[List[ApplicationSchema], Page[ApplicationSchema]])
+async def read_my_applications(
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: Principal = Depends(deps.get_current_candidate),
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor (empty for the first page); returns a page envelope"),
+) -> Any:
+    """
+    Retrieve applications by current candidate, most recent first
+    """
+    try:
+        applications = await get_applications_by_user(db, user_id=current_user.id, skip=skip, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if cursor is None:
+        return schema_response(List[ApplicationSchema], applications)
+    return schema_response(Page[ApplicationSchema], {"items": applications, "next_cursor": APPLICATION_ORDER.next_cursor(applications, limit)})
+
+@async_router.get("/job/{job_id}", response_model=Union[List[ApplicationSchema], Page[ApplicationSchema]])
+async def read_applications_by_job(
+    *,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    job_id: UUID,
+    current_user: Principal = Depends(deps.get_current_recruiter),
+    skip: int = 0,
+    limit: int = 100,
+    status: str = Query(None, description="Filter by status"),
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor (empty for the first page); returns a page envelope"),
+) -> Any:
+    """
+    Retrieve applications for a specific job, most recent first (recruiter only)
+    """
+    try:
+        applications = await get_applications_by_job(
+            db,
+            job_id=job_id,
+            recruiter_id=current_user.id,
+            skip=skip,
+            limit=limit,
+            status=status,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if cursor is None:
+        return schema_response(List[ApplicationSchema], applications)
+    return schema_response(Page[ApplicationSchema], {"items": applications, "next_cursor": APPLICATION_ORDER.next_cursor(applications, limit)})
+
+@async_router.get("/{application_id}", response_model=ApplicationSchema)
+async def read_application(
+    *,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    application_id: UUID,
+    current_user: Principal = Depends(deps.get_current_principal),
+) -> Any:
+    """
+    Get application by ID
+    """
+    # Fetched together with the permission check
+    application, allowed = await get_application_for_user(
+        db, application_id=application_id, user_id=current_user.id, role=current_user.role
+    )
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+    if not allowed:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    return application
+
+@async_router.put("/{application_id}", response_model=ApplicationSchema)
+async def update_job_application(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    application_id: UUID,
+    application_in: JobApplicationUpdate,
+    current_user: Principal = Depends(deps.get_current_recruiter),
+) -> Any:
+    """
+    Update job application (recruiter only)
+    """
+    application, allowed = await get_application_for_user(
+        db, application_id=application_id, user_id=current_user.id, role="recruiter"
+    )
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+    if not allowed:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    return await update_application(db, application=application, application_update=application_in)
+
+router = overlay(applications.router, async_router)
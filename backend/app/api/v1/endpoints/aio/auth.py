@@ -0,0 +1,124 @@
+import math
+from datetime import timedelta
+from typing import Any
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.api.v1.endpoints import auth
+from app.api.v1.endpoints.aio import overlay
+from app.core import security
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.schemas.auth import Token, LoginRequest, GoogleAuthRequest
+from app.schemas.user import UserCreate, User as UserSchema
+from app.services.aio.auth import authenticate_user, create_user, get_or_create_google_user, get_user_by_email
+from app.services.auth import verify_google_token
+from app.services.login_throttle import check_login_allowed, record_login_failure, record_login_success
+
+async_router = APIRouter()
+
+@async_router.post("/login", response_model=Token)
+async def login_access_token(
+    request: Request,
+    form_data: LoginRequest,
+    db: AsyncSession = Depends(get_async_db),
+) -> Any:
+    """
+    OAuth2 compatible token login, get an access token for future requests
+    """
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = await run_in_threadpool(check_login_allowed, email=form_data.email, client_ip=client_ip)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, please try again later",
+            headers={"Retry-After": str(max(math.ceil(retry_after), 1))},
+        )
+    
+    user = await authenticate_user(db, email=form_data.email, password=form_data.password)
+    if not user:
+        await run_in_threadpool(record_login_failure, email=form_data.email)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    elif not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, 
+            detail="Inactive user"
+        )
+    
+    await run_in_threadpool(record_login_success, email=form_data.email)
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = security.create_access_token(
+        user.id,
+        expires_delta=access_token_expires,
+        role=user.role,
+        is_active=user.is_active,
+        token_version=user.token_version,
+    )
+    refresh_token = security.create_refresh_token(user.id, token_version=user.token_version)
+    
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+    }
+
+@async_router.post("/register", response_model=UserSchema)
+async def register(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    user_in: UserCreate,
+) -> Any:
+    """
+    Create new user.
+    """
+    user = await get_user_by_email(db, email=user_in.email)
+    if user:
+        raise HTTPException(
+            status_code=400,
+            detail="The user with this email already exists in the system.",
+        )
+    return await create_user(db, user_create=user_in)
+
+@async_router.post("/google", response_model=Token)
+async def google_auth(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    google_auth: GoogleAuthRequest,
+) -> Any:
+    """
+    Google OAuth authentication
+    """
+    try:
+        google_user_info = await verify_google_token(google_auth.token)
+        user = await get_or_create_google_user(db, user_info=google_user_info, role=google_auth.role)
+        
+        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        access_token = security.create_access_token(
+            user.id,
+            expires_delta=access_token_expires,
+            role=user.role,
+            is_active=user.is_active,
+            token_version=user.token_version,
+        )
+        refresh_token = security.create_refresh_token(user.id, token_version=user.token_version)
+        
+        return {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_type": "bearer",
+        }
+        
+    except security.PasswordHashingBusy:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid Google token",
+        )
+
+router = overlay(auth.router, async_router)
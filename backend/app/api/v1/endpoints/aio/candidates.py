@@ -0,0 +1,228 @@
+from typing import Any, List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from app.api import deps
+from app.api.v1.endpoints import candidates
+from app.api.v1.endpoints.aio import overlay
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.etag import etag_matches, not_modified, set_etag, weak_etag
+from app.core.responses import schema_response
+from app.schemas.auth import Principal
+from app.schemas.candidate import (
+    BulkCandidateResult, BulkDecision, BulkDecisionResult, Candidate as CandidateSchema, CandidateCreate, CandidateRank, CandidateRanking,
+    CandidateUpdate,
+)
+from app.schemas.pagination import Page
+from app.services.candidates import CANDIDATE_ORDER
+from app.services.aio.candidates import (
+    bulk_create_candidates, create_candidate, decide_candidates, update_candidate, get_candidate_for_user, get_candidate_rank,
+    get_candidate_ranking, get_candidates_by_job, get_candidates_version, select_candidate, reject_candidate,
+)
+
+async_router = APIRouter()
+
+@async_router.post("/", response_model=CandidateSchema)
+async def create_candidate_application(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    candidate_in: CandidateCreate,
+    current_user: Principal = Depends(deps.get_current_candidate),
+) -> Any:
+    """
+    Create new candidate application
+    """
+    try:
+        return await create_candidate(db, candidate_create=candidate_in, user_id=current_user.id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@async_router.post("/bulk", response_model=BulkCandidateResult)
+async def bulk_create_candidate_applications(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(deps.get_current_recruiter),
+) -> Any:
+    """
+    Import scored candidates for the recruiter's jobs from a JSON array or an
+    NDJSON stream (Content-Type: application/x-ndjson)
+    """
+    result = BulkCandidateResult(inserted=0, failed=0, errors=[])
+    async for chunk in candidates.bulk_chunks(request, settings.CANDIDATE_BULK_CHUNK_SIZE):
+        inserted, errors = await bulk_create_candidates(db, rows=chunk, recruiter_id=current_user.id)
+        result.inserted += inserted
+        result.errors += sorted(errors, key=lambda error: error.index)
+    result.failed = len(result.errors)
+    return result
+
+@async_router.get("/job/{job_id}", response_model=Union[List[CandidateSchema], Page[CandidateSchema]])
+async def read_candidates_by_job(
+    *,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    request: Request,
+    response: Response,
+    job_id: UUID,
+    current_user: Principal = Depends(deps.get_current_recruiter),
+    skip: int = 0,
+    limit: int = 100,
+    status: str = Query(None, description="Filter by status"),
+    min_score: float = Query(0, description="Minimum overall score"),
+    min_weighted_score: float = Query(0, description="Minimum score weighted by the job's skill weights"),
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor (empty for the first page); returns a page envelope"),
+) -> Any:
+    """
+    Retrieve candidates for a specific job, best weighted score first (recruiter only)
+    """
+    # Version probe first: an unchanged list is answered without loading it
+    version = await get_candidates_version(db, job_id=job_id, recruiter_id=current_user.id)
+    etag = weak_etag(version, skip, limit, status, min_score, min_weighted_score, cursor)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    try:
+        candidates = await get_candidates_by_job(
+            db,
+            job_id=job_id,
+            recruiter_id=current_user.id,
+            skip=skip,
+            limit=limit,
+            status=status,
+            min_score=min_score,
+            min_weighted_score=min_weighted_score,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Validated once and serialized in pydantic-core, see app.core.responses
+    if cursor is None:
+        return schema_response(List[CandidateSchema], candidates, response=response)
+    page = {"items": candidates, "next_cursor": CANDIDATE_ORDER.next_cursor(candidates, limit)}
+    return schema_response(Page[CandidateSchema], page, response=response)
+
+@async_router.get("/job/{job_id}/ranking", response_model=CandidateRanking)
+async def read_candidate_ranking(
+    *,
+    # The primary: rebuilding the rank index must see every committed candidate
+    db: AsyncSession = Depends(get_async_db),
+    job_id: UUID,
+    current_user: Principal = Depends(deps.get_current_recruiter),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+) -> Any:
+    """
+    Candidates for a job with their ranks, best weighted score first (recruiter only)
+    """
+    ranking = await get_candidate_ranking(db, job_id=job_id, recruiter_id=current_user.id, skip=skip, limit=limit)
+    if ranking is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return schema_response(CandidateRanking, ranking)
+
+@async_router.post("/job/{job_id}/decisions", response_model=BulkDecisionResult)
+async def decide_candidates_for_job(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    job_id: UUID,
+    decision_in: BulkDecision,
+    current_user: Principal = Depends(deps.get_current_recruiter),
+) -> Any:
+    """
+    Select, reject or waitlist many candidates of a job at once
+    """
+    try:
+        candidate_ids = await decide_candidates(db, job_id=job_id, recruiter_id=current_user.id, decision=decision_in)
+    except ValueError as e:
+        raise HTTPException(status_code=404 if str(e) == "Job not found" else 400, detail=str(e))
+    return BulkDecisionResult(updated=len(candidate_ids), candidate_ids=candidate_ids)
+
+async def _get_accessible_candidate(db: AsyncSession, candidate_id: UUID, current_user: Principal):
+    # Fetched together with the permission check
+    candidate, allowed = await get_candidate_for_user(db, candidate_id=candidate_id, user_id=current_user.id, role=current_user.role)
+    if not candidate:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    if not allowed:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return candidate
+
+@async_router.get("/{candidate_id}", response_model=CandidateSchema)
+async def read_candidate(
+    *,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    candidate_id: UUID,
+    current_user: Principal = Depends(deps.get_current_principal),
+) -> Any:
+    """
+    Get candidate by ID
+    """
+    candidate = await _get_accessible_candidate(db, candidate_id, current_user)
+    etag = candidates.candidate_etag(candidate)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return schema_response(CandidateSchema, candidate, response=response)
+
+@async_router.get("/{candidate_id}/rank", response_model=CandidateRank)
+async def read_candidate_rank(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    candidate_id: UUID,
+    current_user: Principal = Depends(deps.get_current_principal),
+) -> Any:
+    """
+    Candidate's rank and percentile by weighted score among the job's candidates
+    """
+    candidate = await _get_accessible_candidate(db, candidate_id, current_user)
+    return schema_response(CandidateRank, await get_candidate_rank(db, candidate=candidate))
+
+@async_router.put("/{candidate_id}", response_model=CandidateSchema)
+async def update_candidate_application(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    candidate_id: UUID,
+    candidate_in: CandidateUpdate,
+    current_user: Principal = Depends(deps.get_current_principal),
+) -> Any:
+    """
+    Update candidate application
+    """
+    candidate = await _get_accessible_candidate(db, candidate_id, current_user)
+    return await update_candidate(db, candidate=candidate, candidate_update=candidate_in)
+
+@async_router.post("/{candidate_id}/select")
+async def select_candidate_for_interview(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    candidate_id: UUID,
+    current_user: Principal = Depends(deps.get_current_recruiter),
+) -> Any:
+    """
+    Select candidate for interview
+    """
+    try:
+        candidate = await select_candidate(db, candidate_id=candidate_id, recruiter_id=current_user.id)
+    except ValueError as e:
+        raise candidates.decision_error(e)
+    return {"message": "Candidate selected successfully", "candidate": CandidateSchema.model_validate(candidate)}
+
+@async_router.post("/{candidate_id}/reject")
+async def reject_candidate_application(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    candidate_id: UUID,
+    reason: str = None,
+    current_user: Principal = Depends(deps.get_current_recruiter),
+) -> Any:
+    """
+    Reject candidate application
+    """
+    try:
+        candidate = await reject_candidate(db, candidate_id=candidate_id, recruiter_id=current_user.id, reason=reason)
+    except ValueError as e:
+        raise candidates.decision_error(e)
+    return {"message": "Candidate rejected", "candidate": CandidateSchema.model_validate(candidate)}
+
+router = overlay(candidates.router, async_router)
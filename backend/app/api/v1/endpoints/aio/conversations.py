@@ -0,0 +1,118 @@
+from typing import Any, List
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from app.api import deps
+from app.api.v1.endpoints import conversations
+from app.api.v1.endpoints.aio import overlay
+from app.core.database import get_async_db
+from app.core.etag import etag_matches, not_modified, set_etag, weak_etag
+from app.core.responses import schema_response
+from app.schemas.auth import Principal
+from app.schemas.conversation import Conversation as ConversationSchema, ConversationCreate, MessageCreate, ConversationMessage
+from app.services.aio.conversations import create_conversation, add_message, add_messages, get_conversation, get_conversation_for_user, get_conversation_version, end_conversation
+
+async_router = APIRouter()
+
+@async_router.post("/", response_model=ConversationSchema)
+async def create_conversation_session(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    conversation_in: ConversationCreate,
+    current_user: Principal = Depends(deps.get_current_candidate),
+) -> Any:
+    """
+    Create new conversation session
+    """
+    return await create_conversation(db, conversation_create=conversation_in, candidate_id=current_user.id)
+
+@async_router.get("/{conversation_id}", response_model=ConversationSchema)
+async def read_conversation(
+    *,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    conversation_id: UUID,
+    current_user: Principal = Depends(deps.get_current_principal),
+) -> Any:
+    """
+    Get conversation by ID
+    """
+    # Version probe first: an unchanged conversation is answered without loading its transcript
+    version, allowed = await get_conversation_version(
+        db, conversation_id=conversation_id, user_id=current_user.id, role=current_user.role
+    )
+    if version is None:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+    if not allowed:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    etag = weak_etag(conversation_id, *version)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    
+    # Permission check joined in; messages loaded up front for the response
+    conversation, allowed = await get_conversation_for_user(
+        db, conversation_id=conversation_id, user_id=current_user.id, role=current_user.role
+    )
+    if not conversation:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+    if not allowed:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    # Hundreds of messages: validated once and serialized in pydantic-core
+    return schema_response(ConversationSchema, conversation, response=response)
+
+async def _get_own_conversation(db: AsyncSession, conversation_id: UUID, current_user: Principal):
+    conversation = await get_conversation(db, conversation_id=conversation_id)
+    if not conversation:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+    if conversation.candidate_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return conversation
+
+@async_router.post("/{conversation_id}/messages", response_model=ConversationMessage)
+async def add_message_to_conversation(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    conversation_id: UUID,
+    message_in: MessageCreate,
+    current_user: Principal = Depends(deps.get_current_candidate),
+) -> Any:
+    """
+    Add message to conversation
+    """
+    await _get_own_conversation(db, conversation_id, current_user)
+    return await add_message(db, conversation_id=conversation_id, message_create=message_in)
+
+@async_router.post("/{conversation_id}/messages/batch", response_model=List[ConversationMessage])
+async def add_messages_to_conversation(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    conversation_id: UUID,
+    messages_in: List[MessageCreate],
+    current_user: Principal = Depends(deps.get_current_candidate),
+) -> Any:
+    """
+    Add several messages to conversation, in order, with one insert
+    """
+    conversations.check_message_batch(messages_in)
+    await _get_own_conversation(db, conversation_id, current_user)
+    return await add_messages(db, conversation_id=conversation_id, messages_create=messages_in)
+
+@async_router.post("/{conversation_id}/end")
+async def end_conversation_session(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    conversation_id: UUID,
+    current_user: Principal = Depends(deps.get_current_candidate),
+) -> Any:
+    """
+    End conversation and generate final analysis
+    """
+    await _get_own_conversation(db, conversation_id, current_user)
+    conversation = await end_conversation(db, conversation_id=conversation_id)
+    return {"message": "Conversation ended", "conversation": ConversationSchema.model_validate(conversation)}
+
+router = overlay(conversations.router, async_router)
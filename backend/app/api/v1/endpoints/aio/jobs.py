@@ -0,0 +1,160 @@
+from typing import Any, List, Optional, Union
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from app.api import deps
+from app.api.v1.endpoints import jobs
+from app.api.v1.endpoints.aio import overlay
+from app.core.database import get_async_db
+from app.core.etag import etag_matches, not_modified, set_etag
+from app.core.responses import json_response, schema_response
+from app.schemas.auth import Principal
+from app.schemas.job import JobPosting as JobSchema, JobPostingCreate, JobPostingUpdate, JobPostingPublic, JobSearchResult
+from app.schemas.pagination import Page
+from app.services.jobs import JOB_ORDER
+from app.services.aio.jobs import (
+    create_job, update_job, get_job, get_jobs, delete_job, get_active_jobs_page, get_jobs_by_recruiter, get_public_job,
+    search_jobs,
+)
+
+async_router = APIRouter()
+
+@async_router.get("/", response_model=Union[List[JobPostingPublic], Page[JobPostingPublic]])
+async def read_jobs(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    skip: int = 0,
+    limit: int = 100,
+    active_only: bool = Query(True, description="Only return active jobs"),
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor (empty for the first page); returns a page envelope"),
+) -> Any:
+    """
+    Retrieve jobs, newest first (public endpoint for candidates)
+    """
+    try:
+        if active_only:
+            # Cached payload, already shaped as the response, with its ETag
+            cached = await get_active_jobs_page(db, skip=skip, limit=limit, cursor=cursor)
+            if etag_matches(request.headers.get("if-none-match"), cached["etag"]):
+                return not_modified(cached["etag"], private=False)
+            set_etag(response, cached["etag"], private=False)
+            return json_response(cached["payload"], response=response)
+        jobs = await get_jobs(db, skip=skip, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if cursor is None:
+        return schema_response(List[JobPostingPublic], jobs)
+    return schema_response(Page[JobPostingPublic], {"items": jobs, "next_cursor": JOB_ORDER.next_cursor(jobs, limit)})
+
+@async_router.get("/my-jobs", response_model=Union[List[JobSchema], Page[JobSchema]])
+async def read_my_jobs(
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: Principal = Depends(deps.get_current_recruiter),
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor (empty for the first page); returns a page envelope"),
+) -> Any:
+    """
+    Retrieve jobs created by current recruiter, newest first
+    """
+    try:
+        jobs = await get_jobs_by_recruiter(db, recruiter_id=current_user.id, skip=skip, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if cursor is None:
+        return schema_response(List[JobSchema], jobs)
+    return schema_response(Page[JobSchema], {"items": jobs, "next_cursor": JOB_ORDER.next_cursor(jobs, limit)})
+
+@async_router.get("/search", response_model=JobSearchResult)
+async def search_job_postings(
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    q: Optional[str] = Query(None, description="Keywords, web search syntax (\"quoted phrase\", or, -excluded)"),
+    location: Optional[List[str]] = Query(None, description="Any of these locations"),
+    employment_type: Optional[List[str]] = Query(None, description="Any of these employment types"),
+    salary_min: Optional[int] = Query(None, description="Salary range overlaps [salary_min, salary_max]"),
+    salary_max: Optional[int] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+) -> Any:
+    """
+    Full-text search over active jobs, best match first, with facet counts (public endpoint)
+    """
+    result = await search_jobs(
+        db, q=(q or "").strip() or None, location=location, employment_type=employment_type,
+        salary_min=salary_min, salary_max=salary_max, skip=skip, limit=limit,
+    )
+    return json_response(result)
+
+@async_router.post("/", response_model=JobSchema)
+async def create_job_posting(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    job_in: JobPostingCreate,
+    current_user: Principal = Depends(deps.get_current_recruiter),
+) -> Any:
+    """
+    Create new job posting
+    """
+    return await create_job(db, job_create=job_in, recruiter_id=current_user.id)
+
+@async_router.get("/{job_id}", response_model=JobPostingPublic)
+async def read_job(
+    *,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    job_id: UUID,
+) -> Any:
+    """
+    Get job by ID (public endpoint)
+    """
+    cached = await get_public_job(db, job_id=job_id)
+    if not cached:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if etag_matches(request.headers.get("if-none-match"), cached["etag"]):
+        return not_modified(cached["etag"], private=False)
+    set_etag(response, cached["etag"], private=False)
+    return json_response(cached["payload"], response=response)
+
+@async_router.put("/{job_id}", response_model=JobSchema)
+async def update_job_posting(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    job_id: UUID,
+    job_in: JobPostingUpdate,
+    background_tasks: BackgroundTasks,
+    current_user: Principal = Depends(deps.get_current_recruiter),
+) -> Any:
+    """
+    Update job posting; candidates are rescored after the response when weights or cutoff change
+    """
+    job = await get_job(db, job_id=job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.recruiter_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    return await update_job(db, job=job, job_update=job_in, background_tasks=background_tasks)
+
+@async_router.delete("/{job_id}")
+async def delete_job_posting(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    job_id: UUID,
+    current_user: Principal = Depends(deps.get_current_recruiter),
+) -> Any:
+    """
+    Delete job posting
+    """
+    job = await get_job(db, job_id=job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.recruiter_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    await delete_job(db, job_id=job_id)
+    return {"message": "Job deleted successfully"}
+
+router = overlay(jobs.router, async_router)
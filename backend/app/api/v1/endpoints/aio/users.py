@@ -0,0 +1,36 @@
+from typing import Any
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
+from app.api.v1.endpoints import users
+from app.api.v1.endpoints.aio import overlay
+from app.core.database import get_async_db
+from app.models.user import User
+from app.schemas.user import User as UserSchema, UserUpdate
+from app.services.aio.users import update_user
+
+async_router = APIRouter()
+
+@async_router.get("/me", response_model=UserSchema)
+async def read_user_me(
+    current_user: User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """
+    Get current user.
+    """
+    return current_user
+
+@async_router.put("/me", response_model=UserSchema)
+async def update_user_me(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    user_in: UserUpdate,
+    current_user: User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """
+    Update own user.
+    """
+    return await update_user(db, user=current_user, user_update=user_in)
+
+router = overlay(users.router, async_router)
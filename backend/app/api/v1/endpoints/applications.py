@@ -1,13 +1,15 @@
-from typing import Any, List
+from typing import Any, List, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.api import deps
 from app.core.database import get_db
-from app.models.user import User
+from app.core.responses import schema_response
+from app.schemas.auth import Principal
 from app.schemas.application import JobApplication as ApplicationSchema, JobApplicationCreate, JobApplicationUpdate
-from app.services.applications import create_application, get_application, get_applications_by_user, get_applications_by_job, update_application
+from app.schemas.pagination import Page
+from app.services.applications import APPLICATION_ORDER, create_application, get_application_for_user, get_applications_by_user, get_applications_by_job, update_application
 
 router = APIRouter()
 
@@ -16,7 +18,7 @@ def create_job_application(
     *,
     db: Session = Depends(get_db),
     application_in: JobApplicationCreate,
-    current_user: User = Depends(deps.get_current_candidate),
+    current_user: Principal = Depends(deps.get_current_candidate),
 ) -> Any:
     """
     Create new job application
@@ -28,68 +30,79 @@ def create_job_application(
     )
     return application
 
-@router.get("/my-applications", response_model=List[ApplicationSchema])
+@router.get("/my-applications", response_model=Union[List[ApplicationSchema], Page[ApplicationSchema]])
 def read_my_applications(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(deps.get_current_candidate),
+    db: Session = Depends(deps.get_read_db),
+    current_user: Principal = Depends(deps.get_current_candidate),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor (empty for the first page); returns a page envelope"),
 ) -> Any:
     """
-    Retrieve applications by current candidate
+    Retrieve applications by current candidate, most recent first
     """
-    applications = get_applications_by_user(
-        db=db, 
-        user_id=current_user.id, 
-        skip=skip, 
-        limit=limit
-    )
-    return applications
+    try:
+        applications = get_applications_by_user(
+            db=db, 
+            user_id=current_user.id, 
+            skip=skip, 
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if cursor is None:
+        return schema_response(List[ApplicationSchema], applications)
+    return schema_response(Page[ApplicationSchema], {"items": applications, "next_cursor": APPLICATION_ORDER.next_cursor(applications, limit)})
 
-@router.get("/job/{job_id}", response_model=List[ApplicationSchema])
+@router.get("/job/{job_id}", response_model=Union[List[ApplicationSchema], Page[ApplicationSchema]])
 def read_applications_by_job(
     *,
-    db: Session = Depends(get_db),
+    db: Session = Depends(deps.get_read_db),
     job_id: UUID,
-    current_user: User = Depends(deps.get_current_recruiter),
+    current_user: Principal = Depends(deps.get_current_recruiter),
     skip: int = 0,
     limit: int = 100,
     status: str = Query(None, description="Filter by status"),
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor (empty for the first page); returns a page envelope"),
 ) -> Any:
     """
-    Retrieve applications for a specific job (recruiter only)
+    Retrieve applications for a specific job, most recent first (recruiter only)
     """
-    applications = get_applications_by_job(
-        db=db, 
-        job_id=job_id, 
-        recruiter_id=current_user.id,
-        skip=skip, 
-        limit=limit,
-        status=status
-    )
-    return applications
+    try:
+        applications = get_applications_by_job(
+            db=db, 
+            job_id=job_id, 
+            recruiter_id=current_user.id,
+            skip=skip, 
+            limit=limit,
+            status=status,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if cursor is None:
+        return schema_response(List[ApplicationSchema], applications)
+    return schema_response(Page[ApplicationSchema], {"items": applications, "next_cursor": APPLICATION_ORDER.next_cursor(applications, limit)})
 
 @router.get("/{application_id}", response_model=ApplicationSchema)
 def read_application(
     *,
-    db: Session = Depends(get_db),
+    db: Session = Depends(deps.get_read_db),
     application_id: UUID,
-    current_user: User = Depends(deps.get_current_user),
+    current_user: Principal = Depends(deps.get_current_principal),
 ) -> Any:
     """
     Get application by ID
     """
-    application = get_application(db=db, application_id=application_id)
+    # Fetched together with the permission check
+    application, allowed = get_application_for_user(
+        db, application_id=application_id, user_id=current_user.id, role=current_user.role
+    )
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
-    
-    # Check permissions
-    if current_user.role == "candidate":
-        if application.candidate_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not enough permissions")
-    elif current_user.role == "recruiter":
-        if application.job.recruiter_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not enough permissions")
+    if not allowed:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
     
     return application
 
@@ -99,16 +112,17 @@ def update_job_application(
     db: Session = Depends(get_db),
     application_id: UUID,
     application_in: JobApplicationUpdate,
-    current_user: User = Depends(deps.get_current_recruiter),
+    current_user: Principal = Depends(deps.get_current_recruiter),
 ) -> Any:
     """
     Update job application (recruiter only)
     """
-    application = get_application(db=db, application_id=application_id)
+    application, allowed = get_application_for_user(
+        db, application_id=application_id, user_id=current_user.id, role="recruiter"
+    )
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
-    
-    if application.job.recruiter_id != current_user.id:
+    if not allowed:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
     application = update_application(
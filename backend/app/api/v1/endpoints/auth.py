@@ -1,8 +1,10 @@
+import math
 from datetime import timedelta
 from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.api import deps
 from app.core import security
@@ -11,20 +13,32 @@ from app.core.database import get_db
 from app.models.user import User
 from app.schemas.auth import Token, LoginRequest, GoogleAuthRequest, RefreshTokenRequest
 from app.schemas.user import UserCreate, User as UserSchema
-from app.services.auth import authenticate_user, create_user, verify_google_token
+from app.services.auth import authenticate_user, create_user, get_or_create_google_user, verify_google_token
+from app.services.login_throttle import check_login_allowed, record_login_failure, record_login_success
 
 router = APIRouter()
 
 @router.post("/login", response_model=Token)
 def login_access_token(
-    db: Session = Depends(get_db), 
-    form_data: LoginRequest
+    request: Request,
+    form_data: LoginRequest,
+    db: Session = Depends(get_db),
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests
     """
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = check_login_allowed(email=form_data.email, client_ip=client_ip)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, please try again later",
+            headers={"Retry-After": str(max(math.ceil(retry_after), 1))},
+        )
+    
     user = authenticate_user(db, email=form_data.email, password=form_data.password)
     if not user:
+        record_login_failure(email=form_data.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -36,11 +50,16 @@ def login_access_token(
             detail="Inactive user"
         )
     
+    record_login_success(email=form_data.email)
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = security.create_access_token(
-        user.id, expires_delta=access_token_expires
+        user.id,
+        expires_delta=access_token_expires,
+        role=user.role,
+        is_active=user.is_active,
+        token_version=user.token_version,
     )
-    refresh_token = security.create_refresh_token(user.id)
+    refresh_token = security.create_refresh_token(user.id, token_version=user.token_version)
     
     return {
         "access_token": access_token,
@@ -77,29 +96,20 @@ async def google_auth(
     """
     try:
         google_user_info = await verify_google_token(google_auth.token)
-        
-        # Check if user exists
-        user = db.query(User).filter(User.email == google_user_info["email"]).first()
-        
-        if not user:
-            # Create new user
-            user_create = UserCreate(
-                email=google_user_info["email"],
-                name=google_user_info["name"],
-                role=google_auth.role,
-                password="google_oauth"  # Placeholder, won't be used
-            )
-            user = create_user(db, user_create=user_create)
-            user.google_id = google_user_info["sub"]
-            user.avatar_url = google_user_info.get("picture")
-            user.is_verified = True
-            db.commit()
+        # Lookup, password hashing and commit all block; keep them off the event loop
+        user = await run_in_threadpool(
+            get_or_create_google_user, db, user_info=google_user_info, role=google_auth.role
+        )
         
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = security.create_access_token(
-            user.id, expires_delta=access_token_expires
+            user.id,
+            expires_delta=access_token_expires,
+            role=user.role,
+            is_active=user.is_active,
+            token_version=user.token_version,
         )
-        refresh_token = security.create_refresh_token(user.id)
+        refresh_token = security.create_refresh_token(user.id, token_version=user.token_version)
         
         return {
             "access_token": access_token,
@@ -107,6 +117,8 @@ async def google_auth(
             "token_type": "bearer",
         }
         
+    except security.PasswordHashingBusy:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -123,7 +135,8 @@ def refresh_token(
     Refresh access token
     """
     try:
-        user_id = security.verify_token(refresh_request.refresh_token)
+        payload = security.decode_token(refresh_request.refresh_token)
+        user_id = payload.get("sub") if payload else None
         if not user_id:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -136,12 +149,21 @@ def refresh_token(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid user",
             )
+        if payload.get("ver", user.token_version) < user.token_version:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token",
+            )
         
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = security.create_access_token(
-            user.id, expires_delta=access_token_expires
+            user.id,
+            expires_delta=access_token_expires,
+            role=user.role,
+            is_active=user.is_active,
+            token_version=user.token_version,
         )
-        new_refresh_token = security.create_refresh_token(user.id)
+        new_refresh_token = security.create_refresh_token(user.id, token_version=user.token_version)
         
         return {
             "access_token": access_token,
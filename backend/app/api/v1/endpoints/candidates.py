@@ -1,14 +1,26 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
+import json
+from typing import Any, AsyncIterator, List, Optional, Tuple, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from uuid import UUID
 
 from app.api import deps
+from app.core.config import settings
 from app.core.database import get_db
-from app.models.user import User
+from app.core.etag import etag_matches, not_modified, set_etag, weak_etag
+from app.core.responses import schema_response
+from app.schemas.auth import Principal
 from app.models.candidate import Candidate
-from app.schemas.candidate import Candidate as CandidateSchema, CandidateCreate, CandidateUpdate
-from app.services.candidates import create_candidate, update_candidate, get_candidate, get_candidates_by_job, select_candidate, reject_candidate
+from app.schemas.candidate import (
+    BulkCandidateResult, BulkDecision, BulkDecisionResult, Candidate as CandidateSchema, CandidateCreate, CandidateRank, CandidateRanking,
+    CandidateUpdate,
+)
+from app.schemas.pagination import Page
+from app.services.candidates import (
+    CANDIDATE_ORDER, bulk_create_candidates, create_candidate, decide_candidates, update_candidate, get_candidate, get_candidate_for_user,
+    get_candidate_rank, get_candidate_ranking, get_candidates_by_job, get_candidates_version, select_candidate, reject_candidate,
+)
 
 router = APIRouter()
 
@@ -17,68 +29,201 @@ def create_candidate_application(
     *,
     db: Session = Depends(get_db),
     candidate_in: CandidateCreate,
-    current_user: User = Depends(deps.get_current_candidate),
+    current_user: Principal = Depends(deps.get_current_candidate),
 ) -> Any:
     """
     Create new candidate application
     """
-    candidate = create_candidate(
-        db=db, 
-        candidate_create=candidate_in, 
-        user_id=current_user.id
-    )
+    try:
+        candidate = create_candidate(
+            db=db, 
+            candidate_create=candidate_in, 
+            user_id=current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     return candidate
 
-@router.get("/job/{job_id}", response_model=List[CandidateSchema])
-def read_candidates_by_job(
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+async def bulk_chunks(request: Request, size: int) -> AsyncIterator[List[Tuple[int, Any]]]:
+    """
+    (index, row) chunks from a JSON array body, or from an NDJSON body read as
+    a stream; NDJSON lines are passed on undecoded and parsed during validation.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_CONTENT_TYPES:
+        chunk, line_number, pending = [], 0, b""
+        async for data in request.stream():
+            *lines, pending = (pending + data).split(b"\n")
+            for line in lines:
+                if line.strip():
+                    chunk.append((line_number, line))
+                line_number += 1
+                if len(chunk) >= size:
+                    yield chunk
+                    chunk = []
+        if pending.strip():
+            chunk.append((line_number, pending))
+        if chunk:
+            yield chunk
+        return
+
+    try:
+        rows = json.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    if not isinstance(rows, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    for start in range(0, len(rows), size):
+        yield list(enumerate(rows[start:start + size], start))
+
+@router.post("/bulk", response_model=BulkCandidateResult)
+async def bulk_create_candidate_applications(
     *,
+    request: Request,
     db: Session = Depends(get_db),
+    current_user: Principal = Depends(deps.get_current_recruiter),
+) -> Any:
+    """
+    Import scored candidates for the recruiter's jobs from a JSON array or an
+    NDJSON stream (Content-Type: application/x-ndjson). Rows are validated and
+    inserted in chunks; invalid rows are reported without failing the rest.
+    """
+    result = BulkCandidateResult(inserted=0, failed=0, errors=[])
+    async for chunk in bulk_chunks(request, settings.CANDIDATE_BULK_CHUNK_SIZE):
+        inserted, errors = await run_in_threadpool(
+            bulk_create_candidates, db, rows=chunk, recruiter_id=current_user.id
+        )
+        result.inserted += inserted
+        result.errors += sorted(errors, key=lambda error: error.index)
+    result.failed = len(result.errors)
+    return result
+
+@router.get("/job/{job_id}", response_model=Union[List[CandidateSchema], Page[CandidateSchema]])
+def read_candidates_by_job(
+    *,
+    db: Session = Depends(deps.get_read_db),
+    request: Request,
+    response: Response,
     job_id: UUID,
-    current_user: User = Depends(deps.get_current_recruiter),
+    current_user: Principal = Depends(deps.get_current_recruiter),
     skip: int = 0,
     limit: int = 100,
     status: str = Query(None, description="Filter by status"),
     min_score: float = Query(0, description="Minimum overall score"),
+    min_weighted_score: float = Query(0, description="Minimum score weighted by the job's skill weights"),
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor (empty for the first page); returns a page envelope"),
+) -> Any:
+    """
+    Retrieve candidates for a specific job, best weighted score first (recruiter only)
+    """
+    # Version probe first: an unchanged list is answered without loading it
+    version = get_candidates_version(db, job_id=job_id, recruiter_id=current_user.id)
+    etag = weak_etag(version, skip, limit, status, min_score, min_weighted_score, cursor)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    try:
+        candidates = get_candidates_by_job(
+            db=db, 
+            job_id=job_id, 
+            recruiter_id=current_user.id,
+            skip=skip, 
+            limit=limit,
+            status=status,
+            min_score=min_score,
+            min_weighted_score=min_weighted_score,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Validated once and serialized in pydantic-core, see app.core.responses
+    if cursor is None:
+        return schema_response(List[CandidateSchema], candidates, response=response)
+    page = {"items": candidates, "next_cursor": CANDIDATE_ORDER.next_cursor(candidates, limit)}
+    return schema_response(Page[CandidateSchema], page, response=response)
+
+@router.get("/job/{job_id}/ranking", response_model=CandidateRanking)
+def read_candidate_ranking(
+    *,
+    # The primary: rebuilding the rank index must see every committed candidate
+    db: Session = Depends(get_db),
+    job_id: UUID,
+    current_user: Principal = Depends(deps.get_current_recruiter),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+) -> Any:
+    """
+    Candidates for a job with their ranks, best weighted score first (recruiter only)
+    """
+    ranking = get_candidate_ranking(db, job_id=job_id, recruiter_id=current_user.id, skip=skip, limit=limit)
+    if ranking is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return schema_response(CandidateRanking, ranking)
+
+@router.post("/job/{job_id}/decisions", response_model=BulkDecisionResult)
+def decide_candidates_for_job(
+    *,
+    db: Session = Depends(get_db),
+    job_id: UUID,
+    decision_in: BulkDecision,
+    current_user: Principal = Depends(deps.get_current_recruiter),
 ) -> Any:
     """
-    Retrieve candidates for a specific job (recruiter only)
+    Select, reject or waitlist many candidates of a job at once
     """
-    candidates = get_candidates_by_job(
-        db=db, 
-        job_id=job_id, 
-        recruiter_id=current_user.id,
-        skip=skip, 
-        limit=limit,
-        status=status,
-        min_score=min_score
-    )
-    return candidates
+    try:
+        candidate_ids = decide_candidates(db, job_id=job_id, recruiter_id=current_user.id, decision=decision_in)
+    except ValueError as e:
+        raise HTTPException(status_code=404 if str(e) == "Job not found" else 400, detail=str(e))
+    return BulkDecisionResult(updated=len(candidate_ids), candidate_ids=candidate_ids)
+
+def candidate_etag(candidate: Candidate) -> str:
+    # updated_at is NULL for rows not written since it was added; any update sets it
+    return weak_etag(candidate.id, candidate.updated_at)
 
 @router.get("/{candidate_id}", response_model=CandidateSchema)
 def read_candidate(
     *,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
     candidate_id: UUID,
-    current_user: User = Depends(deps.get_current_user),
+    current_user: Principal = Depends(deps.get_current_principal),
 ) -> Any:
     """
     Get candidate by ID
     """
-    candidate = get_candidate(db=db, candidate_id=candidate_id)
+    # Fetched together with the permission check
+    candidate, allowed = get_candidate_for_user(db, candidate_id=candidate_id, user_id=current_user.id, role=current_user.role)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
+    if not allowed:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    # Check permissions
-    if current_user.role == "recruiter":
-        # Recruiter can only see candidates for their jobs
-        if candidate.job.recruiter_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not enough permissions")
-    elif current_user.role == "candidate":
-        # Candidate can only see their own application
-        if candidate.user_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not enough permissions")
-    
-    return candidate
+    etag = candidate_etag(candidate)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return schema_response(CandidateSchema, candidate, response=response)
+
+@router.get("/{candidate_id}/rank", response_model=CandidateRank)
+def read_candidate_rank(
+    *,
+    db: Session = Depends(get_db),
+    candidate_id: UUID,
+    current_user: Principal = Depends(deps.get_current_principal),
+) -> Any:
+    """
+    Candidate's rank and percentile by weighted score among the job's candidates
+    """
+    candidate, allowed = get_candidate_for_user(db, candidate_id=candidate_id, user_id=current_user.id, role=current_user.role)
+    if not candidate:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    if not allowed:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return schema_response(CandidateRank, get_candidate_rank(db, candidate=candidate))
 
 @router.put("/{candidate_id}", response_model=CandidateSchema)
 def update_candidate_application(
@@ -86,42 +231,44 @@ def update_candidate_application(
     db: Session = Depends(get_db),
     candidate_id: UUID,
     candidate_in: CandidateUpdate,
-    current_user: User = Depends(deps.get_current_user),
+    current_user: Principal = Depends(deps.get_current_principal),
 ) -> Any:
     """
     Update candidate application
     """
-    candidate = get_candidate(db=db, candidate_id=candidate_id)
+    candidate, allowed = get_candidate_for_user(db, candidate_id=candidate_id, user_id=current_user.id, role=current_user.role)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
-    
-    # Check permissions
-    if current_user.role == "recruiter":
-        if candidate.job.recruiter_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not enough permissions")
-    elif current_user.role == "candidate":
-        if candidate.user_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not enough permissions")
+    if not allowed:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
     
     candidate = update_candidate(db=db, candidate=candidate, candidate_update=candidate_in)
     return candidate
 
+def decision_error(e: ValueError) -> HTTPException:
+    if str(e) == "Candidate not found":
+        return HTTPException(status_code=404, detail=str(e))
+    return HTTPException(status_code=403, detail="Not enough permissions")
+
 @router.post("/{candidate_id}/select")
 def select_candidate_for_interview(
     *,
     db: Session = Depends(get_db),
     candidate_id: UUID,
-    current_user: User = Depends(deps.get_current_recruiter),
+    current_user: Principal = Depends(deps.get_current_recruiter),
 ) -> Any:
     """
     Select candidate for interview
     """
-    candidate = select_candidate(
-        db=db, 
-        candidate_id=candidate_id, 
-        recruiter_id=current_user.id
-    )
-    return {"message": "Candidate selected successfully", "candidate": candidate}
+    try:
+        candidate = select_candidate(
+            db=db, 
+            candidate_id=candidate_id, 
+            recruiter_id=current_user.id
+        )
+    except ValueError as e:
+        raise decision_error(e)
+    return {"message": "Candidate selected successfully", "candidate": CandidateSchema.model_validate(candidate)}
 
 @router.post("/{candidate_id}/reject")
 def reject_candidate_application(
@@ -129,18 +276,21 @@ def reject_candidate_application(
     db: Session = Depends(get_db),
     candidate_id: UUID,
     reason: str = None,
-    current_user: User = Depends(deps.get_current_recruiter),
+    current_user: Principal = Depends(deps.get_current_recruiter),
 ) -> Any:
     """
     Reject candidate application
     """
-    candidate = reject_candidate(
-        db=db, 
-        candidate_id=candidate_id, 
-        recruiter_id=current_user.id,
-        reason=reason
-    )
-    return {"message": "Candidate rejected", "candidate": candidate}
+    try:
+        candidate = reject_candidate(
+            db=db, 
+            candidate_id=candidate_id, 
+            recruiter_id=current_user.id,
+            reason=reason
+        )
+    except ValueError as e:
+        raise decision_error(e)
+    return {"message": "Candidate rejected", "candidate": CandidateSchema.model_validate(candidate)}
 
 @router.post("/{candidate_id}/upload-cv")
 def upload_cv(
@@ -148,7 +298,7 @@ def upload_cv(
     db: Session = Depends(get_db),
     candidate_id: UUID,
     file: UploadFile = File(...),
-    current_user: User = Depends(deps.get_current_candidate),
+    current_user: Principal = Depends(deps.get_current_candidate),
 ) -> Any:
     """
     Upload CV file for candidate
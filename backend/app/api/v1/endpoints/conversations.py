@@ -1,13 +1,16 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, UploadFile, File
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.api import deps
+from app.core.config import settings
 from app.core.database import get_db
-from app.models.user import User
+from app.core.etag import etag_matches, not_modified, set_etag, weak_etag
+from app.core.responses import schema_response
+from app.schemas.auth import Principal
 from app.schemas.conversation import Conversation as ConversationSchema, ConversationCreate, MessageCreate, ConversationMessage
-from app.services.conversations import create_conversation, add_message, get_conversation, end_conversation, process_audio_message
+from app.services.conversations import create_conversation, add_message, add_messages, get_conversation, get_conversation_for_user, get_conversation_version, end_conversation, process_audio_message
 
 router = APIRouter()
 
@@ -16,7 +19,7 @@ def create_conversation_session(
     *,
     db: Session = Depends(get_db),
     conversation_in: ConversationCreate,
-    current_user: User = Depends(deps.get_current_candidate),
+    current_user: Principal = Depends(deps.get_current_candidate),
 ) -> Any:
     """
     Create new conversation session
@@ -31,26 +34,39 @@ def create_conversation_session(
 @router.get("/{conversation_id}", response_model=ConversationSchema)
 def read_conversation(
     *,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
     conversation_id: UUID,
-    current_user: User = Depends(deps.get_current_user),
+    current_user: Principal = Depends(deps.get_current_principal),
 ) -> Any:
     """
     Get conversation by ID
     """
-    conversation = get_conversation(db=db, conversation_id=conversation_id)
-    if not conversation:
+    # Version probe first: an unchanged conversation is answered without loading its transcript
+    version, allowed = get_conversation_version(
+        db, conversation_id=conversation_id, user_id=current_user.id, role=current_user.role
+    )
+    if version is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
+    if not allowed:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    etag = weak_etag(conversation_id, *version)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    set_etag(response, etag)
     
-    # Check permissions
-    if current_user.role == "candidate":
-        if conversation.candidate_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not enough permissions")
-    elif current_user.role == "recruiter":
-        if conversation.job.recruiter_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not enough permissions")
+    # Permission check joined in; messages loaded up front for the response
+    conversation, allowed = get_conversation_for_user(
+        db, conversation_id=conversation_id, user_id=current_user.id, role=current_user.role
+    )
+    if not conversation:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+    if not allowed:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    return conversation
+    # Hundreds of messages: validated once and serialized in pydantic-core
+    return schema_response(ConversationSchema, conversation, response=response)
 
 @router.post("/{conversation_id}/messages", response_model=ConversationMessage)
 def add_message_to_conversation(
@@ -58,7 +74,7 @@ def add_message_to_conversation(
     db: Session = Depends(get_db),
     conversation_id: UUID,
     message_in: MessageCreate,
-    current_user: User = Depends(deps.get_current_candidate),
+    current_user: Principal = Depends(deps.get_current_candidate),
 ) -> Any:
     """
     Add message to conversation
@@ -77,13 +93,42 @@ def add_message_to_conversation(
     )
     return message
 
+def check_message_batch(messages_in: List[MessageCreate]) -> None:
+    if not messages_in:
+        raise HTTPException(status_code=400, detail="No messages to add")
+    if len(messages_in) > settings.CONVERSATION_MESSAGE_BATCH_MAX:
+        raise HTTPException(
+            status_code=400, detail=f"At most {settings.CONVERSATION_MESSAGE_BATCH_MAX} messages per batch"
+        )
+
+@router.post("/{conversation_id}/messages/batch", response_model=List[ConversationMessage])
+def add_messages_to_conversation(
+    *,
+    db: Session = Depends(get_db),
+    conversation_id: UUID,
+    messages_in: List[MessageCreate],
+    current_user: Principal = Depends(deps.get_current_candidate),
+) -> Any:
+    """
+    Add several messages to conversation, in order, with one insert
+    """
+    check_message_batch(messages_in)
+    conversation = get_conversation(db=db, conversation_id=conversation_id)
+    if not conversation:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+    
+    if conversation.candidate_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    return add_messages(db=db, conversation_id=conversation_id, messages_create=messages_in)
+
 @router.post("/{conversation_id}/audio", response_model=ConversationMessage)
 def upload_audio_message(
     *,
     db: Session = Depends(get_db),
     conversation_id: UUID,
     audio_file: UploadFile = File(...),
-    current_user: User = Depends(deps.get_current_candidate),
+    current_user: Principal = Depends(deps.get_current_candidate),
 ) -> Any:
     """
     Upload audio message and convert to text
@@ -107,7 +152,7 @@ def end_conversation_session(
     *,
     db: Session = Depends(get_db),
     conversation_id: UUID,
-    current_user: User = Depends(deps.get_current_candidate),
+    current_user: Principal = Depends(deps.get_current_candidate),
 ) -> Any:
     """
     End conversation and generate final analysis
@@ -120,4 +165,4 @@ def end_conversation_session(
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
     conversation = end_conversation(db=db, conversation_id=conversation_id)
-    return {"message": "Conversation ended", "conversation": conversation}
\ No newline at end of file
+    return {"message": "Conversation ended", "conversation": ConversationSchema.model_validate(conversation)}
\ No newline at end of file
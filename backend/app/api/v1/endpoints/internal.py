@@ -0,0 +1,38 @@
+from typing import Any
+from fastapi import APIRouter, Depends
+
+from app.api import deps
+from app.core import replicas, revocation, security
+from app.core.database import async_engine, async_read_replicas, engine, read_replicas
+from app.core.db_pool import pool_stats
+from app.core.jwks import google_jwks
+from app.services import candidate_ranks, job_cache, job_counters, job_descriptions, login_throttle, message_buffer, message_partitions, rescoring, user_cache
+
+router = APIRouter(dependencies=[Depends(deps.verify_internal_token)])
+
+@router.get("/stats")
+def read_internal_stats() -> Any:
+    """
+    Process-local cache and worker pool counters
+    """
+    return {
+        "user_cache": user_cache.stats(),
+        "job_cache": job_cache.stats(),
+        "job_descriptions": job_descriptions.stats(),
+        "password_pool": security.password_pool_stats(),
+        "token_revocations": revocation.stats(),
+        "login_throttle": login_throttle.stats(),
+        "google_jwks": google_jwks.stats(),
+        "database_pool": {
+            "sync": pool_stats(engine),
+            "async": pool_stats(async_engine.sync_engine),
+            "replicas": [pool_stats(replica) for replica in read_replicas.engines],
+            "async_replicas": [pool_stats(replica.sync_engine) for replica in async_read_replicas.engines],
+        },
+        "read_routing": replicas.stats(),
+        "job_counters": job_counters.stats(),
+        "candidate_ranks": candidate_ranks.stats(),
+        "message_buffer": message_buffer.stats(),
+        "message_partitions": message_partitions.stats(),
+        "rescoring": rescoring.stats(),
+    }
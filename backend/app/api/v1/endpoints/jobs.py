@@ -1,54 +1,96 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Any, List, Optional, Union
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.api import deps
 from app.core.database import get_db
-from app.models.user import User
-from app.models.job import JobPosting
-from app.schemas.job import JobPosting as JobSchema, JobPostingCreate, JobPostingUpdate, JobPostingPublic
-from app.services.jobs import create_job, update_job, get_job, get_jobs, delete_job, get_active_jobs, generate_job_description
+from app.core.etag import etag_matches, not_modified, set_etag
+from app.core.responses import json_response, schema_response
+from app.schemas.auth import Principal
+from app.schemas.job import JobPosting as JobSchema, JobPostingCreate, JobPostingUpdate, JobPostingPublic, JobSearchResult
+from app.schemas.pagination import Page
+from app.services.jobs import (
+    JOB_ORDER, create_job, update_job, get_job, get_jobs, delete_job, get_active_jobs_page, get_jobs_by_recruiter,
+    get_public_job, search_jobs,
+)
+from app.services.job_descriptions import generate_job_description
 
 router = APIRouter()
 
-@router.get("/", response_model=List[JobPostingPublic])
+@router.get("/", response_model=Union[List[JobPostingPublic], Page[JobPostingPublic]])
 def read_jobs(
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
     skip: int = 0,
     limit: int = 100,
     active_only: bool = Query(True, description="Only return active jobs"),
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor (empty for the first page); returns a page envelope"),
 ) -> Any:
     """
-    Retrieve jobs (public endpoint for candidates)
-    """
-    if active_only:
-        jobs = get_active_jobs(db, skip=skip, limit=limit)
-    else:
-        jobs = get_jobs(db, skip=skip, limit=limit)
-    return jobs
+    Retrieve jobs, newest first (public endpoint for candidates)
+    """
+    try:
+        if active_only:
+            # Cached payload, already shaped as the response, with its ETag
+            cached = get_active_jobs_page(db, skip=skip, limit=limit, cursor=cursor)
+            if etag_matches(request.headers.get("if-none-match"), cached["etag"]):
+                return not_modified(cached["etag"], private=False)
+            set_etag(response, cached["etag"], private=False)
+            return json_response(cached["payload"], response=response)
+        jobs = get_jobs(db, skip=skip, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if cursor is None:
+        return schema_response(List[JobPostingPublic], jobs)
+    return schema_response(Page[JobPostingPublic], {"items": jobs, "next_cursor": JOB_ORDER.next_cursor(jobs, limit)})
 
-@router.get("/my-jobs", response_model=List[JobSchema])
+@router.get("/my-jobs", response_model=Union[List[JobSchema], Page[JobSchema]])
 def read_my_jobs(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(deps.get_current_recruiter),
+    db: Session = Depends(deps.get_read_db),
+    current_user: Principal = Depends(deps.get_current_recruiter),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor (empty for the first page); returns a page envelope"),
+) -> Any:
+    """
+    Retrieve jobs created by current recruiter, newest first
+    """
+    try:
+        jobs = get_jobs_by_recruiter(db, recruiter_id=current_user.id, skip=skip, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if cursor is None:
+        return schema_response(List[JobSchema], jobs)
+    return schema_response(Page[JobSchema], {"items": jobs, "next_cursor": JOB_ORDER.next_cursor(jobs, limit)})
+
+@router.get("/search", response_model=JobSearchResult)
+def search_job_postings(
+    db: Session = Depends(deps.get_read_db),
+    q: Optional[str] = Query(None, description="Keywords, web search syntax (\"quoted phrase\", or, -excluded)"),
+    location: Optional[List[str]] = Query(None, description="Any of these locations"),
+    employment_type: Optional[List[str]] = Query(None, description="Any of these employment types"),
+    salary_min: Optional[int] = Query(None, description="Salary range overlaps [salary_min, salary_max]"),
+    salary_max: Optional[int] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
 ) -> Any:
     """
-    Retrieve jobs created by current recruiter
+    Full-text search over active jobs, best match first, with facet counts (public endpoint)
     """
-    jobs = db.query(JobPosting).filter(
-        JobPosting.recruiter_id == current_user.id
-    ).offset(skip).limit(limit).all()
-    return jobs
+    result = search_jobs(
+        db, q=(q or "").strip() or None, location=location, employment_type=employment_type,
+        salary_min=salary_min, salary_max=salary_max, skip=skip, limit=limit,
+    )
+    return json_response(result)
 
 @router.post("/", response_model=JobSchema)
 def create_job_posting(
     *,
     db: Session = Depends(get_db),
     job_in: JobPostingCreate,
-    current_user: User = Depends(deps.get_current_recruiter),
+    current_user: Principal = Depends(deps.get_current_recruiter),
 ) -> Any:
     """
     Create new job posting
@@ -59,16 +101,21 @@ def create_job_posting(
 @router.get("/{job_id}", response_model=JobPostingPublic)
 def read_job(
     *,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
     job_id: UUID,
 ) -> Any:
     """
     Get job by ID (public endpoint)
     """
-    job = get_job(db=db, job_id=job_id)
-    if not job:
+    cached = get_public_job(db, job_id=job_id)
+    if not cached:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    if etag_matches(request.headers.get("if-none-match"), cached["etag"]):
+        return not_modified(cached["etag"], private=False)
+    set_etag(response, cached["etag"], private=False)
+    return json_response(cached["payload"], response=response)
 
 @router.put("/{job_id}", response_model=JobSchema)
 def update_job_posting(
@@ -76,10 +123,11 @@ def update_job_posting(
     db: Session = Depends(get_db),
     job_id: UUID,
     job_in: JobPostingUpdate,
-    current_user: User = Depends(deps.get_current_recruiter),
+    background_tasks: BackgroundTasks,
+    current_user: Principal = Depends(deps.get_current_recruiter),
 ) -> Any:
     """
-    Update job posting
+    Update job posting; candidates are rescored after the response when weights or cutoff change
     """
     job = get_job(db=db, job_id=job_id)
     if not job:
@@ -87,7 +135,7 @@ def update_job_posting(
     if job.recruiter_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    job = update_job(db=db, job=job, job_update=job_in)
+    job = update_job(db=db, job=job, job_update=job_in, background_tasks=background_tasks)
     return job
 
 @router.delete("/{job_id}")
@@ -95,7 +143,7 @@ def delete_job_posting(
     *,
     db: Session = Depends(get_db),
     job_id: UUID,
-    current_user: User = Depends(deps.get_current_recruiter),
+    current_user: Principal = Depends(deps.get_current_recruiter),
 ) -> Any:
     """
     Delete job posting
@@ -110,24 +158,23 @@ def delete_job_posting(
     return {"message": "Job deleted successfully"}
 
 @router.post("/generate-description")
-def generate_description(
+async def generate_description(
     *,
-    db: Session = Depends(get_db),
     title: str,
     requirements: List[str] = [],
-    current_user: User = Depends(deps.get_current_recruiter),
+    current_user: Principal = Depends(deps.get_current_recruiter),
 ) -> Any:
     """
-    Generate AI-powered job description
+    Generate AI-powered job description (cached by title and requirements)
     """
-    description = generate_job_description(title=title, requirements=requirements)
+    description = await generate_job_description(title=title, requirements=requirements)
     return {"description": description}
 
 @router.get("/{job_id}/share-link")
 def get_share_link(
     *,
     job_id: UUID,
-    current_user: User = Depends(deps.get_current_recruiter),
+    current_user: Principal = Depends(deps.get_current_recruiter),
 ) -> Any:
     """
     Get shareable link for job posting
@@ -35,7 +35,7 @@ def update_user_me(
 @router.get("/profile/{user_id}", response_model=UserProfile)
 def read_user_profile(
     *,
-    db: Session = Depends(get_db),
+    db: Session = Depends(deps.get_read_db),
     user_id: str,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
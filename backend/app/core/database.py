@@ -1,16 +1,103 @@
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, AsyncIterator, Iterator, Optional
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
+from app.core.db_pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument, pool_options
+from app.core.replicas import ReplicaSelector, has_recent_write, record_read
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _asyncpg_url(url: str) -> str:
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
 
-Base = declarative_base()
+def _create_engine(url: str):
+    engine = create_engine(url, poolclass=InstrumentedQueuePool, **pool_options())
+    instrument(engine)
+    return engine
+
+def _create_async_engine(url: str):
+    engine = create_async_engine(url, poolclass=InstrumentedAsyncQueuePool, **pool_options())
+    instrument(engine.sync_engine)
+    return engine
+
+engine = _create_engine(settings.DATABASE_URL)
+# Objects stay loaded after commit, so a write's response is served from what
+# the INSERT/UPDATE itself returned rather than a reloading SELECT
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+async_engine = _create_async_engine(settings.ASYNC_DATABASE_URL or _asyncpg_url(settings.DATABASE_URL))
+# Objects stay loaded after commit: with AsyncSession an expired attribute
+# cannot be lazily reloaded during response serialization
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+read_replicas = ReplicaSelector(
+    [_create_engine(url) for url in settings.DATABASE_REPLICA_URLS],
+    settings.REPLICA_SELECTION,
+)
+async_read_replicas = ReplicaSelector(
+    [_create_async_engine(url) for url in settings.ASYNC_DATABASE_REPLICA_URLS or map(_asyncpg_url, settings.DATABASE_REPLICA_URLS)],
+    settings.REPLICA_SELECTION,
+)
+
+class _ModelBase:
+    # Server-generated values (timestamp defaults, SQL expressions assigned to
+    # attributes) come back through INSERT/UPDATE ... RETURNING, not a refresh
+    __mapper_args__ = {"eager_defaults": True}
+
+Base = declarative_base(cls=_ModelBase)
 
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def _read_engine(selector: ReplicaSelector, primary, user_id: Optional[str]):
+    if not selector.engines:
+        return primary
+    if user_id is not None and has_recent_write(user_id):
+        record_read("sticky")
+        return primary
+    record_read("replica")
+    return selector.choose()
+
+def read_session(*, user_id: Optional[str] = None) -> Session:
+    """
+    Session on a read replica, or on the primary when no replicas are
+    configured or the user wrote within REPLICA_STICKY_SECONDS.
+    """
+    return SessionLocal(bind=_read_engine(read_replicas, engine, user_id))
+
+def async_read_session(*, user_id: Optional[str] = None) -> AsyncSession:
+    return AsyncSessionLocal(bind=_read_engine(async_read_replicas, async_engine, user_id))
+
+@contextmanager
+def primary_session(db: Session) -> Iterator[Session]:
+    """
+    db when it is bound to the primary, otherwise a short-lived session on
+    the primary. For reads whose result outlives the request, such as shared
+    cache fills, which must not come from a lagging replica.
+    """
+    if db.bind is engine:
+        yield db
+        return
+    primary_db = SessionLocal()
+    try:
+        yield primary_db
+    finally:
+        primary_db.close()
+
+@asynccontextmanager
+async def async_primary_session(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+    if db.bind is async_engine:
+        yield db
+        return
+    async with AsyncSessionLocal() as primary_db:
+        yield primary_db
@@ -0,0 +1,130 @@
+import bisect
+import logging
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (milliseconds) of the checkout wait histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+class PoolStats:
+    """
+    Counters for one connection pool, updated from pool events and checkouts.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def incr(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def observe_wait(self, seconds: float) -> None:
+        bucket = bisect.bisect_left(WAIT_BUCKETS_MS, seconds * 1000)
+        with self._lock:
+            self._wait_buckets[bucket] += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def histogram(self) -> Dict[str, int]:
+        labels = [f"<={bound}ms" for bound in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}ms"]
+        with self._lock:
+            return dict(zip(labels, self._wait_buckets))
+
+class _InstrumentedPoolMixin:
+    # Times QueuePool._do_get, which covers waiting for a free connection and
+    # opening an overflow one; pool events only fire after a connection is handed out
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.incr("timeouts")
+            logger.warning("Timed out after %.1fs waiting for a database connection (%s)", time.perf_counter() - start, self.status())
+            raise
+        self.stats.observe_wait(time.perf_counter() - start)
+        return connection
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+def pool_options() -> Dict[str, Any]:
+    """
+    Keyword arguments for create_engine/create_async_engine from settings.
+    """
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+def instrument(engine: Engine) -> None:
+    """
+    Count connects, checkouts, checkins and invalidations on the engine's pool.
+    Listeners are registered on the engine so they survive pool recreation.
+    """
+    def _stats():
+        return getattr(engine.pool, "stats", None)
+
+    def _counter(name):
+        def listener(*args):
+            stats = _stats()
+            if stats is not None:
+                stats.incr(name)
+        return listener
+
+    event.listen(engine, "connect", _counter("connects"))
+    event.listen(engine, "checkout", _counter("checkouts"))
+    event.listen(engine, "checkin", _counter("checkins"))
+    event.listen(engine, "invalidate", _counter("invalidations"))
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    pool = engine.pool
+    result: Dict[str, Any] = {"class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        result.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        waits = sum(stats.histogram().values())
+        result.update(
+            connects=stats.connects,
+            checkouts=stats.checkouts,
+            checkins=stats.checkins,
+            invalidations=stats.invalidations,
+            timeouts=stats.timeouts,
+            wait_avg_ms=round(stats.wait_total / waits * 1000, 3) if waits else 0.0,
+            wait_max_ms=round(stats.wait_max * 1000, 3),
+            wait_histogram=stats.histogram(),
+        )
+    return result
@@ -0,0 +1,36 @@
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import Response
+
+def weak_etag(*parts: Any) -> str:
+    """
+    Weak ETag over version data (timestamps, counts, query parameters), not
+    over the serialized body: equal parts mean a semantically equal response.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+def content_etag(payload: Any) -> str:
+    """Weak ETag over a JSON-ready payload, for responses without a version column"""
+    return weak_etag(json.dumps(payload, sort_keys=True, separators=(",", ":")))
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # Weak comparison (RFC 9110 13.1.2): W/ prefixes are ignored
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+def set_etag(response: Response, etag: str, *, private: bool = True) -> None:
+    # no-cache: clients may store the body but must revalidate before reusing it
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache" if private else "no-cache"
+
+def not_modified(etag: str, *, private: bool = True) -> Response:
+    response = Response(status_code=304)
+    set_etag(response, etag, private=private)
+    return response
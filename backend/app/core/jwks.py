@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import re
+import time
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.core.http import get_http_client
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+class JWKSCache:
+    """
+    Signing keys from a JWKS endpoint, cached for the max-age the endpoint
+    advertises and refreshed in the background shortly before they expire.
+    """
+
+    # Refresh this long before expiry, and never refetch for an unknown kid
+    # more often than MIN_REFETCH_INTERVAL
+    REFRESH_MARGIN = 60
+    MIN_REFETCH_INTERVAL = 30
+    RETRY_INTERVAL = 30
+
+    def __init__(self, url: str, default_max_age: int):
+        self.url = url
+        self.default_max_age = default_max_age
+        self._keys: Dict[str, dict] = {}
+        self._fetched_at = 0.0
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.fetches = 0
+        self.failures = 0
+
+    async def _fetch(self) -> None:
+        try:
+            response = await get_http_client().get(self.url)
+            response.raise_for_status()
+            keys = {key["kid"]: key for key in response.json().get("keys", []) if "kid" in key}
+        except Exception:
+            self.failures += 1
+            raise
+        match = _MAX_AGE.search(response.headers.get("cache-control", ""))
+        max_age = int(match.group(1)) if match else self.default_max_age
+        now = time.monotonic()
+        self._keys = keys
+        self._fetched_at = now
+        self._expires_at = now + max_age
+        self.fetches += 1
+
+    async def _refresh(self, *, force: bool) -> None:
+        async with self._lock:
+            # Whoever held the lock before us may already have refreshed
+            now = time.monotonic()
+            if force and now - self._fetched_at < self.MIN_REFETCH_INTERVAL:
+                return
+            if not force and self._expires_at > now:
+                return
+            await self._fetch()
+
+    async def get_key(self, kid: str) -> dict:
+        if self._expires_at <= time.monotonic():
+            try:
+                await self._refresh(force=False)
+            except Exception:
+                if not self._keys:
+                    raise
+                logger.warning("JWKS refresh from %s failed, using stale keys", self.url, exc_info=True)
+        key = self._keys.get(kid)
+        if key is None:
+            # An unknown kid usually means the keys rotated before our copy expired
+            await self._refresh(force=True)
+            key = self._keys.get(kid)
+        if key is None:
+            raise ValueError(f"Unknown signing key {kid!r}")
+        return key
+
+    async def _run(self) -> None:
+        while True:
+            delay = self._expires_at - time.monotonic() - self.REFRESH_MARGIN
+            await asyncio.sleep(max(delay, 0))
+            try:
+                async with self._lock:
+                    await self._fetch()
+            except Exception:
+                logger.warning("Background JWKS refresh from %s failed", self.url, exc_info=True)
+                await asyncio.sleep(self.RETRY_INTERVAL)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self._keys),
+            "expires_in": max(self._expires_at - time.monotonic(), 0),
+            "fetches": self.fetches,
+            "failures": self.failures,
+        }
+
+google_jwks = JWKSCache(settings.GOOGLE_JWKS_URL, settings.GOOGLE_JWKS_DEFAULT_MAX_AGE)
@@ -0,0 +1,64 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import tuple_
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+def _decode_value(column, value: Any) -> Any:
+    python_type = column.type.python_type
+    if value is None:
+        return None
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return python_type(value)
+
+class Keyset:
+    """
+    Descending (sort_key, ..., id) ordering for a list query, paginated either
+    by offset (legacy skip/limit) or by an opaque cursor holding the last row's
+    key. A cursor page seeks straight to the key on the matching index instead
+    of scanning and discarding every skipped row.
+    """
+
+    def __init__(self, *columns):
+        self.columns = columns
+
+    def encode(self, row: Any) -> str:
+        values = [_encode_value(getattr(row, column.key)) for column in self.columns]
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> Tuple[Any, ...]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError
+            return tuple(_decode_value(column, value) for column, value in zip(self.columns, values))
+        except (ValueError, TypeError):
+            raise ValueError("Invalid cursor")
+
+    def apply(self, query, *, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+        """
+        Order and limit a Query or Select. cursor=None pages by skip; an empty
+        cursor is the first keyset page.
+        """
+        query = query.order_by(*(column.desc() for column in self.columns))
+        if cursor is None:
+            return query.offset(skip).limit(limit)
+        if cursor:
+            query = query.where(tuple_(*self.columns) < tuple_(*self.decode(cursor)))
+        return query.limit(limit)
+
+    def next_cursor(self, items: Sequence[Any], limit: int) -> Optional[str]:
+        # A full page may be followed by more rows; a short page is the last
+        if limit <= 0 or len(items) < limit:
+            return None
+        return self.encode(items[-1])
@@ -0,0 +1,28 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Transaction bookkeeping, not round trips a request path is responsible for
+_IGNORED_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT", "BEGIN", "COMMIT", "ROLLBACK")
+
+@contextmanager
+def count_queries(engine) -> Iterator[List[str]]:
+    """
+    Collect the SQL statements executed on an engine inside the block. The
+    yielded list fills in as statements run, so len() gives the query count.
+    """
+    if isinstance(engine, AsyncEngine):
+        engine = engine.sync_engine
+    statements: List[str] = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(_IGNORED_PREFIXES):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
@@ -0,0 +1,99 @@
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Optional
+
+import redis
+
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+class SlidingWindowLimiter:
+    """
+    Counts events per key over a sliding window of ``window`` seconds.
+    Uses a Redis sorted set per key when Redis is enabled so every worker
+    shares one window, and an in-process log otherwise or when Redis fails.
+    """
+
+    def __init__(self, name: str, limit: int, window: float, max_keys: int = 100000):
+        self.name = name
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._local: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {"allowed": 0, "blocked": 0, "redis_errors": 0}
+
+    def _redis_key(self, key: str) -> str:
+        return f"recruitai:ratelimit:{self.name}:{key}"
+
+    def _local_events(self, key: str, now: float) -> Deque[float]:
+        events = self._local.get(key)
+        if events is None:
+            events = self._local[key] = deque()
+            while len(self._local) > self.max_keys:
+                self._local.popitem(last=False)
+        self._local.move_to_end(key)
+        while events and events[0] <= now - self.window:
+            events.popleft()
+        return events
+
+    def _retry_after(self, count: int, oldest: Optional[float], now: float) -> Optional[float]:
+        if count < self.limit or oldest is None:
+            self._stats["allowed"] += 1
+            return None
+        self._stats["blocked"] += 1
+        return max(oldest + self.window - now, 0.0)
+
+    def check(self, key: str) -> Optional[float]:
+        """
+        Return seconds until the key may try again, or None if it is under the limit.
+        """
+        now = time.time()
+        client = get_redis()
+        if client is not None:
+            try:
+                pipe = client.pipeline()
+                pipe.zremrangebyscore(self._redis_key(key), "-inf", now - self.window)
+                pipe.zcard(self._redis_key(key))
+                pipe.zrange(self._redis_key(key), 0, 0, withscores=True)
+                _, count, oldest = pipe.execute()
+                return self._retry_after(count, oldest[0][1] if oldest else None, now)
+            except redis.RedisError:
+                self._stats["redis_errors"] += 1
+                logger.warning("Redis unavailable for rate limiter %s", self.name, exc_info=True)
+        with self._lock:
+            events = self._local_events(key, now)
+            return self._retry_after(len(events), events[0] if events else None, now)
+
+    def record(self, key: str) -> None:
+        now = time.time()
+        client = get_redis()
+        if client is not None:
+            try:
+                pipe = client.pipeline()
+                pipe.zadd(self._redis_key(key), {f"{now}:{uuid.uuid4().hex[:8]}": now})
+                pipe.expire(self._redis_key(key), int(self.window) + 1)
+                pipe.execute()
+                return
+            except redis.RedisError:
+                self._stats["redis_errors"] += 1
+                logger.warning("Redis unavailable for rate limiter %s", self.name, exc_info=True)
+        with self._lock:
+            self._local_events(key, now).append(now)
+
+    def reset(self, key: str) -> None:
+        client = get_redis()
+        if client is not None:
+            try:
+                client.delete(self._redis_key(key))
+            except redis.RedisError:
+                self._stats["redis_errors"] += 1
+        with self._lock:
+            self._local.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats, limit=self.limit, window=self.window, local_keys=len(self._local))
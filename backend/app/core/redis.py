@@ -0,0 +1,27 @@
+import logging
+from typing import Optional
+
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[redis.Redis] = None
+
+def get_redis() -> Optional[redis.Redis]:
+    """
+    Return the shared Redis client, or None when Redis is disabled.
+    Callers must treat Redis as optional and fall back to in-process state
+    when this returns None or a command raises redis.RedisError.
+    """
+    global _client
+    if not settings.REDIS_ENABLED:
+        return None
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+    return _client
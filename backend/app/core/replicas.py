@@ -0,0 +1,79 @@
+import itertools
+import logging
+import threading
+from typing import Any, Dict, Generic, List, Optional, TypeVar
+
+import redis
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "recruitai:wrote:"
+
+E = TypeVar("E")
+
+class ReplicaSelector(Generic[E]):
+    """
+    Picks a replica engine per read, round-robin or by fewest checked-out
+    connections. Works for both Engine and AsyncEngine.
+    """
+
+    def __init__(self, engines: List[E], strategy: str):
+        if strategy not in ("round_robin", "least_connections"):
+            raise ValueError(f"Unknown replica selection strategy {strategy!r}")
+        self.engines = engines
+        self.strategy = strategy
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _checked_out(engine: Any) -> int:
+        pool = getattr(engine, "sync_engine", engine).pool
+        return pool.checkedout() if hasattr(pool, "checkedout") else 0
+
+    def choose(self) -> Optional[E]:
+        if not self.engines:
+            return None
+        if self.strategy == "least_connections":
+            return min(self.engines, key=self._checked_out)
+        with self._lock:
+            index = next(self._counter)
+        return self.engines[index % len(self.engines)]
+
+# Users who wrote within REPLICA_STICKY_SECONDS. Redis makes the window visible
+# to every worker; the local tier covers the common same-worker case and Redis outages.
+_recent_writers = TTLCache(maxsize=100000, ttl=settings.REPLICA_STICKY_SECONDS)
+_stats = {"replica_reads": 0, "sticky_reads": 0, "redis_errors": 0}
+
+def mark_recent_write(user_id: str) -> None:
+    _recent_writers.set(user_id, True)
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.set(REDIS_KEY_PREFIX + user_id, 1, px=int(settings.REPLICA_STICKY_SECONDS * 1000))
+    except redis.RedisError:
+        _stats["redis_errors"] += 1
+        logger.warning("Redis unavailable for read-your-writes marker", exc_info=True)
+
+def has_recent_write(user_id: str) -> bool:
+    if _recent_writers.get(user_id):
+        return True
+    client = get_redis()
+    if client is None:
+        return False
+    try:
+        return bool(client.exists(REDIS_KEY_PREFIX + user_id))
+    except redis.RedisError:
+        _stats["redis_errors"] += 1
+        logger.warning("Redis unavailable for read-your-writes marker", exc_info=True)
+        return False
+
+def record_read(target: str) -> None:
+    _stats[f"{target}_reads"] += 1
+
+def stats() -> Dict[str, Any]:
+    return dict(_stats, sticky_seconds=settings.REPLICA_STICKY_SECONDS, strategy=settings.REPLICA_SELECTION)
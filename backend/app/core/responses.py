@@ -0,0 +1,39 @@
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+@lru_cache(maxsize=None)
+def _adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+def dump_json(schema: Any, value: Any) -> bytes:
+    """
+    Validate ORM objects (or dicts) against schema once, from attributes, and
+    serialize the result to JSON bytes in pydantic-core.
+    """
+    adapter = _adapter(schema)
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+def schema_response(schema: Any, value: Any, *, response: Optional[Response] = None) -> Response:
+    """
+    Response for an endpoint's response_model, built by dump_json. FastAPI
+    passes a returned Response through as is, so the body is validated once
+    rather than validated, dumped to dicts, revalidated and encoded again.
+    Headers set on the endpoint's injected `response` are carried over.
+    """
+    return _carry_headers(Response(content=dump_json(schema, value), media_type="application/json"), response)
+
+def json_response(content: Any, *, response: Optional[Response] = None) -> Response:
+    """
+    Response for JSON-ready content that already matches the response_model
+    (such as cached payloads), encoded by orjson without validation.
+    """
+    return _carry_headers(ORJSONResponse(content), response)
+
+def _carry_headers(result: Response, response: Optional[Response]) -> Response:
+    if response is not None:
+        result.headers.raw.extend(response.headers.raw)
+    return result
@@ -0,0 +1,125 @@
+import json
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+from uuid import UUID
+
+import redis
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "recruitai:revoked:"
+REDIS_CHANNEL = "recruitai:revocations"
+
+class RevocationList:
+    """
+    Minimum valid token version per user. An entry only has to outlive the
+    access tokens issued before it, so entries expire after ``ttl`` seconds.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, user_id: str, min_version: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries = {
+                key: entry for key, entry in self._entries.items() if entry[1] > now
+            }
+            current = self._entries.get(user_id)
+            if current is None or current[0] <= min_version:
+                self._entries[user_id] = (min_version, now + self.ttl)
+
+    def is_revoked(self, user_id: str, version: int) -> bool:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[1] <= time.monotonic():
+            return False
+        return version < entry[0]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+_revocations = RevocationList(ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+_stop = threading.Event()
+_listener: Optional[threading.Thread] = None
+
+def revoke_user_tokens(user_id: Union[str, UUID], min_version: int) -> None:
+    """
+    Reject every token for this user whose version claim is below min_version,
+    in this worker immediately and in the others through Redis pub/sub.
+    """
+    key = str(user_id)
+    _revocations.add(key, min_version)
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        pipe = client.pipeline()
+        pipe.set(REDIS_KEY_PREFIX + key, min_version, ex=int(_revocations.ttl))
+        pipe.publish(REDIS_CHANNEL, json.dumps({"user_id": key, "min_version": min_version}))
+        pipe.execute()
+    except redis.RedisError:
+        logger.warning("Could not publish token revocation for user %s", key, exc_info=True)
+
+def is_shared() -> bool:
+    """
+    Whether revocations reach every worker. Without Redis they only reach
+    the worker that made them, so token claims cannot be trusted on their own.
+    """
+    return get_redis() is not None
+
+def is_token_revoked(user_id: Union[str, UUID], version: int) -> bool:
+    return _revocations.is_revoked(str(user_id), version)
+
+def _load_from_redis(client: redis.Redis) -> None:
+    for raw_key in client.scan_iter(match=REDIS_KEY_PREFIX + "*", count=500):
+        value = client.get(raw_key)
+        if value is not None:
+            key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+            _revocations.add(key[len(REDIS_KEY_PREFIX):], int(value))
+
+def _listen(client: redis.Redis) -> None:
+    while not _stop.is_set():
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            # Subscribe before loading so no revocation falls in between
+            pubsub.subscribe(REDIS_CHANNEL)
+            _load_from_redis(client)
+            while not _stop.is_set():
+                message = pubsub.get_message(timeout=1.0)
+                if message and message["type"] == "message":
+                    data = json.loads(message["data"])
+                    _revocations.add(data["user_id"], int(data["min_version"]))
+        except redis.RedisError:
+            logger.warning("Revocation sync lost its Redis connection, retrying", exc_info=True)
+            _stop.wait(5)
+        finally:
+            pubsub.close()
+
+def start_revocation_sync() -> None:
+    global _listener
+    client = get_redis()
+    if client is None or _listener is not None:
+        return
+    _stop.clear()
+    _listener = threading.Thread(target=_listen, args=(client,), name="revocation-sync", daemon=True)
+    _listener.start()
+
+def stop_revocation_sync() -> None:
+    global _listener
+    _stop.set()
+    if _listener is not None:
+        _listener.join(timeout=2)
+        _listener = None
+
+def stats() -> dict:
+    return {
+        "entries": len(_revocations),
+        "synced": _listener is not None and _listener.is_alive(),
+    }
@@ -1,12 +1,21 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from app.api.v1.api import api_router
+from app.core import revocation, security
 from app.core.config import settings
+from app.core.database import async_engine, async_read_replicas, read_replicas
+from app.core.http import close_http_client
+from app.core.jwks import google_jwks
+from app.core.replicas import mark_recent_write
+from app.services import job_counters, message_buffer, message_partitions
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    # orjson for every response FastAPI serializes; hot reads build theirs with app.core.responses
+    default_response_class=ORJSONResponse,
 )
 
 # Set all CORS enabled origins
@@ -20,6 +29,51 @@ app.add_middleware(
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+if read_replicas.engines or async_read_replicas.engines:
+    @app.middleware("http")
+    async def pin_writers_to_primary(request: Request, call_next):
+        """
+        After a successful write, route that user's reads to the primary for
+        REPLICA_STICKY_SECONDS so they see their own changes despite replica lag.
+        """
+        response = await call_next(request)
+        if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+            scheme, _, token = request.headers.get("authorization", "").partition(" ")
+            user_id = security.verify_token(token) if scheme.lower() == "bearer" else None
+            if user_id is not None:
+                mark_recent_write(user_id)
+        return response
+
+@app.exception_handler(security.PasswordHashingBusy)
+def password_hashing_busy_handler(request: Request, exc: security.PasswordHashingBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Authentication is temporarily overloaded, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+@app.on_event("startup")
+async def startup_event():
+    revocation.start_revocation_sync()
+    job_counters.start_job_counter_flusher()
+    message_buffer.start_message_flusher()
+    message_partitions.start_partition_maintenance()
+    if settings.GOOGLE_CLIENT_ID:
+        google_jwks.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await google_jwks.stop()
+    await close_http_client()
+    revocation.stop_revocation_sync()
+    job_counters.stop_job_counter_flusher()
+    message_buffer.stop_message_flusher()
+    message_partitions.stop_partition_maintenance()
+    security.shutdown_password_pool()
+    await async_engine.dispose()
+    for replica in async_read_replicas.engines:
+        await replica.dispose()
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to RecruitAI API"}
@@ -1,16 +1,22 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.models.functions import utcnow
 import uuid
-from datetime import datetime
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
+    __table_args__ = (
+        # Application lists are keyset-paginated most recent first
+        Index("ix_job_applications_job_id_applied_at", "job_id", "applied_at", "id"),
+        Index("ix_job_applications_job_id_status_applied_at", "job_id", "status", "applied_at", "id"),
+        Index("ix_job_applications_candidate_id_applied_at", "candidate_id", "applied_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     status = Column(String, default="pending")  # pending, completed, selected, rejected, waitlisted
-    applied_at = Column(DateTime, default=datetime.utcnow)
+    applied_at = Column(DateTime, server_default=utcnow())
     completed_at = Column(DateTime, nullable=True)
     reviewed_at = Column(DateTime, nullable=True)
     
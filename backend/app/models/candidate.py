@@ -1,9 +1,9 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, JSON, Float
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.models.functions import utcnow
 import uuid
-from datetime import datetime
 
 class Candidate(Base):
     __tablename__ = "candidates"
@@ -20,16 +20,25 @@ class Candidate(Base):
     cv_file_size = Column(Integer, nullable=True)
     
     # Assessment scores
-    scores = Column(JSON, nullable=False)  # {overall, technical, soft, leadership, communication}
+    scores = Column(JSONB, nullable=False)  # {overall, technical, soft, leadership, communication}
+    # Typed copies of scores for indexed filtering, kept in sync by the candidate services
+    overall_score = Column(Float, nullable=False)
+    technical_score = Column(Float, nullable=False)
+    soft_score = Column(Float, nullable=False)
+    leadership_score = Column(Float, nullable=False)
+    communication_score = Column(Float, nullable=False)
+    weighted_score = Column(Float, nullable=False)  # skill scores weighted by the job's skill_weights
+    meets_cutoff = Column(Boolean, nullable=False)  # weighted_score >= the job's cutoff_percentage
     
     # Status tracking
     status = Column(String, default="pending")  # pending, interviewing, completed, selected, rejected, waitlisted
-    applied_at = Column(DateTime, default=datetime.utcnow)
+    applied_at = Column(DateTime, server_default=utcnow())
     completed_at = Column(DateTime, nullable=True)
     reviewed_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())  # ETag version, see get_candidates_version
     
     # Feedback and results
-    feedback = Column(JSON, nullable=True)  # {strengths, weaknesses, recommendations, overall_assessment, rejection_reason, interview_details}
+    feedback = Column(JSONB, nullable=True)  # {strengths, weaknesses, recommendations, overall_assessment, rejection_reason, interview_details}
     
     # Assessment metadata
     assessment_duration = Column(Integer, nullable=True)  # in seconds
@@ -37,9 +46,16 @@ class Candidate(Base):
     
     # Foreign keys
     job_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id"), nullable=False)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)  # If registered user
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)  # If registered user
     
     # Relationships
     job = relationship("JobPosting")
     user = relationship("User")
-    conversation = relationship("Conversation", back_populates="candidate_record")
\ No newline at end of file
+    conversation = relationship("Conversation", back_populates="candidate_record")
+
+
+# Ranked listings order by (weighted_score, id) within a job, optionally by status
+Index("ix_candidates_job_id_weighted_score", Candidate.job_id, Candidate.weighted_score, Candidate.id)
+Index("ix_candidates_job_id_status_weighted_score", Candidate.job_id, Candidate.status, Candidate.weighted_score, Candidate.id)
+Index("ix_candidates_job_id_overall_score", Candidate.job_id, Candidate.overall_score)
+Index("ix_candidates_job_id_updated_at", Candidate.job_id, Candidate.updated_at)
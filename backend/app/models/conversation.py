@@ -1,43 +1,60 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, JSON, Float
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.models.functions import utcnow
 import uuid
-from datetime import datetime
 
 class Conversation(Base):
     __tablename__ = "conversations"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    started_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, server_default=utcnow())
     ended_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     duration = Column(Integer, nullable=True)  # in seconds
     
     # Analysis results
-    final_analysis = Column(JSON, nullable=True)  # {strengths, weaknesses, recommendations}
+    final_analysis = Column(JSONB, nullable=True)  # {strengths, weaknesses, recommendations}
     sentiment_score = Column(Float, nullable=True)
     confidence_score = Column(Float, nullable=True)
     
+    # Archived transcript: a gzip member of a JSONL segment file (app/services/message_archive.py)
+    archive_segment = Column(String, nullable=True)
+    archive_offset = Column(BigInteger, nullable=True)
+    archive_length = Column(Integer, nullable=True)
+    
     # Foreign keys
-    candidate_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    job_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id"), nullable=False)
+    candidate_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id"), nullable=False, index=True)
     
     # Relationships
     candidate = relationship("User", back_populates="conversations")
     job = relationship("JobPosting", back_populates="conversations")
-    messages = relationship("ConversationMessage", back_populates="conversation", cascade="all, delete-orphan")
+    messages = relationship(
+        "ConversationMessage", back_populates="conversation", cascade="all, delete-orphan",
+        order_by="ConversationMessage.timestamp",
+    )
     candidate_record = relationship("Candidate", back_populates="conversation")
 
 class ConversationMessage(Base):
     __tablename__ = "conversation_messages"
+    __table_args__ = (
+        # Messages are always read per conversation in timestamp order
+        Index("ix_conversation_messages_conversation_id_timestamp", "conversation_id", "timestamp"),
+        # Monthly range partitions on PostgreSQL (app/services/message_partitions.py)
+        {"postgresql_partition_by": 'RANGE ("timestamp")'},
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Client-generated, so batched INSERT ... RETURNING can match rows to parameters by it
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, insert_sentinel=True)
     sender = Column(String, nullable=False)  # 'ai' or 'candidate'
     message = Column(Text, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    # Part of the primary key: a partitioned table's unique keys must include the partition key
+    timestamp = Column(DateTime, primary_key=True, server_default=utcnow())
     
     # Message analysis
-    analysis = Column(JSON, nullable=True)  # {sentiment, confidence, key_points}
+    analysis = Column(JSONB, nullable=True)  # {sentiment, confidence, key_points}
     
     # Audio support
     audio_file_path = Column(String, nullable=True)
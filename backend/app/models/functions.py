@@ -0,0 +1,28 @@
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+class utcnow(FunctionElement):
+    """
+    Current UTC time as a naive timestamp, evaluated by the database. Used as
+    the server default of timestamp columns; mappers with eager_defaults read
+    the generated value back through INSERT/UPDATE ... RETURNING.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+@compiles(utcnow, "postgresql")
+def _postgresql_utcnow(element, compiler, **kw):
+    # clock_timestamp(), not now(): rows written in one transaction keep
+    # distinct, increasing times (message and list ordering rely on them)
+    return "TIMEZONE('utc', clock_timestamp())"
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw):
+    # SQLite stores datetimes as text; match SQLAlchemy's microsecond format so
+    # server-generated values compare correctly with bound datetimes
+    return "(STRFTIME('%Y-%m-%d %H:%M:%f000', 'now'))"
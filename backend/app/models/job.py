@@ -1,18 +1,34 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, JSON, Float
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, Index
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 from app.core.database import Base
+from app.models.functions import utcnow
 import uuid
-from datetime import datetime
+
+# Text search configuration and weighted document behind /jobs/search:
+# title (A), requirement strings (B), description (C)
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(jsonb_to_tsvector('{SEARCH_CONFIG}', coalesce(requirements, '[]'::jsonb), '[\"string\"]'), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'C')"
+)
 
 class JobPosting(Base):
     __tablename__ = "job_postings"
+    __table_args__ = (
+        # Job lists are keyset-paginated newest first: (created_at, id) after the filter columns
+        Index("ix_job_postings_created_at", "created_at", "id"),
+        Index("ix_job_postings_status_created_at", "status", "created_at", "id"),
+        Index("ix_job_postings_recruiter_id_created_at", "recruiter_id", "created_at", "id"),
+        Index("ix_job_postings_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String, nullable=False)
     company = Column(String, nullable=False)
     description = Column(Text, nullable=False)
-    requirements = Column(JSON, nullable=False)  # List of strings
+    requirements = Column(JSONB, nullable=False)  # List of strings
     location = Column(String, nullable=False)
     employment_type = Column(String, nullable=False)
     salary_min = Column(Integer, nullable=True)
@@ -20,7 +36,7 @@ class JobPosting(Base):
     salary_currency = Column(String, default="USD")
     
     # Assessment configuration
-    skill_weights = Column(JSON, nullable=False)  # {technical, soft, leadership, communication}
+    skill_weights = Column(JSONB, nullable=False)  # {technical, soft, leadership, communication}
     cutoff_percentage = Column(Float, nullable=False)
     max_candidates = Column(Integer, nullable=False)
     
@@ -40,8 +56,11 @@ class JobPosting(Base):
     total_applications = Column(Integer, default=0)
     
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
+    
+    # Generated by PostgreSQL on every insert and update; only read by search
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True)))
     
     # Foreign keys
     recruiter_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -1,15 +1,18 @@
 from .user import User, UserCreate, UserUpdate, UserInDB
 from .job import JobPosting, JobPostingCreate, JobPostingUpdate, JobPostingInDB
-from .candidate import Candidate, CandidateCreate, CandidateUpdate
+from .candidate import Candidate, CandidateCreate, CandidateUpdate, BulkCandidateResult, BulkRowError, BulkDecision, BulkDecisionResult, CandidateRank, CandidateRanking
 from .conversation import Conversation, ConversationMessage, ConversationCreate, MessageCreate
 from .application import JobApplication, JobApplicationCreate
 from .auth import Token, TokenData
+from .pagination import Page
 
 __all__ = [
     "User", "UserCreate", "UserUpdate", "UserInDB",
     "JobPosting", "JobPostingCreate", "JobPostingUpdate", "JobPostingInDB",
-    "Candidate", "CandidateCreate", "CandidateUpdate",
+    "Candidate", "CandidateCreate", "CandidateUpdate", "BulkCandidateResult", "BulkRowError",
+    "BulkDecision", "BulkDecisionResult", "CandidateRank", "CandidateRanking",
     "Conversation", "ConversationMessage", "ConversationCreate", "MessageCreate",
     "JobApplication", "JobApplicationCreate",
-    "Token", "TokenData"
+    "Token", "TokenData",
+    "Page"
 ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional
+from uuid import UUID
 
 class Token(BaseModel):
     access_token: str
@@ -8,6 +9,15 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     username: Optional[str] = None
+    role: Optional[str] = None
+    is_active: Optional[bool] = None
+    token_version: Optional[int] = None
+
+class Principal(BaseModel):
+    """Authenticated caller as described by access token claims."""
+    id: UUID
+    role: str
+    is_active: bool
 
 class LoginRequest(BaseModel):
     email: str
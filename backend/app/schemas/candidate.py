@@ -1,8 +1,13 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional, Dict, List
+from pydantic import BaseModel, EmailStr, WithJsonSchema
+from typing import Annotated, Any, Optional, Dict, List
 from datetime import datetime
 from uuid import UUID
 
+# Emails read back from the database were validated on the way in. Responses
+# document them as emails without re-running email validation, which is most
+# of the cost of validating a candidate list.
+StoredEmail = Annotated[str, WithJsonSchema({"type": "string", "format": "email"})]
+
 class Scores(BaseModel):
     overall: float
     technical: float
@@ -44,7 +49,10 @@ class CandidateUpdate(BaseModel):
 
 class CandidateInDB(CandidateBase):
     id: UUID
+    email: StoredEmail
     scores: Scores
+    weighted_score: float
+    meets_cutoff: bool
     status: str
     applied_at: datetime
     completed_at: Optional[datetime] = None
@@ -59,4 +67,45 @@ class CandidateInDB(CandidateBase):
         from_attributes = True
 
 class Candidate(CandidateInDB):
-    pass
\ No newline at end of file
+    pass
+
+class BulkRowError(BaseModel):
+    index: int  # position in the JSON array, or line number in the NDJSON body (0-based)
+    errors: List[Dict[str, Any]]  # {loc, msg, type}, as in request validation errors
+
+class BulkCandidateResult(BaseModel):
+    inserted: int
+    failed: int
+    errors: List[BulkRowError]
+
+class BulkDecision(BaseModel):
+    decision: str  # select, reject or waitlist
+    # Candidates of the job to decide on: by id and/or by weighted score
+    # (e.g. reject everyone below the cutoff); at least one is required
+    candidate_ids: Optional[List[UUID]] = None
+    weighted_score_below: Optional[float] = None
+    weighted_score_at_least: Optional[float] = None
+    status: Optional[str] = None  # only candidates currently in this status
+    reason: Optional[str] = None  # rejection reason, added to existing feedback
+
+class BulkDecisionResult(BaseModel):
+    updated: int
+    candidate_ids: List[UUID]
+
+class CandidateRank(BaseModel):
+    candidate_id: UUID
+    job_id: UUID
+    weighted_score: float
+    rank: int  # 1 + candidates of the job with a higher weighted score; equal scores share a rank
+    total: int  # candidates of the job
+    percentile: float  # percent of the job's candidates with a lower weighted score
+    top_percent: float  # rank as a percent of total: 5.0 means "top 5%"
+
+class RankedCandidate(BaseModel):
+    candidate_id: UUID
+    weighted_score: float
+    rank: int
+
+class CandidateRanking(BaseModel):
+    total: int
+    items: List[RankedCandidate]
@@ -82,4 +82,17 @@ class JobPostingPublic(BaseModel):
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class JobSearchHit(JobPostingPublic):
+    rank: float
+
+class FacetCount(BaseModel):
+    value: Optional[str] = None
+    count: int
+
+class JobSearchResult(BaseModel):
+    items: List[JobSearchHit]
+    total: int
+    # location, employment_type and salary, most common first
+    facets: Dict[str, List[FacetCount]]
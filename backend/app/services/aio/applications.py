@@ -0,0 +1,79 @@
+from typing import List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from uuid import UUID
+
+from app.models.application import JobApplication
+from app.models.job import JobPosting
+from app.schemas.application import JobApplicationCreate, JobApplicationUpdate
+from app.services import job_counters
+from app.services.applications import APPLICATION_ORDER, application_for_user_statement
+
+async def create_application(db: AsyncSession, *, application_create: JobApplicationCreate, candidate_id: UUID) -> JobApplication:
+    db_application = JobApplication(
+        **application_create.dict(exclude={"candidate_id"}),
+        candidate_id=candidate_id,
+    )
+    db.add(db_application)
+    
+    # Update job application count
+    await job_counters.increment_async(db, job_id=application_create.job_id, counter="total_applications")
+    
+    await db.commit()
+    return db_application
+
+async def get_application(db: AsyncSession, *, application_id: UUID) -> Optional[JobApplication]:
+    # Load the job eagerly; ownership checks read application.job.recruiter_id
+    query = select(JobApplication).options(joinedload(JobApplication.job)).where(JobApplication.id == application_id)
+    return (await db.execute(query)).scalars().first()
+
+async def get_application_for_user(
+    db: AsyncSession, *, application_id: UUID, user_id: UUID, role: str
+) -> Tuple[Optional[JobApplication], bool]:
+    row = (await db.execute(application_for_user_statement(application_id=application_id, user_id=user_id, role=role))).first()
+    if row is None:
+        return None, False
+    return row.JobApplication, bool(row.allowed)
+
+async def get_applications_by_user(
+    db: AsyncSession, *, user_id: UUID, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+) -> List[JobApplication]:
+    query = select(JobApplication).where(
+        JobApplication.candidate_id == user_id
+    )
+    return (await db.execute(APPLICATION_ORDER.apply(query, skip=skip, limit=limit, cursor=cursor))).scalars().all()
+
+async def get_applications_by_job(
+    db: AsyncSession, 
+    *, 
+    job_id: UUID, 
+    recruiter_id: UUID,
+    skip: int = 0, 
+    limit: int = 100,
+    status: Optional[str] = None,
+    cursor: Optional[str] = None
+) -> List[JobApplication]:
+    # Verify recruiter owns the job
+    job = (await db.execute(select(JobPosting).where(
+        JobPosting.id == job_id,
+        JobPosting.recruiter_id == recruiter_id
+    ))).scalars().first()
+    
+    if not job:
+        return []
+    
+    query = select(JobApplication).where(JobApplication.job_id == job_id)
+    
+    if status:
+        query = query.where(JobApplication.status == status)
+    
+    return (await db.execute(APPLICATION_ORDER.apply(query, skip=skip, limit=limit, cursor=cursor))).scalars().all()
+
+async def update_application(db: AsyncSession, *, application: JobApplication, application_update: JobApplicationUpdate) -> JobApplication:
+    update_data = application_update.dict(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(application, field, value)
+    
+    await db.commit()
+    return application
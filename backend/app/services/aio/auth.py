@@ -0,0 +1,61 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.security import verify_and_update_password_async, get_password_hash_async
+from app.models.user import User
+from app.schemas.user import UserCreate
+from app.services.user_cache import invalidate_user
+
+async def get_user_by_email(db: AsyncSession, *, email: str) -> Optional[User]:
+    return (await db.execute(select(User).where(User.email == email))).scalars().first()
+
+async def authenticate_user(db: AsyncSession, *, email: str, password: str) -> Optional[User]:
+    user = await get_user_by_email(db, email=email)
+    if not user:
+        return None
+    valid, new_hash = await verify_and_update_password_async(password, user.hashed_password)
+    if not valid:
+        return None
+    if new_hash:
+        # Stored hash used a different cost factor; upgrade it transparently
+        user.hashed_password = new_hash
+        await db.commit()
+        await run_in_threadpool(invalidate_user, user.id)
+    return user
+
+async def create_user(db: AsyncSession, *, user_create: UserCreate) -> User:
+    hashed_password = await get_password_hash_async(user_create.password)
+    db_user = User(
+        email=user_create.email,
+        hashed_password=hashed_password,
+        name=user_create.name,
+        role=user_create.role,
+        company=user_create.company,
+        phone=user_create.phone,
+        location=user_create.location,
+        bio=user_create.bio,
+        is_active=True,
+        is_verified=False
+    )
+    db.add(db_user)
+    await db.commit()
+    return db_user
+
+async def get_or_create_google_user(db: AsyncSession, *, user_info: dict, role: str) -> User:
+    user = await get_user_by_email(db, email=user_info["email"])
+    if user:
+        return user
+    user_create = UserCreate(
+        email=user_info["email"],
+        name=user_info["name"],
+        role=role,
+        password="google_oauth"  # Placeholder, won't be used
+    )
+    user = await create_user(db, user_create=user_create)
+    user.google_id = user_info["sub"]
+    user.avatar_url = user_info.get("picture")
+    user.is_verified = True
+    await db.commit()
+    return user
@@ -0,0 +1,187 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import insert, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from uuid import UUID
+
+from app.models.candidate import Candidate
+from app.models.job import JobPosting
+from app.schemas.candidate import BulkDecision, BulkRowError, CandidateCreate, CandidateUpdate
+from app.services.candidates import (
+    CANDIDATE_ORDER, DECISIONS, bulk_db_error, bulk_decision_error, bulk_decision_statement, bulk_insert_values,
+    bulk_jobs_statement, candidate_for_user_statement, candidates_version_statement, decision_counter_deltas, decision_statement,
+    rank_entries, validate_bulk_rows,
+)
+from app.services import candidate_ranks, job_counters
+from app.services.scoring import score_columns
+
+async def create_candidate(db: AsyncSession, *, candidate_create: CandidateCreate, user_id: UUID) -> Candidate:
+    job = (await db.execute(select(JobPosting).where(JobPosting.id == candidate_create.job_id))).scalars().first()
+    if not job:
+        raise ValueError("Job not found")
+    
+    db_candidate = Candidate(
+        **candidate_create.dict(),
+        **score_columns(candidate_create.scores.dict(), job),
+        user_id=user_id,
+    )
+    db.add(db_candidate)
+    await db.commit()
+    await candidate_ranks.record_async([(db_candidate.job_id, db_candidate.id, db_candidate.weighted_score)])
+    return db_candidate
+
+async def bulk_create_candidates(
+    db: AsyncSession, *, rows: Sequence[Tuple[int, Any]], recruiter_id: UUID
+) -> Tuple[int, List[BulkRowError]]:
+    valid, errors = validate_bulk_rows(rows)
+    job_ids = {candidate.job_id for _, candidate in valid}
+    jobs = {job.id: job for job in await db.execute(bulk_jobs_statement(job_ids=job_ids, recruiter_id=recruiter_id))} if job_ids else {}
+    indexes, values, value_errors = bulk_insert_values(valid, jobs)
+    errors += value_errors
+    if not values:
+        return 0, errors
+
+    inserted = []
+    try:
+        async with db.begin_nested():
+            await db.execute(insert(Candidate), values)
+        inserted = values
+    except DBAPIError:
+        # Retry row by row to keep the good rows and report the bad ones
+        for index, value in zip(indexes, values):
+            try:
+                async with db.begin_nested():
+                    await db.execute(insert(Candidate), [value])
+                inserted.append(value)
+            except DBAPIError as e:
+                errors.append(bulk_db_error(index, e))
+    await db.commit()
+    await candidate_ranks.record_async(rank_entries(inserted))
+    return len(inserted), errors
+
+async def get_candidate(db: AsyncSession, *, candidate_id: UUID) -> Optional[Candidate]:
+    # Load the job eagerly; ownership checks read candidate.job.recruiter_id
+    query = select(Candidate).options(joinedload(Candidate.job)).where(Candidate.id == candidate_id)
+    return (await db.execute(query)).scalars().first()
+
+async def get_candidate_for_user(
+    db: AsyncSession, *, candidate_id: UUID, user_id: UUID, role: str
+) -> Tuple[Optional[Candidate], bool]:
+    row = (await db.execute(candidate_for_user_statement(candidate_id=candidate_id, user_id=user_id, role=role))).first()
+    if row is None:
+        return None, False
+    return row.Candidate, bool(row.allowed)
+
+async def _get_owned_job(db: AsyncSession, *, job_id: UUID, recruiter_id: UUID) -> Optional[JobPosting]:
+    query = select(JobPosting).where(
+        JobPosting.id == job_id,
+        JobPosting.recruiter_id == recruiter_id
+    )
+    return (await db.execute(query)).scalars().first()
+
+async def get_candidates_version(db: AsyncSession, *, job_id: UUID, recruiter_id: UUID) -> Tuple[Any, ...]:
+    return tuple((await db.execute(candidates_version_statement(job_id=job_id, recruiter_id=recruiter_id))).one())
+
+async def get_candidate_rank(db: AsyncSession, *, candidate: Candidate) -> Dict[str, Any]:
+    return await candidate_ranks.get_rank_async(db, job_id=candidate.job_id, candidate_id=candidate.id, score=candidate.weighted_score)
+
+async def get_candidate_ranking(
+    db: AsyncSession, *, job_id: UUID, recruiter_id: UUID, skip: int = 0, limit: int = 100
+) -> Optional[Dict[str, Any]]:
+    if not await _get_owned_job(db, job_id=job_id, recruiter_id=recruiter_id):
+        return None
+    return await candidate_ranks.get_ranking_async(db, job_id=job_id, skip=skip, limit=limit)
+
+async def get_candidates_by_job(
+    db: AsyncSession, 
+    *, 
+    job_id: UUID, 
+    recruiter_id: UUID,
+    skip: int = 0, 
+    limit: int = 100,
+    status: Optional[str] = None,
+    min_score: float = 0,
+    min_weighted_score: float = 0,
+    cursor: Optional[str] = None
+) -> List[Candidate]:
+    # Verify recruiter owns the job
+    job = await _get_owned_job(db, job_id=job_id, recruiter_id=recruiter_id)
+    if not job:
+        return []
+    
+    query = select(Candidate).where(Candidate.job_id == job_id)
+    
+    if status:
+        query = query.where(Candidate.status == status)
+    
+    if min_score > 0:
+        query = query.where(Candidate.overall_score >= min_score)
+    
+    if min_weighted_score > 0:
+        query = query.where(Candidate.weighted_score >= min_weighted_score)
+    
+    return (await db.execute(CANDIDATE_ORDER.apply(query, skip=skip, limit=limit, cursor=cursor))).scalars().all()
+
+async def update_candidate(db: AsyncSession, *, candidate: Candidate, candidate_update: CandidateUpdate) -> Candidate:
+    update_data = candidate_update.dict(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(candidate, field, value)
+    
+    if update_data.get("scores"):
+        # get_candidate and get_candidate_for_user load candidate.job eagerly
+        for field, value in score_columns(update_data["scores"], candidate.job).items():
+            setattr(candidate, field, value)
+    
+    await db.commit()
+    if update_data.get("scores"):
+        await candidate_ranks.record_async([(candidate.job_id, candidate.id, candidate.weighted_score)])
+    return candidate
+
+async def _decide(
+    db: AsyncSession, *, candidate_id: UUID, recruiter_id: UUID, decision: str, reason: Optional[str] = None
+) -> Candidate:
+    status, _ = DECISIONS[decision]
+    row = (await db.execute(
+        decision_statement(candidate_id=candidate_id, recruiter_id=recruiter_id, status=status, reason=reason)
+    )).first()
+    if not row:
+        await db.rollback()
+        candidate = await get_candidate(db, candidate_id=candidate_id)
+        if not candidate:
+            raise ValueError("Candidate not found")
+        if candidate.job.recruiter_id != recruiter_id:
+            raise ValueError("Not authorized")
+        return candidate
+    candidate, previous_status = row
+    
+    # Update job metrics
+    await job_counters.apply_async(db, job_id=candidate.job_id, deltas=decision_counter_deltas(decision, [previous_status]))
+    
+    await db.commit()
+    return candidate
+
+async def select_candidate(db: AsyncSession, *, candidate_id: UUID, recruiter_id: UUID) -> Candidate:
+    return await _decide(db, candidate_id=candidate_id, recruiter_id=recruiter_id, decision="select")
+
+async def reject_candidate(db: AsyncSession, *, candidate_id: UUID, recruiter_id: UUID, reason: Optional[str] = None) -> Candidate:
+    return await _decide(db, candidate_id=candidate_id, recruiter_id=recruiter_id, decision="reject", reason=reason)
+
+async def decide_candidates(db: AsyncSession, *, job_id: UUID, recruiter_id: UUID, decision: BulkDecision) -> List[UUID]:
+    rows = (await db.execute(bulk_decision_statement(job_id=job_id, recruiter_id=recruiter_id, decision=decision))).all()
+    if not rows:
+        await db.rollback()
+        job = (await db.execute(select(JobPosting.enable_waitlist).where(
+            JobPosting.id == job_id,
+            JobPosting.recruiter_id == recruiter_id
+        ))).first()
+        error = bulk_decision_error(job, decision)
+        if error:
+            raise ValueError(error)
+        return []
+    
+    # Update job metrics
+    await job_counters.apply_async(db, job_id=job_id, deltas=decision_counter_deltas(decision.decision, [row.status for row in rows]))
+    
+    await db.commit()
+    return [row.id for row in rows]
@@ -0,0 +1,98 @@
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from datetime import datetime
+from uuid import UUID
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.models.conversation import Conversation, ConversationMessage
+from app.schemas.conversation import ConversationCreate, MessageCreate
+from app.services import message_archive, message_buffer
+from app.services.conversations import (
+    add_messages_statement, conversation_for_user_statement, conversation_version_statement, flush_buffered_messages,
+    message_rows,
+)
+
+async def create_conversation(db: AsyncSession, *, conversation_create: ConversationCreate, candidate_id: UUID) -> Conversation:
+    db_conversation = Conversation(
+        candidate_id=candidate_id,
+        job_id=conversation_create.job_id,
+        messages=[],
+    )
+    db.add(db_conversation)
+    await db.commit()
+    return db_conversation
+
+async def get_conversation(db: AsyncSession, *, conversation_id: UUID, with_messages: bool = False) -> Optional[Conversation]:
+    if with_messages and settings.CONVERSATION_MESSAGE_BUFFER:
+        await run_in_threadpool(flush_buffered_messages, conversation_id=conversation_id)
+    query = select(Conversation).options(joinedload(Conversation.job)).where(Conversation.id == conversation_id)
+    if with_messages:
+        query = query.options(selectinload(Conversation.messages))
+    conversation = (await db.execute(query)).scalars().first()
+    if conversation and with_messages and conversation.archive_segment is not None:
+        await run_in_threadpool(message_archive.rehydrate, conversation)
+    return conversation
+
+async def get_conversation_for_user(
+    db: AsyncSession, *, conversation_id: UUID, user_id: UUID, role: str
+) -> Tuple[Optional[Conversation], bool]:
+    if settings.CONVERSATION_MESSAGE_BUFFER:
+        await run_in_threadpool(flush_buffered_messages, conversation_id=conversation_id)
+    row = (await db.execute(conversation_for_user_statement(conversation_id=conversation_id, user_id=user_id, role=role))).first()
+    if row is None:
+        return None, False
+    if row.allowed and row.Conversation.archive_segment is not None:
+        await run_in_threadpool(message_archive.rehydrate, row.Conversation)
+    return row.Conversation, bool(row.allowed)
+
+async def get_conversation_version(
+    db: AsyncSession, *, conversation_id: UUID, user_id: UUID, role: str
+) -> Tuple[Optional[Tuple], bool]:
+    if settings.CONVERSATION_MESSAGE_BUFFER:
+        await run_in_threadpool(flush_buffered_messages, conversation_id=conversation_id)
+    statement = conversation_version_statement(conversation_id=conversation_id, user_id=user_id, role=role)
+    row = (await db.execute(statement)).first()
+    if row is None:
+        return None, False
+    return tuple(row[1:]), bool(row.allowed)
+
+async def add_messages(db: AsyncSession, *, conversation_id: UUID, messages_create: Sequence[MessageCreate]) -> List[ConversationMessage]:
+    if settings.CONVERSATION_MESSAGE_BUFFER:
+        return message_buffer.enqueue(conversation_id=conversation_id, messages_create=messages_create)
+    messages = (await db.execute(add_messages_statement(), message_rows(conversation_id, messages_create))).scalars().all()
+    await db.commit()
+    return messages
+
+async def add_message(db: AsyncSession, *, conversation_id: UUID, message_create: MessageCreate) -> ConversationMessage:
+    if settings.CONVERSATION_MESSAGE_BUFFER:
+        return message_buffer.enqueue(conversation_id=conversation_id, messages_create=[message_create])[0]
+    db_message = ConversationMessage(
+        conversation_id=conversation_id,
+        **message_create.dict(),
+    )
+    db.add(db_message)
+    await db.commit()
+    return db_message
+
+async def end_conversation(db: AsyncSession, *, conversation_id: UUID) -> Conversation:
+    conversation = await get_conversation(db, conversation_id=conversation_id, with_messages=True)
+    if not conversation:
+        raise ValueError("Conversation not found")
+    
+    conversation.ended_at = datetime.utcnow()
+    if conversation.started_at:
+        duration = (conversation.ended_at - conversation.started_at).total_seconds()
+        conversation.duration = int(duration)
+    
+    # Generate final analysis (mock implementation)
+    conversation.final_analysis = {
+        "strengths": ["Good communication skills", "Technical knowledge"],
+        "weaknesses": ["Could improve leadership examples"],
+        "recommendations": ["Practice behavioral questions", "Prepare more specific examples"]
+    }
+    
+    await db.commit()
+    return conversation
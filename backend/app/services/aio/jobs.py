@@ -0,0 +1,93 @@
+from typing import Any, Dict, List, Optional
+from fastapi import BackgroundTasks
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta
+from uuid import UUID
+from starlette.concurrency import run_in_threadpool
+
+from app.models.job import JobPosting
+from app.schemas.job import JobPostingCreate, JobPostingUpdate
+from app.services import candidate_ranks, job_cache
+from app.services.jobs import JOB_ORDER, active_jobs_payload, public_job_payload, search_jobs_statement, search_result
+from app.services.rescoring import needs_rescore, rescore_in_background_async, rescore_statement
+
+async def create_job(db: AsyncSession, *, job_create: JobPostingCreate, recruiter_id: UUID) -> JobPosting:
+    expires_at = datetime.utcnow() + timedelta(days=job_create.active_days)
+    
+    db_job = JobPosting(
+        **job_create.dict(),
+        recruiter_id=recruiter_id,
+        expires_at=expires_at,
+    )
+    db.add(db_job)
+    await db.commit()
+    await run_in_threadpool(job_cache.invalidate_job, db_job.id)
+    return db_job
+
+async def get_job(db: AsyncSession, *, job_id: UUID) -> Optional[JobPosting]:
+    return (await db.execute(select(JobPosting).where(JobPosting.id == job_id))).scalars().first()
+
+async def get_public_job(db: AsyncSession, *, job_id: UUID) -> Optional[dict]:
+    async def load() -> Optional[dict]:
+        async with job_cache.fill_session_async(db) as fill_db:
+            job = await get_job(fill_db, job_id=job_id)
+            return job_cache.entry(public_job_payload(job) if job else None)
+    return await job_cache.get_or_load_async(job_cache.job_key(job_id), load)
+
+async def get_active_jobs_page(db: AsyncSession, *, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> Any:
+    async def load() -> Any:
+        async with job_cache.fill_session_async(db) as fill_db:
+            jobs = await get_active_jobs(fill_db, skip=skip, limit=limit, cursor=cursor)
+            return job_cache.entry(active_jobs_payload(jobs, limit=limit, cursor=cursor))
+    return await job_cache.get_or_load_async(job_cache.active_page_key(skip=skip, limit=limit, cursor=cursor), load)
+
+async def get_jobs(db: AsyncSession, *, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[JobPosting]:
+    query = JOB_ORDER.apply(select(JobPosting), skip=skip, limit=limit, cursor=cursor)
+    return (await db.execute(query)).scalars().all()
+
+async def get_active_jobs(db: AsyncSession, *, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[JobPosting]:
+    query = select(JobPosting).where(
+        JobPosting.status == "active",
+        JobPosting.expires_at > datetime.utcnow()
+    )
+    return (await db.execute(JOB_ORDER.apply(query, skip=skip, limit=limit, cursor=cursor))).scalars().all()
+
+async def search_jobs(db: AsyncSession, **params: Any) -> Dict[str, Any]:
+    return search_result((await db.execute(search_jobs_statement(**params))).all())
+
+async def get_jobs_by_recruiter(
+    db: AsyncSession, *, recruiter_id: UUID, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+) -> List[JobPosting]:
+    query = select(JobPosting).where(
+        JobPosting.recruiter_id == recruiter_id
+    )
+    return (await db.execute(JOB_ORDER.apply(query, skip=skip, limit=limit, cursor=cursor))).scalars().all()
+
+async def update_job(
+    db: AsyncSession, *, job: JobPosting, job_update: JobPostingUpdate, background_tasks: Optional[BackgroundTasks] = None
+) -> JobPosting:
+    update_data = job_update.dict(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(job, field, value)
+    
+    rescore = needs_rescore(update_data)
+    if rescore and background_tasks is None:
+        # No request to defer to: rescore the job's candidates in the same transaction
+        await db.execute(rescore_statement(job_id=job.id, skill_weights=job.skill_weights, cutoff_percentage=job.cutoff_percentage))
+    
+    await db.commit()
+    await run_in_threadpool(job_cache.invalidate_job, job.id)
+    if rescore and background_tasks is None:
+        await candidate_ranks.invalidate_async(job.id)
+    elif rescore:
+        # After the response, from the committed weights and cutoff
+        background_tasks.add_task(rescore_in_background_async, job.id)
+    return job
+
+async def delete_job(db: AsyncSession, *, job_id: UUID) -> None:
+    job = await get_job(db, job_id=job_id)
+    if job:
+        await db.delete(job)
+        await db.commit()
+        await run_in_threadpool(job_cache.invalidate_job, job_id)
@@ -0,0 +1,15 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.models.user import User
+from app.schemas.user import UserUpdate
+from app.services.user_cache import invalidate_user
+
+async def update_user(db: AsyncSession, *, user: User, user_update: UserUpdate) -> User:
+    update_data = user_update.dict(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(user, field, value)
+    
+    await db.commit()
+    await run_in_threadpool(invalidate_user, user.id)
+    return user
@@ -1,34 +1,65 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import select, true
 from sqlalchemy.orm import Session
 from uuid import UUID
 
+from app.core.pagination import Keyset
 from app.models.application import JobApplication
 from app.models.job import JobPosting
 from app.schemas.application import JobApplicationCreate, JobApplicationUpdate
+from app.services import job_counters
+
+# Most recent first
+APPLICATION_ORDER = Keyset(JobApplication.applied_at, JobApplication.id)
 
 def create_application(db: Session, *, application_create: JobApplicationCreate, candidate_id: UUID) -> JobApplication:
     db_application = JobApplication(
-        **application_create.dict(),
+        **application_create.dict(exclude={"candidate_id"}),
         candidate_id=candidate_id,
     )
     db.add(db_application)
     
     # Update job application count
-    job = db.query(JobPosting).filter(JobPosting.id == application_create.job_id).first()
-    if job:
-        job.total_applications += 1
+    job_counters.increment(db, job_id=application_create.job_id, counter="total_applications")
     
     db.commit()
-    db.refresh(db_application)
     return db_application
 
 def get_application(db: Session, *, application_id: UUID) -> Optional[JobApplication]:
     return db.query(JobApplication).filter(JobApplication.id == application_id).first()
 
-def get_applications_by_user(db: Session, *, user_id: UUID, skip: int = 0, limit: int = 100) -> List[JobApplication]:
-    return db.query(JobApplication).filter(
+def application_for_user_statement(*, application_id: UUID, user_id: UUID, role: str):
+    """
+    One SELECT returning (application, allowed), with the ownership check
+    evaluated against the joined job instead of a lazy load of application.job.
+    """
+    if role == "recruiter":
+        allowed = JobPosting.recruiter_id == user_id
+    elif role == "candidate":
+        allowed = JobApplication.candidate_id == user_id
+    else:
+        allowed = true()
+    return (
+        select(JobApplication, allowed.label("allowed"))
+        .join(JobApplication.job)
+        .where(JobApplication.id == application_id)
+    )
+
+def get_application_for_user(
+    db: Session, *, application_id: UUID, user_id: UUID, role: str
+) -> Tuple[Optional[JobApplication], bool]:
+    row = db.execute(application_for_user_statement(application_id=application_id, user_id=user_id, role=role)).first()
+    if row is None:
+        return None, False
+    return row.JobApplication, bool(row.allowed)
+
+def get_applications_by_user(
+    db: Session, *, user_id: UUID, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+) -> List[JobApplication]:
+    query = db.query(JobApplication).filter(
         JobApplication.candidate_id == user_id
-    ).offset(skip).limit(limit).all()
+    )
+    return APPLICATION_ORDER.apply(query, skip=skip, limit=limit, cursor=cursor).all()
 
 def get_applications_by_job(
     db: Session, 
@@ -37,7 +68,8 @@ def get_applications_by_job(
     recruiter_id: UUID,
     skip: int = 0, 
     limit: int = 100,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    cursor: Optional[str] = None
 ) -> List[JobApplication]:
     # Verify recruiter owns the job
     job = db.query(JobPosting).filter(
@@ -53,7 +85,7 @@ def get_applications_by_job(
     if status:
         query = query.filter(JobApplication.status == status)
     
-    return query.offset(skip).limit(limit).all()
+    return APPLICATION_ORDER.apply(query, skip=skip, limit=limit, cursor=cursor).all()
 
 def update_application(db: Session, *, application: JobApplication, application_update: JobApplicationUpdate) -> JobApplication:
     update_data = application_update.dict(exclude_unset=True)
@@ -61,5 +93,4 @@ def update_application(db: Session, *, application: JobApplication, application_
         setattr(application, field, value)
     
     db.commit()
-    db.refresh(application)
     return application
\ No newline at end of file
@@ -1,16 +1,26 @@
 from typing import Optional
+from jose import jwt
 from sqlalchemy.orm import Session
-from app.core.security import verify_password, get_password_hash
+from app.core.config import settings
+from app.core.jwks import google_jwks
+from app.core.security import verify_and_update_password, get_password_hash
 from app.models.user import User
 from app.schemas.user import UserCreate
+from app.services.user_cache import invalidate_user
 import hashlib
 
 def authenticate_user(db: Session, *, email: str, password: str) -> Optional[User]:
     user = db.query(User).filter(User.email == email).first()
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    valid, new_hash = verify_and_update_password(password, user.hashed_password)
+    if not valid:
         return None
+    if new_hash:
+        # Stored hash used a different cost factor; upgrade it transparently
+        user.hashed_password = new_hash
+        db.commit()
+        invalidate_user(user.id)
     return user
 
 def create_user(db: Session, *, user_create: UserCreate) -> User:
@@ -29,15 +39,37 @@ def create_user(db: Session, *, user_create: UserCreate) -> User:
     )
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
     return db_user
 
+def get_or_create_google_user(db: Session, *, user_info: dict, role: str) -> User:
+    """
+    The user with the Google account's email, created on first sign-in.
+    Blocks on the database and the password hash, so async routes run it in
+    the thread pool.
+    """
+    user = db.query(User).filter(User.email == user_info["email"]).first()
+    if user:
+        return user
+    user_create = UserCreate(
+        email=user_info["email"],
+        name=user_info["name"],
+        role=role,
+        password="google_oauth"  # Placeholder, won't be used
+    )
+    user = create_user(db, user_create=user_create)
+    user.google_id = user_info["sub"]
+    user.avatar_url = user_info.get("picture")
+    user.is_verified = True
+    db.commit()
+    return user
+
 async def verify_google_token(token: str) -> dict:
     """
-    Verify Google OAuth token and return user info
+    Verify a Google ID token locally against the cached Google JWKS and
+    return the user info it carries
     """
     # Handle mock tokens for development
-    if token.startswith('mock_google_token_'):
+    if settings.ALLOW_MOCK_GOOGLE_TOKENS and token.startswith('mock_google_token_'):
         # Generate unique values based on the token to prevent database conflicts
         token_hash = hashlib.md5(token.encode()).hexdigest()[:8]
         unique_id = f"mock_user_id_{token_hash}"
@@ -50,12 +82,25 @@ async def verify_google_token(token: str) -> dict:
             "picture": "https://via.placeholder.com/150"
         }
     
-    # For real Google tokens, you would use httpx to verify with Google
-    # For now, we'll create a mock response for development
-    token_hash = hashlib.md5(token.encode()).hexdigest()[:8]
+    if not settings.GOOGLE_CLIENT_ID:
+        raise ValueError("GOOGLE_CLIENT_ID is not configured")
+    
+    header = jwt.get_unverified_header(token)
+    key = await google_jwks.get_key(header.get("kid"))
+    claims = jwt.decode(
+        token,
+        key,
+        algorithms=["RS256"],
+        audience=settings.GOOGLE_CLIENT_ID,
+        issuer=settings.GOOGLE_ISSUERS,
+        options={"verify_at_hash": False},
+    )
+    if not claims.get("email") or not claims.get("email_verified"):
+        raise ValueError("Google account email is not verified")
+    
     return {
-        "email": f"user_{token_hash}@gmail.com",
-        "name": f"Google User {token_hash}",
-        "sub": f"google_user_{token_hash}",
-        "picture": "https://via.placeholder.com/150"
-    }
\ No newline at end of file
+        "email": claims["email"],
+        "name": claims.get("name") or claims["email"],
+        "sub": claims["sub"],
+        "picture": claims.get("picture"),
+    }
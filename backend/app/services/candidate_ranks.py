@@ -0,0 +1,311 @@
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+import redis
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.singleflight import AsyncSingleFlight, SingleFlight
+from app.models.candidate import Candidate
+
+logger = logging.getLogger(__name__)
+
+# Per job, in Redis: a sorted set of candidate id -> weighted_score, a marker
+# saying the set holds every candidate, and a write counter that a rebuild
+# watches. Ordered like CANDIDATE_ORDER: score, then id, descending. Without
+# Redis, ranks are counted in SQL.
+REDIS_KEY_PREFIX = "recruitai:candidate_ranks:v1:"
+ZADD_BATCH_SIZE = 10000
+
+Entry = Tuple[Union[str, UUID], Union[str, UUID], float]  # job id, candidate id, weighted_score
+
+_flight = SingleFlight()
+_async_flight = AsyncSingleFlight()
+_stats = {"redis_reads": 0, "sql_reads": 0, "rebuilds": 0, "rebuild_races": 0, "errors": 0}
+
+def _keys(job_id: Union[str, UUID]) -> Tuple[str, str, str]:
+    key = f"{REDIS_KEY_PREFIX}{job_id}"
+    return key, key + ":ready", key + ":writes"
+
+def _error(action: str) -> None:
+    _stats["errors"] += 1
+    logger.warning("Redis unavailable for candidate rank %s", action, exc_info=True)
+
+def record(entries: Iterable[Entry]) -> None:
+    """
+    Add or move candidates in their jobs' rank sets after the write that set
+    their weighted_score commits. O(log n) per candidate.
+    """
+    client = get_redis()
+    if client is None:
+        return
+    by_job: Dict[str, Dict[str, float]] = {}
+    for job_id, candidate_id, score in entries:
+        by_job.setdefault(str(job_id), {})[str(candidate_id)] = float(score)
+    if not by_job:
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        for job_id, scores in by_job.items():
+            key, _, writes = _keys(job_id)
+            # Bumping the counter fails any rebuild that read the database before this write
+            pipe.incr(writes)
+            pipe.expire(writes, settings.CANDIDATE_RANK_TTL_SECONDS)
+            pipe.zadd(key, scores)
+            pipe.expire(key, settings.CANDIDATE_RANK_TTL_SECONDS)
+        pipe.execute()
+    except redis.RedisError:
+        _error("write")
+
+def invalidate(job_id: Union[str, UUID]) -> None:
+    """
+    Drop a job's rank set after a change that moves many of its candidates
+    (such as a rescore); the next read rebuilds it.
+    """
+    client = get_redis()
+    if client is None:
+        return
+    key, ready, writes = _keys(job_id)
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.incr(writes)
+        pipe.expire(writes, settings.CANDIDATE_RANK_TTL_SECONDS)
+        pipe.delete(key, ready)
+        pipe.execute()
+    except redis.RedisError:
+        _error("invalidation")
+
+async def record_async(entries: Iterable[Entry]) -> None:
+    if get_redis() is not None:
+        await run_in_threadpool(record, list(entries))
+
+async def invalidate_async(job_id: Union[str, UUID]) -> None:
+    if get_redis() is not None:
+        await run_in_threadpool(invalidate, job_id)
+
+def _write_token(job_id: Union[str, UUID]) -> Tuple[bool, Optional[bytes]]:
+    # (usable, write counter) read before loading the scores for a rebuild
+    try:
+        return True, get_redis().get(_keys(job_id)[2])
+    except redis.RedisError:
+        _error("read")
+        return False, None
+
+def _store(job_id: Union[str, UUID], token: Optional[bytes], rows: Sequence[Any]) -> bool:
+    """
+    Replace the job's rank set with rows (id, weighted_score) and mark it
+    ready, unless a candidate write landed since token was read.
+    """
+    key, ready, writes = _keys(job_id)
+    ttl = settings.CANDIDATE_RANK_TTL_SECONDS
+    try:
+        with get_redis().pipeline() as pipe:
+            pipe.watch(writes)
+            if pipe.get(writes) != token:
+                _stats["rebuild_races"] += 1
+                return False
+            pipe.multi()
+            pipe.delete(key)
+            for start in range(0, len(rows), ZADD_BATCH_SIZE):
+                pipe.zadd(key, {str(row.id): row.weighted_score for row in rows[start:start + ZADD_BATCH_SIZE]})
+            pipe.expire(key, ttl)
+            pipe.set(ready, 1, ex=ttl)
+            pipe.execute()
+    except redis.WatchError:
+        _stats["rebuild_races"] += 1
+        return False
+    except redis.RedisError:
+        _error("rebuild")
+        return False
+    _stats["rebuilds"] += 1
+    return True
+
+def _redis_rank(job_id: Union[str, UUID], score: float) -> Optional[Tuple[int, int, int]]:
+    # (higher, lower, total) in O(log n), or None when the set is not ready
+    key, ready, _ = _keys(job_id)
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.exists(ready)
+        pipe.zcount(key, f"({score!r}", "+inf")
+        pipe.zcount(key, "-inf", f"({score!r}")
+        pipe.zcard(key)
+        is_ready, higher, lower, total = pipe.execute()
+    except redis.RedisError:
+        _error("read")
+        return None
+    if not is_ready:
+        return None
+    _stats["redis_reads"] += 1
+    return higher, lower, total
+
+def _redis_ranking(job_id: Union[str, UUID], skip: int, limit: int) -> Optional[Tuple[int, List[Tuple[str, float, int]]]]:
+    # (total, [(candidate id, score, rank)]) in O(log n + limit), or None when the set is not ready
+    key, ready, _ = _keys(job_id)
+    try:
+        client = get_redis()
+        pipe = client.pipeline(transaction=False)
+        pipe.exists(ready)
+        pipe.zcard(key)
+        pipe.zrevrange(key, skip, skip + limit - 1, withscores=True)
+        is_ready, total, members = pipe.execute()
+        if not is_ready:
+            return None
+        higher = client.zcount(key, f"({members[0][1]!r}", "+inf") if members else 0
+    except redis.RedisError:
+        _error("read")
+        return None
+    _stats["redis_reads"] += 1
+    items: List[Tuple[str, float, int]] = []
+    for position, (member, score) in enumerate(members, skip):
+        if not items:
+            rank = higher + 1
+        elif score == items[-1][1]:
+            rank = items[-1][2]
+        else:
+            # Every candidate before this one scored higher
+            rank = position + 1
+        items.append((member.decode(), score, rank))
+    return total, items
+
+def scores_statement(job_id: Union[str, UUID]):
+    # Every candidate of the job, from ix_candidates_job_id_weighted_score
+    return select(Candidate.id, Candidate.weighted_score).where(Candidate.job_id == job_id)
+
+def rank_statement(*, job_id: Union[str, UUID], score: float):
+    """
+    SQL fallback: (higher, lower, total) for a score among the job's
+    candidates, counted over the job's index entries.
+    """
+    return select(
+        func.count().filter(Candidate.weighted_score > score),
+        func.count().filter(Candidate.weighted_score < score),
+        func.count(),
+    ).where(Candidate.job_id == job_id)
+
+def count_statement(job_id: Union[str, UUID]):
+    return select(func.count()).where(Candidate.job_id == job_id)
+
+def ranking_statement(*, job_id: Union[str, UUID], skip: int, limit: int):
+    # SQL fallback: one page of (id, weighted_score, rank, total), best first
+    return (
+        select(
+            Candidate.id,
+            Candidate.weighted_score,
+            func.rank().over(order_by=Candidate.weighted_score.desc()).label("rank"),
+            count_statement(job_id).scalar_subquery().label("total"),
+        )
+        .where(Candidate.job_id == job_id)
+        .order_by(Candidate.weighted_score.desc(), Candidate.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+
+def _sql_ranking(rows: Sequence[Any], total: Optional[int]) -> Tuple[int, List[Tuple[Any, float, int]]]:
+    return (rows[0].total if rows else total), [(row.id, row.weighted_score, row.rank) for row in rows]
+
+# A candidate's rank is 1 + the number of the job's candidates with a higher
+# weighted score, so equal scores share a rank
+def rank_payload(*, candidate_id: Union[str, UUID], job_id: Union[str, UUID], score: float, counts: Sequence[int]) -> Dict[str, Any]:
+    """CandidateRank from the (higher, lower, total) counts for the candidate's score"""
+    higher, lower, total = counts
+    rank = higher + 1
+    total = max(total, rank)  # counts the candidate itself if its write has not reached the index yet
+    return {
+        "candidate_id": candidate_id,
+        "job_id": job_id,
+        "weighted_score": score,
+        "rank": rank,
+        "total": total,
+        "percentile": 100.0 * lower / total,
+        "top_percent": 100.0 * rank / total,
+    }
+
+def ranking_payload(total: int, items: Sequence[Tuple[Any, float, int]]) -> Dict[str, Any]:
+    return {
+        "total": total,
+        "items": [{"candidate_id": candidate_id, "weighted_score": score, "rank": rank} for candidate_id, score, rank in items],
+    }
+
+def _rebuild(db: Session, job_id: Union[str, UUID]) -> bool:
+    def rebuild() -> bool:
+        usable, token = _write_token(job_id)
+        if not usable:
+            return False
+        return _store(job_id, token, db.execute(scores_statement(job_id)).all())
+    # Concurrent readers of a missing set in this process share one rebuild
+    return _flight.do(str(job_id), rebuild)
+
+async def _rebuild_async(db: AsyncSession, job_id: Union[str, UUID]) -> bool:
+    async def rebuild() -> bool:
+        usable, token = await run_in_threadpool(_write_token, job_id)
+        if not usable:
+            return False
+        rows = (await db.execute(scores_statement(job_id))).all()
+        return await run_in_threadpool(_store, job_id, token, rows)
+    return await _async_flight.do(str(job_id), rebuild)
+
+def get_rank(db: Session, *, job_id: Union[str, UUID], candidate_id: Union[str, UUID], score: float) -> Dict[str, Any]:
+    """
+    Rank and percentile of a candidate's weighted score within its job: from
+    the Redis rank set (rebuilt first if missing), or counted in SQL.
+    db should be a primary session, so a rebuild sees every committed write.
+    """
+    counts = None
+    if get_redis() is not None:
+        counts = _redis_rank(job_id, score)
+        if counts is None and _rebuild(db, job_id):
+            counts = _redis_rank(job_id, score)
+    if counts is None:
+        _stats["sql_reads"] += 1
+        counts = db.execute(rank_statement(job_id=job_id, score=score)).one()
+    return rank_payload(candidate_id=candidate_id, job_id=job_id, score=score, counts=counts)
+
+async def get_rank_async(
+    db: AsyncSession, *, job_id: Union[str, UUID], candidate_id: Union[str, UUID], score: float
+) -> Dict[str, Any]:
+    counts = None
+    if get_redis() is not None:
+        counts = await run_in_threadpool(_redis_rank, job_id, score)
+        if counts is None and await _rebuild_async(db, job_id):
+            counts = await run_in_threadpool(_redis_rank, job_id, score)
+    if counts is None:
+        _stats["sql_reads"] += 1
+        counts = (await db.execute(rank_statement(job_id=job_id, score=score))).one()
+    return rank_payload(candidate_id=candidate_id, job_id=job_id, score=score, counts=counts)
+
+def get_ranking(db: Session, *, job_id: Union[str, UUID], skip: int = 0, limit: int = 100) -> Dict[str, Any]:
+    """
+    A page of the job's candidates with their ranks, best first (top-K with
+    skip=0), read the same way as get_rank.
+    """
+    ranking = None
+    if get_redis() is not None:
+        ranking = _redis_ranking(job_id, skip, limit)
+        if ranking is None and _rebuild(db, job_id):
+            ranking = _redis_ranking(job_id, skip, limit)
+    if ranking is None:
+        _stats["sql_reads"] += 1
+        rows = db.execute(ranking_statement(job_id=job_id, skip=skip, limit=limit)).all()
+        # Past the last page the total needs its own count
+        ranking = _sql_ranking(rows, None if rows else db.execute(count_statement(job_id)).scalar_one())
+    return ranking_payload(*ranking)
+
+async def get_ranking_async(db: AsyncSession, *, job_id: Union[str, UUID], skip: int = 0, limit: int = 100) -> Dict[str, Any]:
+    ranking = None
+    if get_redis() is not None:
+        ranking = await run_in_threadpool(_redis_ranking, job_id, skip, limit)
+        if ranking is None and await _rebuild_async(db, job_id):
+            ranking = await run_in_threadpool(_redis_ranking, job_id, skip, limit)
+    if ranking is None:
+        _stats["sql_reads"] += 1
+        rows = (await db.execute(ranking_statement(job_id=job_id, skip=skip, limit=limit))).all()
+        ranking = _sql_ranking(rows, None if rows else (await db.execute(count_statement(job_id))).scalar_one())
+    return ranking_payload(*ranking)
+
+def stats() -> dict:
+    return dict(_stats)
@@ -1,25 +1,169 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from pydantic import ValidationError
+from sqlalchemy import case, exists, func, insert, or_, select, true, type_coerce, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, contains_eager
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from app.core.pagination import Keyset
 from app.models.candidate import Candidate
 from app.models.job import JobPosting
-from app.schemas.candidate import CandidateCreate, CandidateUpdate
+from app.schemas.candidate import BulkDecision, BulkRowError, CandidateCreate, CandidateUpdate
+from app.services import candidate_ranks, job_counters
+from app.services.scoring import score_columns
+
+# Best match first, served by the (job_id[, status], weighted_score, id) indexes
+CANDIDATE_ORDER = Keyset(Candidate.weighted_score, Candidate.id)
 
 def create_candidate(db: Session, *, candidate_create: CandidateCreate, user_id: UUID) -> Candidate:
+    job = db.query(JobPosting).filter(JobPosting.id == candidate_create.job_id).first()
+    if not job:
+        raise ValueError("Job not found")
+    
     db_candidate = Candidate(
         **candidate_create.dict(),
+        **score_columns(candidate_create.scores.dict(), job),
         user_id=user_id,
     )
     db.add(db_candidate)
     db.commit()
-    db.refresh(db_candidate)
+    candidate_ranks.record([(db_candidate.job_id, db_candidate.id, db_candidate.weighted_score)])
     return db_candidate
 
+def validate_bulk_rows(rows: Sequence[Tuple[int, Any]]) -> Tuple[List[Tuple[int, CandidateCreate]], List[BulkRowError]]:
+    """
+    Validate (index, raw) rows, where raw is a decoded JSON object or an
+    undecoded NDJSON line. Invalid rows become errors instead of raising.
+    """
+    valid, errors = [], []
+    for index, raw in rows:
+        try:
+            if isinstance(raw, (str, bytes)):
+                candidate = CandidateCreate.model_validate_json(raw)
+            else:
+                candidate = CandidateCreate.model_validate(raw)
+        except ValidationError as e:
+            errors.append(BulkRowError(
+                index=index,
+                errors=[{"loc": list(error["loc"]), "msg": error["msg"], "type": error["type"]} for error in e.errors()],
+            ))
+            continue
+        valid.append((index, candidate))
+    return valid, errors
+
+def bulk_jobs_statement(*, job_ids, recruiter_id: UUID):
+    # Rows may only target the importing recruiter's jobs
+    return select(JobPosting.id, JobPosting.skill_weights, JobPosting.cutoff_percentage).where(
+        JobPosting.id.in_(job_ids),
+        JobPosting.recruiter_id == recruiter_id,
+    )
+
+def bulk_insert_values(
+    valid: Sequence[Tuple[int, CandidateCreate]], jobs: Dict[UUID, Any]
+) -> Tuple[List[int], List[Dict[str, Any]], List[BulkRowError]]:
+    indexes, values, errors = [], [], []
+    for index, candidate in valid:
+        job = jobs.get(candidate.job_id)
+        if job is None:
+            errors.append(BulkRowError(index=index, errors=[{"loc": ["job_id"], "msg": "Job not found", "type": "not_found"}]))
+            continue
+        indexes.append(index)
+        # Ids are assigned here so inserted rows can be added to the rank index
+        values.append(dict(**candidate.dict(), **score_columns(candidate.scores.dict(), job), id=uuid4()))
+    return indexes, values, errors
+
+def rank_entries(values: Sequence[Dict[str, Any]]) -> List[candidate_ranks.Entry]:
+    return [(value["job_id"], value["id"], value["weighted_score"]) for value in values]
+
+def bulk_db_error(index: int, e: DBAPIError) -> BulkRowError:
+    return BulkRowError(index=index, errors=[{"loc": [], "msg": str(e.orig).strip(), "type": "db_error"}])
+
+def bulk_create_candidates(db: Session, *, rows: Sequence[Tuple[int, Any]], recruiter_id: UUID) -> Tuple[int, List[BulkRowError]]:
+    """
+    Validate and insert one chunk of rows for the recruiter's jobs with a
+    single batched executemany, committing the chunk. Returns the number
+    inserted and the per-row errors; bad rows never fail the rest.
+    """
+    valid, errors = validate_bulk_rows(rows)
+    job_ids = {candidate.job_id for _, candidate in valid}
+    jobs = {job.id: job for job in db.execute(bulk_jobs_statement(job_ids=job_ids, recruiter_id=recruiter_id))} if job_ids else {}
+    indexes, values, value_errors = bulk_insert_values(valid, jobs)
+    errors += value_errors
+    if not values:
+        return 0, errors
+
+    inserted = []
+    try:
+        with db.begin_nested():
+            db.execute(insert(Candidate), values)
+        inserted = values
+    except DBAPIError:
+        # Something in the batch was rejected by the database; retry row by
+        # row to keep the good rows and report the bad ones
+        for index, value in zip(indexes, values):
+            try:
+                with db.begin_nested():
+                    db.execute(insert(Candidate), [value])
+                inserted.append(value)
+            except DBAPIError as e:
+                errors.append(bulk_db_error(index, e))
+    db.commit()
+    candidate_ranks.record(rank_entries(inserted))
+    return len(inserted), errors
+
 def get_candidate(db: Session, *, candidate_id: UUID) -> Optional[Candidate]:
     return db.query(Candidate).filter(Candidate.id == candidate_id).first()
 
+def candidate_for_user_statement(*, candidate_id: UUID, user_id: UUID, role: str):
+    """
+    One SELECT returning (candidate, allowed): the candidate with its job
+    loaded from the same join, and whether the user may access it.
+    """
+    if role == "recruiter":
+        # Recruiters can only access candidates for their jobs
+        allowed = JobPosting.recruiter_id == user_id
+    elif role == "candidate":
+        # Candidates can only access their own application
+        allowed = Candidate.user_id == user_id
+    else:
+        allowed = true()
+    return (
+        select(Candidate, allowed.label("allowed"))
+        .join(Candidate.job)
+        .options(contains_eager(Candidate.job))
+        .where(Candidate.id == candidate_id)
+    )
+
+def get_candidate_for_user(db: Session, *, candidate_id: UUID, user_id: UUID, role: str) -> Tuple[Optional[Candidate], bool]:
+    row = db.execute(candidate_for_user_statement(candidate_id=candidate_id, user_id=user_id, role=role)).first()
+    if row is None:
+        return None, False
+    return row.Candidate, bool(row.allowed)
+
+def candidates_version_statement(*, job_id: UUID, recruiter_id: UUID):
+    """
+    One SELECT returning (owned, count, latest updated_at) for a job's
+    candidates, answered from ix_candidates_job_id_updated_at: the version
+    behind the candidate list ETag.
+    """
+    owned = exists().where(JobPosting.id == job_id, JobPosting.recruiter_id == recruiter_id)
+    return select(owned.label("owned"), func.count(), func.max(Candidate.updated_at)).where(Candidate.job_id == job_id)
+
+def get_candidates_version(db: Session, *, job_id: UUID, recruiter_id: UUID) -> Tuple[Any, ...]:
+    return tuple(db.execute(candidates_version_statement(job_id=job_id, recruiter_id=recruiter_id)).one())
+
+def get_candidate_rank(db: Session, *, candidate: Candidate) -> Dict[str, Any]:
+    return candidate_ranks.get_rank(db, job_id=candidate.job_id, candidate_id=candidate.id, score=candidate.weighted_score)
+
+def get_candidate_ranking(
+    db: Session, *, job_id: UUID, recruiter_id: UUID, skip: int = 0, limit: int = 100
+) -> Optional[Dict[str, Any]]:
+    # None when the recruiter does not own the job
+    if not db.query(JobPosting.id).filter(JobPosting.id == job_id, JobPosting.recruiter_id == recruiter_id).first():
+        return None
+    return candidate_ranks.get_ranking(db, job_id=job_id, skip=skip, limit=limit)
+
 def get_candidates_by_job(
     db: Session, 
     *, 
@@ -28,7 +172,9 @@ def get_candidates_by_job(
     skip: int = 0, 
     limit: int = 100,
     status: Optional[str] = None,
-    min_score: float = 0
+    min_score: float = 0,
+    min_weighted_score: float = 0,
+    cursor: Optional[str] = None
 ) -> List[Candidate]:
     # Verify recruiter owns the job
     job = db.query(JobPosting).filter(
@@ -45,68 +191,180 @@ def get_candidates_by_job(
         query = query.filter(Candidate.status == status)
     
     if min_score > 0:
-        query = query.filter(Candidate.scores["overall"].astext.cast(db.Float) >= min_score)
+        query = query.filter(Candidate.overall_score >= min_score)
+    
+    if min_weighted_score > 0:
+        query = query.filter(Candidate.weighted_score >= min_weighted_score)
     
-    return query.offset(skip).limit(limit).all()
+    return CANDIDATE_ORDER.apply(query, skip=skip, limit=limit, cursor=cursor).all()
 
 def update_candidate(db: Session, *, candidate: Candidate, candidate_update: CandidateUpdate) -> Candidate:
     update_data = candidate_update.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(candidate, field, value)
     
+    if update_data.get("scores"):
+        for field, value in score_columns(update_data["scores"], candidate.job).items():
+            setattr(candidate, field, value)
+    
     db.commit()
-    db.refresh(candidate)
+    if update_data.get("scores"):
+        candidate_ranks.record([(candidate.job_id, candidate.id, candidate.weighted_score)])
     return candidate
 
-def select_candidate(db: Session, *, candidate_id: UUID, recruiter_id: UUID) -> Candidate:
-    candidate = get_candidate(db=db, candidate_id=candidate_id)
-    if not candidate:
-        raise ValueError("Candidate not found")
-    
-    # Verify recruiter owns the job
-    job = db.query(JobPosting).filter(
-        JobPosting.id == candidate.job_id,
-        JobPosting.recruiter_id == recruiter_id
+# Bulk decision -> (new status, job counter it increments)
+DECISIONS = {
+    "select": ("selected", "selected_candidates"),
+    "reject": ("rejected", "rejected_candidates"),
+    "waitlist": ("waitlisted", None),
+}
+COUNTED_STATUSES = {"selected": "selected_candidates", "rejected": "rejected_candidates"}
+
+def _decision_values(status: str, reason: Optional[str]) -> Dict[str, Any]:
+    values = {"status": status, "reviewed_at": datetime.utcnow()}
+    if reason:
+        # Merged by the database into existing feedback, keeping its other
+        # keys. NULL or empty feedback is left as is: a bare
+        # {"rejection_reason": ...} would not be a valid Feedback.
+        feedback = Candidate.__table__.c.feedback
+        values["feedback"] = case(
+            (or_(feedback.is_(None), feedback == type_coerce({}, feedback.type)), feedback),
+            else_=feedback.op("||")(type_coerce({"rejection_reason": reason}, feedback.type)),
+        )
+    return values
+
+def decision_statement(*, candidate_id: UUID, recruiter_id: UUID, status: str, reason: Optional[str] = None):
+    """
+    UPDATE ... RETURNING (candidate, previous status) that records a decision
+    only when the recruiter owns the candidate's job. As in
+    bulk_decision_statement, a CTE locks the row and keeps its status from
+    before the update, and a candidate already in the target status is left
+    alone. No row back means not found, not authorized or already decided.
+    """
+    previous = (
+        select(Candidate.id, Candidate.status)
+        .where(
+            Candidate.id == candidate_id,
+            Candidate.status != status,
+            Candidate.job.has(JobPosting.recruiter_id == recruiter_id),
+        )
+        .with_for_update()
+        .cte("previous")
+    )
+    return (
+        update(Candidate)
+        .where(Candidate.id == previous.c.id)
+        .values(_decision_values(status, reason))
+        .returning(Candidate, previous.c.status.label("previous_status"))
+        .execution_options(populate_existing=True)
+    )
+
+def _decide(db: Session, *, candidate_id: UUID, recruiter_id: UUID, decision: str, reason: Optional[str] = None) -> Candidate:
+    status, _ = DECISIONS[decision]
+    row = db.execute(
+        decision_statement(candidate_id=candidate_id, recruiter_id=recruiter_id, status=status, reason=reason)
     ).first()
-    
-    if not job:
-        raise ValueError("Not authorized")
-    
-    candidate.status = "selected"
-    candidate.reviewed_at = datetime.utcnow()
+    if not row:
+        db.rollback()
+        candidate = get_candidate(db, candidate_id=candidate_id)
+        if not candidate:
+            raise ValueError("Candidate not found")
+        if candidate.job.recruiter_id != recruiter_id:
+            raise ValueError("Not authorized")
+        # Already in this status; the job counters already count it
+        return candidate
+    candidate, previous_status = row
     
     # Update job metrics
-    job.selected_candidates += 1
+    job_counters.apply(db, job_id=candidate.job_id, deltas=decision_counter_deltas(decision, [previous_status]))
     
     db.commit()
-    db.refresh(candidate)
     return candidate
 
+def select_candidate(db: Session, *, candidate_id: UUID, recruiter_id: UUID) -> Candidate:
+    return _decide(db, candidate_id=candidate_id, recruiter_id=recruiter_id, decision="select")
+
 def reject_candidate(db: Session, *, candidate_id: UUID, recruiter_id: UUID, reason: Optional[str] = None) -> Candidate:
-    candidate = get_candidate(db=db, candidate_id=candidate_id)
-    if not candidate:
-        raise ValueError("Candidate not found")
-    
-    # Verify recruiter owns the job
-    job = db.query(JobPosting).filter(
-        JobPosting.id == candidate.job_id,
-        JobPosting.recruiter_id == recruiter_id
-    ).first()
-    
-    if not job:
-        raise ValueError("Not authorized")
-    
-    candidate.status = "rejected"
-    candidate.reviewed_at = datetime.utcnow()
-    
-    if reason and candidate.feedback:
-        feedback = candidate.feedback.copy()
-        feedback["rejection_reason"] = reason
-        candidate.feedback = feedback
+    return _decide(db, candidate_id=candidate_id, recruiter_id=recruiter_id, decision="reject", reason=reason)
+
+def bulk_decision_statement(*, job_id: UUID, recruiter_id: UUID, decision: BulkDecision):
+    """
+    One UPDATE ... RETURNING (id, previous status) applying a decision to the
+    job's candidates picked by id and/or weighted score. A CTE locks the rows
+    and keeps their status from before the update, so job counters can be
+    moved by exact amounts. Candidates already in the target status are left
+    alone.
+    """
+    if decision.decision not in DECISIONS:
+        raise ValueError(f"Unknown decision {decision.decision!r}")
+    if decision.candidate_ids is None and decision.weighted_score_below is None and decision.weighted_score_at_least is None:
+        raise ValueError("Select candidates by candidate_ids or a weighted score bound")
+    status, _ = DECISIONS[decision.decision]
+
+    candidates = Candidate.__table__
+    owned_job = [JobPosting.id == job_id, JobPosting.recruiter_id == recruiter_id]
+    if decision.decision == "waitlist":
+        owned_job.append(JobPosting.enable_waitlist.is_(True))
+    criteria = [
+        candidates.c.job_id == job_id,
+        candidates.c.status != status,
+        exists().where(*owned_job),
+    ]
+    if decision.candidate_ids is not None:
+        criteria.append(candidates.c.id.in_(decision.candidate_ids))
+    if decision.weighted_score_below is not None:
+        criteria.append(candidates.c.weighted_score < decision.weighted_score_below)
+    if decision.weighted_score_at_least is not None:
+        criteria.append(candidates.c.weighted_score >= decision.weighted_score_at_least)
+    if decision.status:
+        criteria.append(candidates.c.status == decision.status)
+
+    # FOR UPDATE: a concurrent decision on the same rows waits, and the
+    # status read here is the one this UPDATE replaces
+    previous = select(candidates.c.id, candidates.c.status).where(*criteria).with_for_update().cte("previous")
+    reason = decision.reason if decision.decision == "reject" else None
+    return (
+        update(candidates)
+        .where(candidates.c.id == previous.c.id)
+        .values(_decision_values(status, reason))
+        .returning(candidates.c.id, previous.c.status)
+    )
+
+def decision_counter_deltas(decision: str, previous_statuses: Sequence[str]) -> Dict[str, int]:
+    _, counter = DECISIONS[decision]
+    deltas: Dict[str, int] = {}
+    for previous_status in previous_statuses:
+        if counter:
+            deltas[counter] = deltas.get(counter, 0) + 1
+        # Moving out of selected/rejected takes the candidate off that count
+        if previous_status in COUNTED_STATUSES:
+            deltas[COUNTED_STATUSES[previous_status]] = deltas.get(COUNTED_STATUSES[previous_status], 0) - 1
+    return {counter: delta for counter, delta in deltas.items() if delta}
+
+def bulk_decision_error(job: Optional[Tuple[Any, ...]], decision: BulkDecision) -> Optional[str]:
+    # Explains an UPDATE that matched nothing: (enable_waitlist,) of the owned job, or None
+    if job is None:
+        return "Job not found"
+    if decision.decision == "waitlist" and not job.enable_waitlist:
+        return "Waitlist is not enabled for this job"
+    return None
+
+def decide_candidates(db: Session, *, job_id: UUID, recruiter_id: UUID, decision: BulkDecision) -> List[UUID]:
+    """
+    Apply a select/reject/waitlist decision to many candidates of a job and
+    move the job counters by the affected rows. Returns the updated ids.
+    """
+    rows = db.execute(bulk_decision_statement(job_id=job_id, recruiter_id=recruiter_id, decision=decision)).all()
+    if not rows:
+        db.rollback()
+        job = db.query(JobPosting.enable_waitlist).filter(JobPosting.id == job_id, JobPosting.recruiter_id == recruiter_id).first()
+        error = bulk_decision_error(job, decision)
+        if error:
+            raise ValueError(error)
+        return []
     
     # Update job metrics
-    job.rejected_candidates += 1
+    job_counters.apply(db, job_id=job_id, deltas=decision_counter_deltas(decision.decision, [row.status for row in rows]))
     
     db.commit()
-    db.refresh(candidate)
-    return candidate
\ No newline at end of file
+    return [row.id for row in rows]
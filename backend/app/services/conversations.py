@@ -1,37 +1,131 @@
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import func, insert, select, true
+from sqlalchemy.orm import Session, selectinload
 from datetime import datetime
 from uuid import UUID
 from fastapi import UploadFile
 
+from app.core.config import settings
 from app.models.conversation import Conversation, ConversationMessage
+from app.models.job import JobPosting
 from app.schemas.conversation import ConversationCreate, MessageCreate
+from app.services import message_archive, message_buffer
 
 def create_conversation(db: Session, *, conversation_create: ConversationCreate, candidate_id: UUID) -> Conversation:
     db_conversation = Conversation(
         candidate_id=candidate_id,
         job_id=conversation_create.job_id,
+        messages=[],
     )
     db.add(db_conversation)
     db.commit()
-    db.refresh(db_conversation)
     return db_conversation
 
-def get_conversation(db: Session, *, conversation_id: UUID) -> Optional[Conversation]:
-    return db.query(Conversation).filter(Conversation.id == conversation_id).first()
+def get_conversation(db: Session, *, conversation_id: UUID, with_messages: bool = False) -> Optional[Conversation]:
+    if with_messages:
+        flush_buffered_messages(conversation_id=conversation_id)
+    query = db.query(Conversation).filter(Conversation.id == conversation_id)
+    if with_messages:
+        query = query.options(selectinload(Conversation.messages))
+    conversation = query.first()
+    if conversation and with_messages:
+        message_archive.rehydrate(conversation)
+    return conversation
+
+def _allowed(*, user_id: UUID, role: str):
+    if role == "candidate":
+        return Conversation.candidate_id == user_id
+    if role == "recruiter":
+        return JobPosting.recruiter_id == user_id
+    return true()
+
+def conversation_for_user_statement(*, conversation_id: UUID, user_id: UUID, role: str):
+    """
+    SELECT returning (conversation, allowed) with the ownership check joined
+    in, and the messages fetched by one extra IN query rather than lazily
+    during serialization.
+    """
+    allowed = _allowed(user_id=user_id, role=role)
+    return (
+        select(Conversation, allowed.label("allowed"))
+        .join(Conversation.job)
+        .options(selectinload(Conversation.messages))
+        .where(Conversation.id == conversation_id)
+    )
+
+def get_conversation_for_user(
+    db: Session, *, conversation_id: UUID, user_id: UUID, role: str
+) -> Tuple[Optional[Conversation], bool]:
+    flush_buffered_messages(conversation_id=conversation_id)
+    row = db.execute(conversation_for_user_statement(conversation_id=conversation_id, user_id=user_id, role=role)).first()
+    if row is None:
+        return None, False
+    if row.allowed:
+        message_archive.rehydrate(row.Conversation)
+    return row.Conversation, bool(row.allowed)
+
+def conversation_version_statement(*, conversation_id: UUID, user_id: UUID, role: str):
+    """
+    One SELECT returning (allowed, updated_at, message count, latest message
+    timestamp) without loading the transcript: the version behind the
+    conversation ETag. Archiving moves messages out and sets updated_at.
+    """
+    in_conversation = ConversationMessage.conversation_id == Conversation.id
+    return (
+        select(
+            _allowed(user_id=user_id, role=role).label("allowed"),
+            Conversation.updated_at,
+            select(func.count()).where(in_conversation).scalar_subquery(),
+            select(func.max(ConversationMessage.timestamp)).where(in_conversation).scalar_subquery(),
+        )
+        .join(Conversation.job)
+        .where(Conversation.id == conversation_id)
+    )
+
+def get_conversation_version(
+    db: Session, *, conversation_id: UUID, user_id: UUID, role: str
+) -> Tuple[Optional[Tuple], bool]:
+    flush_buffered_messages(conversation_id=conversation_id)
+    row = db.execute(conversation_version_statement(conversation_id=conversation_id, user_id=user_id, role=role)).first()
+    if row is None:
+        return None, False
+    return tuple(row[1:]), bool(row.allowed)
+
+def flush_buffered_messages(*, conversation_id: UUID) -> None:
+    # Reads include messages still queued in this process's buffer
+    if settings.CONVERSATION_MESSAGE_BUFFER and message_buffer.has_pending(conversation_id):
+        message_buffer.flush(conversation_id=conversation_id)
+
+def add_messages_statement():
+    """
+    INSERT ... RETURNING executed with one parameter set per message: sent as
+    a single multi-row statement, the rows coming back in the order given
+    """
+    return insert(ConversationMessage).returning(ConversationMessage, sort_by_parameter_order=True)
+
+def message_rows(conversation_id: UUID, messages_create: Sequence[MessageCreate]) -> List[dict]:
+    return [dict(conversation_id=conversation_id, **message_create.model_dump()) for message_create in messages_create]
+
+def add_messages(db: Session, *, conversation_id: UUID, messages_create: Sequence[MessageCreate]) -> List[ConversationMessage]:
+    if settings.CONVERSATION_MESSAGE_BUFFER:
+        return message_buffer.enqueue(conversation_id=conversation_id, messages_create=messages_create)
+    messages = db.execute(add_messages_statement(), message_rows(conversation_id, messages_create)).scalars().all()
+    db.commit()
+    return messages
 
 def add_message(db: Session, *, conversation_id: UUID, message_create: MessageCreate) -> ConversationMessage:
+    if settings.CONVERSATION_MESSAGE_BUFFER:
+        return message_buffer.enqueue(conversation_id=conversation_id, messages_create=[message_create])[0]
     db_message = ConversationMessage(
         conversation_id=conversation_id,
         **message_create.dict(),
     )
     db.add(db_message)
     db.commit()
-    db.refresh(db_message)
     return db_message
 
 def end_conversation(db: Session, *, conversation_id: UUID) -> Conversation:
-    conversation = get_conversation(db=db, conversation_id=conversation_id)
+    conversation = get_conversation(db=db, conversation_id=conversation_id, with_messages=True)
     if not conversation:
         raise ValueError("Conversation not found")
     
@@ -48,7 +142,6 @@ def end_conversation(db: Session, *, conversation_id: UUID) -> Conversation:
     }
     
     db.commit()
-    db.refresh(conversation)
     return conversation
 
 def process_audio_message(db: Session, *, conversation_id: UUID, audio_file: UploadFile) -> ConversationMessage:
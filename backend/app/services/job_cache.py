@@ -0,0 +1,168 @@
+import json
+import logging
+from contextlib import nullcontext
+from typing import Any, AsyncContextManager, Awaitable, Callable, ContextManager, Dict, Optional, Union
+from uuid import UUID
+
+import redis
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import async_primary_session, primary_session
+from app.core.etag import content_etag
+from app.core.redis import get_redis
+from app.core.singleflight import AsyncSingleFlight, SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Public job payloads (JobPostingPublic dicts) and active-job listing pages,
+# each stored with its ETag, in a per-process LRU in front of Redis. Writes to a job invalidate its entry
+# and every listing page; counters such as total_applications are not
+# invalidated and may lag by up to JOB_CACHE_TTL_SECONDS + JOB_CACHE_LOCAL_TTL_SECONDS.
+
+# v2: entries are {"etag", "payload"} rather than bare payloads
+REDIS_KEY_PREFIX = "recruitai:jobs:v2:"
+REDIS_PAGES_KEY = "recruitai:jobs:v2:pages"  # set of cached listing page keys
+
+_jobs = TTLCache(maxsize=settings.JOB_CACHE_MAX_SIZE, ttl=settings.JOB_CACHE_LOCAL_TTL_SECONDS)
+_pages = TTLCache(maxsize=settings.JOB_CACHE_MAX_SIZE, ttl=settings.JOB_CACHE_LOCAL_TTL_SECONDS)
+_flight = SingleFlight()
+_async_flight = AsyncSingleFlight()
+_redis_stats = {"hits": 0, "misses": 0, "errors": 0}
+
+def job_key(job_id: Union[str, UUID]) -> str:
+    return f"job:{job_id}"
+
+def active_page_key(*, skip: int, limit: int, cursor: Optional[str]) -> str:
+    # No cursor (plain list) and an empty cursor (first page envelope) differ
+    return f"page:active:{skip}:{limit}:{'-' if cursor is None else cursor}"
+
+def entry(payload: Any) -> Optional[Dict[str, Any]]:
+    # The ETag is hashed once per fill, not per request
+    if payload is None:
+        return None
+    return {"etag": content_etag(payload), "payload": payload}
+
+def _local(key: str) -> TTLCache:
+    return _pages if key.startswith("page:") else _jobs
+
+def _redis_get(key: str) -> Optional[Any]:
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        raw = client.get(REDIS_KEY_PREFIX + key)
+    except redis.RedisError:
+        _redis_stats["errors"] += 1
+        logger.warning("Redis unavailable for job cache read", exc_info=True)
+        return None
+    if raw is None:
+        _redis_stats["misses"] += 1
+        return None
+    _redis_stats["hits"] += 1
+    return json.loads(raw)
+
+def _redis_set(key: str, value: Any) -> None:
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        pipe = client.pipeline()
+        pipe.set(REDIS_KEY_PREFIX + key, json.dumps(value), ex=settings.JOB_CACHE_TTL_SECONDS)
+        if key.startswith("page:"):
+            pipe.sadd(REDIS_PAGES_KEY, REDIS_KEY_PREFIX + key)
+            pipe.expire(REDIS_PAGES_KEY, settings.JOB_CACHE_TTL_SECONDS)
+        pipe.execute()
+    except redis.RedisError:
+        _redis_stats["errors"] += 1
+        logger.warning("Redis unavailable for job cache write", exc_info=True)
+
+def _fill(key: str, value: Any) -> Any:
+    # Not-found results are not cached
+    if value is not None:
+        _local(key).set(key, value)
+    return value
+
+def fill_session(db: Session) -> ContextManager[Session]:
+    """
+    Session for a load passed to get_or_load. Cached loads read the primary:
+    filled from a lagging replica, an entry that a write just invalidated
+    would be put back for the whole TTL.
+    """
+    return primary_session(db) if settings.JOB_CACHE_ENABLED else nullcontext(db)
+
+def fill_session_async(db: AsyncSession) -> AsyncContextManager[AsyncSession]:
+    return async_primary_session(db) if settings.JOB_CACHE_ENABLED else nullcontext(db)
+
+def get_or_load(key: str, load: Callable[[], Any]) -> Any:
+    """
+    Return the cached payload for key from the local tier, then Redis, then
+    load(). Concurrent misses for a key in this process share one load.
+    """
+    if not settings.JOB_CACHE_ENABLED:
+        return load()
+    value = _local(key).get(key)
+    if value is not None:
+        return value
+
+    def fill() -> Any:
+        value = _redis_get(key)
+        if value is None:
+            value = load()
+            if value is not None:
+                _redis_set(key, value)
+        return _fill(key, value)
+
+    return _flight.do(key, fill)
+
+async def get_or_load_async(key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    get_or_load for the async API; Redis calls run in the thread pool.
+    """
+    if not settings.JOB_CACHE_ENABLED:
+        return await load()
+    value = _local(key).get(key)
+    if value is not None:
+        return value
+
+    async def fill() -> Any:
+        value = await run_in_threadpool(_redis_get, key) if get_redis() is not None else None
+        if value is None:
+            value = await load()
+            if value is not None and get_redis() is not None:
+                await run_in_threadpool(_redis_set, key, value)
+        return _fill(key, value)
+
+    return await _async_flight.do(key, fill)
+
+def invalidate_job(job_id: Union[str, UUID]) -> None:
+    """
+    Drop a job and all listing pages from every cache tier. Call after the
+    change is committed. Other workers' local tiers expire within
+    JOB_CACHE_LOCAL_TTL_SECONDS.
+    """
+    key = job_key(job_id)
+    _jobs.delete(key)
+    _pages.clear()
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        pages = client.smembers(REDIS_PAGES_KEY)
+        client.delete(REDIS_KEY_PREFIX + key, REDIS_PAGES_KEY, *pages)
+    except redis.RedisError:
+        _redis_stats["errors"] += 1
+        logger.warning("Redis unavailable for job cache invalidation", exc_info=True)
+
+def stats() -> Dict[str, Any]:
+    return {
+        "enabled": settings.JOB_CACHE_ENABLED,
+        "local_jobs": _jobs.stats(),
+        "local_pages": _pages.stats(),
+        "single_flight": _flight.stats(),
+        "async_single_flight": _async_flight.stats(),
+        "redis": dict(_redis_stats, enabled=get_redis() is not None),
+    }
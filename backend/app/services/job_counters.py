@@ -0,0 +1,231 @@
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, Optional, Union
+from uuid import UUID
+
+import redis
+from sqlalchemy import event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.redis import get_redis
+from app.models.application import JobApplication
+from app.models.candidate import Candidate
+from app.models.job import JobPosting
+
+logger = logging.getLogger(__name__)
+
+COUNTERS = ("total_applications", "selected_candidates", "rejected_candidates")
+
+REDIS_KEY_PREFIX = "recruitai:job_counters:"
+REDIS_DIRTY_KEY = "recruitai:job_counters:dirty"
+FLUSH_BATCH_SIZE = 500
+
+Deltas = Dict[str, Dict[str, int]]  # job id -> counter -> delta
+
+_pending: Deltas = defaultdict(lambda: defaultdict(int))
+_lock = threading.Lock()
+_stop = threading.Event()
+_flusher: Optional[threading.Thread] = None
+_stats = {"buffered": 0, "flushes": 0, "flushed_jobs": 0, "flush_errors": 0, "redis_errors": 0}
+
+def _increment_statement(job_id: Union[str, UUID], deltas: Dict[str, int]):
+    # Evaluated by the database: concurrent increments never overwrite each other
+    values = {getattr(JobPosting, counter): getattr(JobPosting, counter) + delta for counter, delta in deltas.items()}
+    return (
+        update(JobPosting)
+        .where(JobPosting.id == job_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+
+def _defer(db: Session, job_id: Union[str, UUID], counter: str, n: int) -> None:
+    # Deltas ride on the session and are buffered only once it commits
+    deltas = db.info.setdefault("job_counter_deltas", defaultdict(lambda: defaultdict(int)))
+    deltas[str(job_id)][counter] += n
+
+def _check_counters(deltas: Dict[str, int]) -> None:
+    for counter in deltas:
+        if counter not in COUNTERS:
+            raise ValueError(f"Unknown job counter {counter!r}")
+
+def apply(db: Session, *, job_id: Union[str, UUID], deltas: Dict[str, int]) -> None:
+    """
+    Add each delta to its job counter with one UPDATE in the caller's
+    transaction, or, in write-behind mode, buffer them once it commits.
+    """
+    _check_counters(deltas)
+    if not deltas:
+        return
+    if settings.JOB_COUNTERS_WRITE_BEHIND:
+        for counter, n in deltas.items():
+            _defer(db, job_id, counter, n)
+    else:
+        db.execute(_increment_statement(job_id, deltas))
+
+async def apply_async(db: AsyncSession, *, job_id: Union[str, UUID], deltas: Dict[str, int]) -> None:
+    _check_counters(deltas)
+    if not deltas:
+        return
+    if settings.JOB_COUNTERS_WRITE_BEHIND:
+        for counter, n in deltas.items():
+            _defer(db.sync_session, job_id, counter, n)
+    else:
+        await db.execute(_increment_statement(job_id, deltas))
+
+def increment(db: Session, *, job_id: Union[str, UUID], counter: str, n: int = 1) -> None:
+    apply(db, job_id=job_id, deltas={counter: n})
+
+async def increment_async(db: AsyncSession, *, job_id: Union[str, UUID], counter: str, n: int = 1) -> None:
+    await apply_async(db, job_id=job_id, deltas={counter: n})
+
+@event.listens_for(Session, "after_commit")
+def _buffer_committed(session: Session) -> None:
+    deltas = session.info.pop("job_counter_deltas", None)
+    if deltas:
+        _buffer(deltas)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop("job_counter_deltas", None)
+
+def _buffer(deltas: Deltas) -> None:
+    client = get_redis()
+    if client is not None:
+        try:
+            pipe = client.pipeline()
+            for job_id, counters in deltas.items():
+                for counter, delta in counters.items():
+                    pipe.hincrby(REDIS_KEY_PREFIX + job_id, counter, delta)
+                pipe.sadd(REDIS_DIRTY_KEY, job_id)
+            pipe.execute()
+            _stats["buffered"] += len(deltas)
+            return
+        except redis.RedisError:
+            _stats["redis_errors"] += 1
+            logger.warning("Redis unavailable for job counters, buffering locally", exc_info=True)
+    with _lock:
+        for job_id, counters in deltas.items():
+            for counter, delta in counters.items():
+                _pending[job_id][counter] += delta
+    _stats["buffered"] += len(deltas)
+
+def _take_local() -> Deltas:
+    global _pending
+    with _lock:
+        taken, _pending = _pending, defaultdict(lambda: defaultdict(int))
+    return taken
+
+def _take_redis(client: redis.Redis) -> Deltas:
+    taken: Deltas = {}
+    job_ids = client.spop(REDIS_DIRTY_KEY, FLUSH_BATCH_SIZE) or []
+    for raw_id in job_ids:
+        job_id = raw_id.decode() if isinstance(raw_id, bytes) else raw_id
+        pipe = client.pipeline(transaction=True)
+        pipe.hgetall(REDIS_KEY_PREFIX + job_id)
+        pipe.delete(REDIS_KEY_PREFIX + job_id)
+        counters, _ = pipe.execute()
+        taken[job_id] = {
+            (key.decode() if isinstance(key, bytes) else key): int(value) for key, value in counters.items()
+        }
+    return taken
+
+def flush() -> int:
+    """
+    Apply buffered deltas with one UPDATE per job in a single transaction.
+    Returns the number of jobs updated; on failure the deltas are re-buffered.
+    """
+    taken = _take_local()
+    client = get_redis()
+    if client is not None:
+        try:
+            for job_id, counters in _take_redis(client).items():
+                for counter, delta in counters.items():
+                    taken.setdefault(job_id, defaultdict(int))[counter] += delta
+        except redis.RedisError:
+            _stats["redis_errors"] += 1
+            logger.warning("Redis unavailable while flushing job counters", exc_info=True)
+    taken = {job_id: {c: d for c, d in counters.items() if d} for job_id, counters in taken.items()}
+    taken = {job_id: counters for job_id, counters in taken.items() if counters}
+    if not taken:
+        return 0
+
+    db = SessionLocal()
+    try:
+        for job_id, counters in taken.items():
+            db.execute(_increment_statement(job_id, counters))
+        db.commit()
+    except Exception:
+        db.rollback()
+        _stats["flush_errors"] += 1
+        _buffer(taken)
+        raise
+    finally:
+        db.close()
+    _stats["flushes"] += 1
+    _stats["flushed_jobs"] += len(taken)
+    return len(taken)
+
+def _run() -> None:
+    while not _stop.wait(settings.JOB_COUNTERS_FLUSH_SECONDS):
+        try:
+            flush()
+        except Exception:
+            logger.warning("Job counter flush failed, will retry", exc_info=True)
+
+def start_job_counter_flusher() -> None:
+    global _flusher
+    if not settings.JOB_COUNTERS_WRITE_BEHIND or _flusher is not None:
+        return
+    _stop.clear()
+    _flusher = threading.Thread(target=_run, name="job-counter-flusher", daemon=True)
+    _flusher.start()
+
+def stop_job_counter_flusher() -> None:
+    global _flusher
+    _stop.set()
+    if _flusher is not None:
+        _flusher.join(timeout=5)
+        _flusher = None
+    if settings.JOB_COUNTERS_WRITE_BEHIND:
+        try:
+            flush()
+        except Exception:
+            logger.warning("Final job counter flush failed; run scripts/reconcile_job_counters.py", exc_info=True)
+
+def reconcile(db: Session, *, job_id: Optional[Union[str, UUID]] = None) -> int:
+    """
+    Recompute counters from the applications and candidates tables, for one
+    job or all of them. Returns the number of jobs updated.
+    """
+    def count(model, *criteria):
+        return (
+            select(func.count())
+            .select_from(model)
+            .where(model.job_id == JobPosting.id, *criteria)
+            .scalar_subquery()
+        )
+
+    statement = update(JobPosting).values(
+        total_applications=count(JobApplication),
+        selected_candidates=count(Candidate, Candidate.status == "selected"),
+        rejected_candidates=count(Candidate, Candidate.status == "rejected"),
+    ).execution_options(synchronize_session=False)
+    if job_id is not None:
+        statement = statement.where(JobPosting.id == job_id)
+    result = db.execute(statement)
+    db.commit()
+    return result.rowcount
+
+def stats() -> dict:
+    with _lock:
+        local_jobs = len(_pending)
+    return dict(
+        _stats,
+        write_behind=settings.JOB_COUNTERS_WRITE_BEHIND,
+        pending_local_jobs=local_jobs,
+        flusher_running=_flusher is not None and _flusher.is_alive(),
+    )
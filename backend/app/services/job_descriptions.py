@@ -0,0 +1,249 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.http import get_http_client
+from app.core.redis import get_redis
+from app.core.singleflight import AsyncSingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Generated descriptions are content-addressed: the key hashes the normalized
+# title and requirements with the prompt version and model, so a repeated
+# request is served from the per-process LRU, then the shared tier (Redis, or
+# JOB_DESCRIPTION_CACHE_DIR when Redis is disabled), and only then the model.
+# Bump PROMPT_VERSION whenever the prompt changes.
+
+PROMPT_VERSION = 1
+SYSTEM_PROMPT = (
+    "You write job descriptions for job postings. Given a job title and its required skills, "
+    "write an engaging description with a short introduction, a 'Key Responsibilities:' list, "
+    "a 'What We Offer:' list and a 'Required Skills and Experience:' list. "
+    "Use '•' bullets and plain text, no markdown headings."
+)
+
+REDIS_KEY_PREFIX = "recruitai:job-descriptions:"
+
+_local = TTLCache(maxsize=settings.JOB_DESCRIPTION_CACHE_MAX_SIZE, ttl=settings.JOB_DESCRIPTION_CACHE_TTL_SECONDS)
+_flight = AsyncSingleFlight()
+_stats = {"generated": 0, "shared_hits": 0, "fallbacks": 0, "shared_errors": 0}
+
+def normalize(title: str, requirements: List[str]) -> Tuple[str, List[str]]:
+    # Whitespace, requirement order and duplicates do not change the request
+    title = " ".join(title.split())
+    requirements = {" ".join(requirement.split()) for requirement in requirements} - {""}
+    return title, sorted(requirements, key=lambda requirement: (requirement.casefold(), requirement))
+
+def cache_key(title: str, requirements: List[str]) -> str:
+    """Key for already normalized input"""
+    material = json.dumps([PROMPT_VERSION, settings.LLM_MODEL, title, requirements], separators=(",", ":"))
+    return hashlib.sha256(material.encode()).hexdigest()
+
+def prompt_messages(title: str, requirements: List[str]) -> List[Dict[str, str]]:
+    skills = "\n".join(f"- {requirement}" for requirement in requirements) or "- (none given)"
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": f"Job title: {title}\nRequired skills:\n{skills}"},
+    ]
+
+async def _complete(title: str, requirements: List[str]) -> str:
+    # OpenAI-compatible chat completions; LLM_API_URL may point at scripts/fake_llm_server.py
+    headers = {"Authorization": f"Bearer {settings.OPENAI_API_KEY}"} if settings.OPENAI_API_KEY else {}
+    response = await get_http_client().post(
+        settings.LLM_API_URL.rstrip("/") + "/chat/completions",
+        json={"model": settings.LLM_MODEL, "messages": prompt_messages(title, requirements)},
+        headers=headers,
+        timeout=settings.LLM_TIMEOUT_SECONDS,
+    )
+    response.raise_for_status()
+    description = response.json()["choices"][0]["message"]["content"].strip()
+    if not description:
+        raise ValueError("Empty completion")
+    return description
+
+def _disk_path(key: str) -> str:
+    return os.path.join(settings.JOB_DESCRIPTION_CACHE_DIR, f"{key}.txt")
+
+def _disk_get(key: str) -> Optional[str]:
+    path = _disk_path(key)
+    try:
+        modified = os.stat(path).st_mtime
+        if modified + settings.JOB_DESCRIPTION_CACHE_TTL_SECONDS <= time.time():
+            os.remove(path)
+            return None
+        with open(path, encoding="utf-8") as f:
+            description = f.read()
+        # Access time orders eviction (LRU); mtime keeps the age for the TTL
+        os.utime(path, (time.time(), modified))
+        return description
+    except FileNotFoundError:
+        return None
+
+def _disk_prune() -> None:
+    directory = settings.JOB_DESCRIPTION_CACHE_DIR
+    entries = [entry for entry in os.scandir(directory) if entry.name.endswith(".txt")]
+    excess = len(entries) - settings.JOB_DESCRIPTION_CACHE_DISK_MAX_FILES
+    if excess <= 0:
+        return
+    for entry in sorted(entries, key=lambda entry: entry.stat().st_atime)[:excess]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+def _disk_set(key: str, description: str) -> None:
+    os.makedirs(settings.JOB_DESCRIPTION_CACHE_DIR, exist_ok=True)
+    path = _disk_path(key)
+    # Written whole and renamed, so readers never see a partial file
+    with open(f"{path}.{os.getpid()}.tmp", "w", encoding="utf-8") as f:
+        f.write(description)
+    os.replace(f"{path}.{os.getpid()}.tmp", path)
+    _disk_prune()
+
+def _shared_get(key: str) -> Optional[str]:
+    client = get_redis()
+    try:
+        if client is not None:
+            raw = client.get(REDIS_KEY_PREFIX + key)
+            return raw.decode() if raw is not None else None
+        if settings.JOB_DESCRIPTION_CACHE_DIR:
+            return _disk_get(key)
+    except (redis.RedisError, OSError):
+        _stats["shared_errors"] += 1
+        logger.warning("Job description cache read failed", exc_info=True)
+    return None
+
+def _shared_set(key: str, description: str) -> None:
+    client = get_redis()
+    try:
+        if client is not None:
+            client.set(REDIS_KEY_PREFIX + key, description, ex=settings.JOB_DESCRIPTION_CACHE_TTL_SECONDS)
+        elif settings.JOB_DESCRIPTION_CACHE_DIR:
+            _disk_set(key, description)
+    except (redis.RedisError, OSError):
+        _stats["shared_errors"] += 1
+        logger.warning("Job description cache write failed", exc_info=True)
+
+def _has_shared_tier() -> bool:
+    return get_redis() is not None or bool(settings.JOB_DESCRIPTION_CACHE_DIR)
+
+async def generate_job_description(title: str, requirements: List[str]) -> str:
+    """
+    Job description from the configured model, cached by content. Concurrent
+    identical requests in this process share one model call. Falls back to
+    the built-in template, uncached, when no model is configured or it fails.
+    """
+    if not settings.LLM_API_URL:
+        return template_description(title, requirements)
+    normalized_title, normalized_requirements = normalize(title, requirements)
+    key = cache_key(normalized_title, normalized_requirements)
+    description = _local.get(key)
+    if description is not None:
+        return description
+
+    async def fill() -> str:
+        description = await run_in_threadpool(_shared_get, key) if _has_shared_tier() else None
+        if description is not None:
+            _stats["shared_hits"] += 1
+        else:
+            description = await _complete(normalized_title, normalized_requirements)
+            _stats["generated"] += 1
+            if _has_shared_tier():
+                await run_in_threadpool(_shared_set, key, description)
+        _local.set(key, description)
+        return description
+
+    try:
+        return await _flight.do(key, fill)
+    except Exception:
+        _stats["fallbacks"] += 1
+        logger.warning("Job description generation failed, using the template", exc_info=True)
+        return template_description(title, requirements)
+
+def stats() -> Dict[str, Any]:
+    return dict(
+        _stats,
+        enabled=bool(settings.LLM_API_URL),
+        local=_local.stats(),
+        single_flight=_flight.stats(),
+        shared="redis" if get_redis() is not None else "disk" if settings.JOB_DESCRIPTION_CACHE_DIR else None,
+    )
+
+def template_description(title: str, requirements: List[str]) -> str:
+    """
+    Built-in job description, used when no LLM_API_URL is configured or the
+    model call fails
+    """
+    base_descriptions = {
+        "Frontend Developer": """We are seeking a talented Frontend Developer to join our dynamic team. You will be responsible for creating engaging user interfaces and ensuring excellent user experiences across our web applications.
+
+Key Responsibilities:
+• Develop responsive web applications using modern frontend technologies
+• Collaborate with UX/UI designers to implement pixel-perfect designs
+• Optimize applications for maximum speed and scalability
+• Write clean, maintainable, and well-documented code
+• Participate in code reviews and maintain coding standards
+
+What We Offer:
+• Competitive salary and comprehensive benefits package
+• Flexible working arrangements and remote work options
+• Professional development opportunities and learning budget
+• Collaborative and innovative work environment""",
+
+        "Backend Developer": """Join our engineering team as a Backend Developer and help build robust, scalable server-side applications. You'll work on designing and implementing APIs, managing databases, and ensuring our systems can handle high traffic loads.
+
+Key Responsibilities:
+• Design and develop RESTful APIs and microservices
+• Implement database schemas and optimize query performance
+• Ensure application security and data protection
+• Write comprehensive tests and maintain code quality
+• Collaborate with frontend developers and DevOps teams
+
+What We Offer:
+• Competitive compensation with equity options
+• Health, dental, and vision insurance
+• Flexible PTO and work-life balance
+• State-of-the-art development tools and equipment""",
+
+        "Product Manager": """We're looking for an experienced Product Manager to drive product strategy and execution. You'll work closely with engineering, design, and business stakeholders to define product roadmaps and ensure successful launches.
+
+Key Responsibilities:
+• Define product vision, strategy, and roadmap
+• Conduct market research and competitive analysis
+• Gather and prioritize product requirements from stakeholders
+• Work with engineering teams to deliver features on time
+• Analyze product metrics and user feedback for improvements
+
+What We Offer:
+• Competitive salary with performance bonuses
+• Comprehensive benefits and wellness programs
+• Professional development and conference attendance
+• Collaborative culture with cross-functional teams"""
+    }
+    
+    description = base_descriptions.get(title, f"""We are seeking a qualified {title} to join our growing team. This is an excellent opportunity for a motivated professional to contribute to our company's success.
+
+Key Responsibilities:
+• Execute core responsibilities related to {title.lower()} role
+• Collaborate with cross-functional teams to achieve business objectives
+• Contribute to process improvements and best practices
+• Maintain high standards of quality and professionalism
+
+What We Offer:
+• Competitive compensation package
+• Comprehensive benefits including health insurance
+• Professional development opportunities
+• Flexible work environment""")
+    
+    if requirements:
+        description += f"\n\nRequired Skills and Experience:\n" + "\n".join([f"• {req}" for req in requirements])
+    
+    return description
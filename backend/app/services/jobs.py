@@ -1,10 +1,19 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Sequence
+from fastapi import BackgroundTasks
+from sqlalchemy import Float, and_, func, literal_column, select, true
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by, array
+from sqlalchemy.orm import Session, aliased
 from datetime import datetime, timedelta
 from uuid import UUID
 
-from app.models.job import JobPosting
-from app.schemas.job import JobPostingCreate, JobPostingUpdate
+from app.core.pagination import Keyset
+from app.models.job import SEARCH_CONFIG, JobPosting
+from app.schemas.job import JobPostingCreate, JobPostingPublic, JobPostingUpdate
+from app.services import candidate_ranks, job_cache
+from app.services.rescoring import needs_rescore, rescore_in_background, rescore_statement
+
+# Newest first
+JOB_ORDER = Keyset(JobPosting.created_at, JobPosting.id)
 
 def create_job(db: Session, *, job_create: JobPostingCreate, recruiter_id: UUID) -> JobPosting:
     expires_at = datetime.utcnow() + timedelta(days=job_create.active_days)
@@ -16,28 +25,201 @@ def create_job(db: Session, *, job_create: JobPostingCreate, recruiter_id: UUID)
     )
     db.add(db_job)
     db.commit()
-    db.refresh(db_job)
+    job_cache.invalidate_job(db_job.id)
     return db_job
 
 def get_job(db: Session, *, job_id: UUID) -> Optional[JobPosting]:
     return db.query(JobPosting).filter(JobPosting.id == job_id).first()
 
-def get_jobs(db: Session, *, skip: int = 0, limit: int = 100) -> List[JobPosting]:
-    return db.query(JobPosting).offset(skip).limit(limit).all()
-
-def get_active_jobs(db: Session, *, skip: int = 0, limit: int = 100) -> List[JobPosting]:
-    return db.query(JobPosting).filter(
+def public_job_payload(job: JobPosting) -> dict:
+    return JobPostingPublic.model_validate(job).model_dump(mode="json")
+
+def active_jobs_payload(jobs: List[JobPosting], *, limit: int, cursor: Optional[str]) -> Any:
+    # Plain list without a cursor, page envelope with one (as GET /jobs/ returns them)
+    items = [public_job_payload(job) for job in jobs]
+    if cursor is None:
+        return items
+    return {"items": items, "next_cursor": JOB_ORDER.next_cursor(jobs, limit)}
+
+def get_public_job(db: Session, *, job_id: UUID) -> Optional[dict]:
+    # {"etag", "payload"} cache entry, or None when the job does not exist
+    def load() -> Optional[dict]:
+        with job_cache.fill_session(db) as fill_db:
+            job = get_job(fill_db, job_id=job_id)
+            return job_cache.entry(public_job_payload(job) if job else None)
+    return job_cache.get_or_load(job_cache.job_key(job_id), load)
+
+def get_active_jobs_page(db: Session, *, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> Any:
+    def load() -> Any:
+        with job_cache.fill_session(db) as fill_db:
+            jobs = get_active_jobs(fill_db, skip=skip, limit=limit, cursor=cursor)
+            return job_cache.entry(active_jobs_payload(jobs, limit=limit, cursor=cursor))
+    return job_cache.get_or_load(job_cache.active_page_key(skip=skip, limit=limit, cursor=cursor), load)
+
+def get_jobs(db: Session, *, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[JobPosting]:
+    query = db.query(JobPosting)
+    return JOB_ORDER.apply(query, skip=skip, limit=limit, cursor=cursor).all()
+
+def get_active_jobs(db: Session, *, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[JobPosting]:
+    query = db.query(JobPosting).filter(
         JobPosting.status == "active",
         JobPosting.expires_at > datetime.utcnow()
-    ).offset(skip).limit(limit).all()
+    )
+    return JOB_ORDER.apply(query, skip=skip, limit=limit, cursor=cursor).all()
+
+# Most values returned per facet, and the salary_min bucket bounds of the salary facet
+SEARCH_FACET_LIMIT = 20
+SALARY_FACET_BOUNDS = [50000, 100000, 150000, 200000]
+
+def _facet(column, *conditions):
+    # [{"value", "count"}, ...] as json, most common first
+    counts = (
+        select(column.label("value"), func.count().label("count"))
+        .where(*conditions)
+        .group_by(column)
+        .order_by(func.count().desc(), column)
+        .limit(SEARCH_FACET_LIMIT)
+        .subquery()
+    )
+    entry = func.json_build_object("value", counts.c.value, "count", counts.c.count)
+    ordered = aggregate_order_by(entry, counts.c.count.desc(), counts.c.value)
+    return select(func.json_agg(ordered, type_=JSON)).scalar_subquery()
+
+def search_jobs_statement(
+    *,
+    q: Optional[str] = None,
+    location: Optional[Sequence[str]] = None,
+    employment_type: Optional[Sequence[str]] = None,
+    salary_min: Optional[int] = None,
+    salary_max: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 20,
+):
+    """
+    One SELECT for a search over active jobs: the page of matching jobs,
+    best ts_rank_cd first, each row carrying the total and the facet counts.
+    Facets are disjunctive: each counts the jobs matching every filter but
+    its own, so a selected location still shows the other locations. An
+    empty page still returns one row (job NULL) with the counts.
+    """
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, q) if q else None
+    location_ok = JobPosting.location.in_(location) if location else true()
+    type_ok = JobPosting.employment_type.in_(employment_type) if employment_type else true()
+    salary_conditions = []
+    if salary_min is not None:
+        # Ranges overlap; jobs without a salary do not match a salary filter
+        salary_conditions.append(func.coalesce(JobPosting.salary_max, JobPosting.salary_min) >= salary_min)
+    if salary_max is not None:
+        salary_conditions.append(func.coalesce(JobPosting.salary_min, JobPosting.salary_max) <= salary_max)
+    salary_ok = and_(*salary_conditions) if salary_conditions else true()
+
+    matches = select(
+        JobPosting.id,
+        JobPosting.location,
+        JobPosting.employment_type,
+        func.width_bucket(JobPosting.salary_min, array(SALARY_FACET_BOUNDS)).label("salary_bucket"),
+        location_ok.label("location_ok"),
+        type_ok.label("type_ok"),
+        salary_ok.label("salary_ok"),
+    ).where(JobPosting.status == "active", JobPosting.expires_at > datetime.utcnow())
+    if query is not None:
+        # Keyword hits come from ix_job_postings_search_vector alone, then
+        # the status and expiry filters apply to them. In one WHERE the
+        # planner preferred walking ix_job_postings_status_created_at and
+        # checking @@ on every active job.
+        hits = (
+            select(JobPosting.id)
+            .where(JobPosting.search_vector.op("@@")(query))
+            .cte("hits")
+            .prefix_with("MATERIALIZED")
+        )
+        matches = matches.join(hits, hits.c.id == JobPosting.id)
+    matches = matches.cte("matches")
+    m = matches.c
+
+    facets = select(
+        select(func.count()).where(m.location_ok, m.type_ok, m.salary_ok).scalar_subquery().label("total"),
+        _facet(m.location, m.type_ok, m.salary_ok).label("location_facet"),
+        _facet(m.employment_type, m.location_ok, m.salary_ok).label("employment_type_facet"),
+        _facet(m.salary_bucket, m.location_ok, m.type_ok).label("salary_facet"),
+    ).subquery("facets")
+
+    # Without keywords every rank is 0 and jobs come newest first
+    rank = func.ts_rank_cd(JobPosting.search_vector, query) if query is not None else literal_column("0.0", Float)
+    order = [JobPosting.created_at.desc(), JobPosting.id.desc()]
+    if query is not None:
+        order.insert(0, rank.desc())
+    # Every column but the search vector itself
+    columns = [column for column in JobPosting.__table__.c if column.key != "search_vector"]
+    page = (
+        select(*columns, rank.label("rank"))
+        .join(matches, m.id == JobPosting.id)
+        .where(m.location_ok, m.type_ok, m.salary_ok)
+        .order_by(*order)
+        .offset(skip)
+        .limit(limit)
+        .subquery("page")
+    )
+    job = aliased(JobPosting, page, name="job")
+    return (
+        select(facets, job, page.c.rank)
+        .select_from(facets)
+        .outerjoin(page, true())
+        .order_by(page.c.rank.desc(), page.c.created_at.desc(), page.c.id.desc())
+    )
+
+def _salary_label(bucket: Optional[int]) -> Optional[str]:
+    # width_bucket: 0 below the first bound, len(bounds) at or above the last
+    if bucket is None:
+        return None
+    if bucket == len(SALARY_FACET_BOUNDS):
+        return f"{SALARY_FACET_BOUNDS[-1]}+"
+    low = SALARY_FACET_BOUNDS[bucket - 1] if bucket else 0
+    return f"{low}-{SALARY_FACET_BOUNDS[bucket]}"
+
+def search_result(rows: Sequence[Any]) -> Dict[str, Any]:
+    """JobSearchResult payload, JSON-ready, from the rows of search_jobs_statement"""
+    first = rows[0]
+    return {
+        "items": [dict(public_job_payload(row.job), rank=row.rank) for row in rows if row.job is not None],
+        "total": first.total,
+        "facets": {
+            "location": first.location_facet or [],
+            "employment_type": first.employment_type_facet or [],
+            "salary": [dict(entry, value=_salary_label(entry["value"])) for entry in first.salary_facet or []],
+        },
+    }
+
+def search_jobs(db: Session, **params: Any) -> Dict[str, Any]:
+    return search_result(db.execute(search_jobs_statement(**params)).all())
 
-def update_job(db: Session, *, job: JobPosting, job_update: JobPostingUpdate) -> JobPosting:
+def get_jobs_by_recruiter(
+    db: Session, *, recruiter_id: UUID, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+) -> List[JobPosting]:
+    query = db.query(JobPosting).filter(
+        JobPosting.recruiter_id == recruiter_id
+    )
+    return JOB_ORDER.apply(query, skip=skip, limit=limit, cursor=cursor).all()
+
+def update_job(
+    db: Session, *, job: JobPosting, job_update: JobPostingUpdate, background_tasks: Optional[BackgroundTasks] = None
+) -> JobPosting:
     update_data = job_update.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(job, field, value)
     
+    rescore = needs_rescore(update_data)
+    if rescore and background_tasks is None:
+        # No request to defer to: rescore the job's candidates in the same transaction
+        db.execute(rescore_statement(job_id=job.id, skill_weights=job.skill_weights, cutoff_percentage=job.cutoff_percentage))
+    
     db.commit()
-    db.refresh(job)
+    job_cache.invalidate_job(job.id)
+    if rescore and background_tasks is None:
+        candidate_ranks.invalidate(job.id)
+    elif rescore:
+        # After the response, from the committed weights and cutoff
+        background_tasks.add_task(rescore_in_background, job.id)
     return job
 
 def delete_job(db: Session, *, job_id: UUID) -> None:
@@ -45,74 +227,4 @@ def delete_job(db: Session, *, job_id: UUID) -> None:
     if job:
         db.delete(job)
         db.commit()
-
-def generate_job_description(title: str, requirements: List[str]) -> str:
-    """
-    Generate AI-powered job description
-    This is a mock implementation - in production, integrate with OpenAI or similar
-    """
-    base_descriptions = {
-        "Frontend Developer": """We are seeking a talented Frontend Developer to join our dynamic team. You will be responsible for creating engaging user interfaces and ensuring excellent user experiences across our web applications.
-
-Key Responsibilities:
-• Develop responsive web applications using modern frontend technologies
-• Collaborate with UX/UI designers to implement pixel-perfect designs
-• Optimize applications for maximum speed and scalability
-• Write clean, maintainable, and well-documented code
-• Participate in code reviews and maintain coding standards
-
-What We Offer:
-• Competitive salary and comprehensive benefits package
-• Flexible working arrangements and remote work options
-• Professional development opportunities and learning budget
-• Collaborative and innovative work environment""",
-
-        "Backend Developer": """Join our engineering team as a Backend Developer and help build robust, scalable server-side applications. You'll work on designing and implementing APIs, managing databases, and ensuring our systems can handle high traffic loads.
-
-Key Responsibilities:
-• Design and develop RESTful APIs and microservices
-• Implement database schemas and optimize query performance
-• Ensure application security and data protection
-• Write comprehensive tests and maintain code quality
-• Collaborate with frontend developers and DevOps teams
-
-What We Offer:
-• Competitive compensation with equity options
-• Health, dental, and vision insurance
-• Flexible PTO and work-life balance
-• State-of-the-art development tools and equipment""",
-
-        "Product Manager": """We're looking for an experienced Product Manager to drive product strategy and execution. You'll work closely with engineering, design, and business stakeholders to define product roadmaps and ensure successful launches.
-
-Key Responsibilities:
-• Define product vision, strategy, and roadmap
-• Conduct market research and competitive analysis
-• Gather and prioritize product requirements from stakeholders
-• Work with engineering teams to deliver features on time
-• Analyze product metrics and user feedback for improvements
-
-What We Offer:
-• Competitive salary with performance bonuses
-• Comprehensive benefits and wellness programs
-• Professional development and conference attendance
-• Collaborative culture with cross-functional teams"""
-    }
-    
-    description = base_descriptions.get(title, f"""We are seeking a qualified {title} to join our growing team. This is an excellent opportunity for a motivated professional to contribute to our company's success.
-
-Key Responsibilities:
-• Execute core responsibilities related to {title.lower()} role
-• Collaborate with cross-functional teams to achieve business objectives
-• Contribute to process improvements and best practices
-• Maintain high standards of quality and professionalism
-
-What We Offer:
-• Competitive compensation package
-• Comprehensive benefits including health insurance
-• Professional development opportunities
-• Flexible work environment""")
-    
-    if requirements:
-        description += f"\n\nRequired Skills and Experience:\n" + "\n".join([f"• {req}" for req in requirements])
-    
-    return description
\ No newline at end of file
+        job_cache.invalidate_job(job_id)
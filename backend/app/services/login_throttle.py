@@ -0,0 +1,49 @@
+from typing import Optional
+
+from app.core.config import settings
+from app.core.rate_limit import SlidingWindowLimiter
+
+# Every attempt from an address counts; only failures count against an email,
+# so a user who mistypes their password a few times is not locked out by others.
+_by_ip = SlidingWindowLimiter(
+    "login-ip",
+    limit=settings.LOGIN_MAX_ATTEMPTS_PER_IP,
+    window=settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+)
+_by_email = SlidingWindowLimiter(
+    "login-email",
+    limit=settings.LOGIN_MAX_FAILURES_PER_EMAIL,
+    window=settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+)
+
+def _email_key(email: str) -> str:
+    return email.strip().lower()
+
+def check_login_allowed(*, email: str, client_ip: str) -> Optional[float]:
+    """
+    Return seconds to wait before retrying, or None if the attempt may proceed.
+    Runs before any SQL or password hashing.
+    """
+    if not settings.LOGIN_THROTTLE_ENABLED:
+        return None
+    retry_after = _by_ip.check(client_ip)
+    if retry_after is None:
+        retry_after = _by_email.check(_email_key(email))
+    if retry_after is None:
+        _by_ip.record(client_ip)
+    return retry_after
+
+def record_login_failure(*, email: str) -> None:
+    if settings.LOGIN_THROTTLE_ENABLED:
+        _by_email.record(_email_key(email))
+
+def record_login_success(*, email: str) -> None:
+    if settings.LOGIN_THROTTLE_ENABLED:
+        _by_email.reset(_email_key(email))
+
+def stats() -> dict:
+    return {
+        "enabled": settings.LOGIN_THROTTLE_ENABLED,
+        "ip": _by_ip.stats(),
+        "email": _by_email.stats(),
+    }
@@ -0,0 +1,143 @@
+import gzip
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, delete, select
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.models.conversation import Conversation, ConversationMessage
+
+# Transcripts of ended conversations are moved out of conversation_messages
+# into gzip-compressed JSONL segment files under MESSAGE_ARCHIVE_DIR. Each
+# conversation is its own gzip member within a segment (so `zcat segment`
+# prints every message, one JSON object per line), and the conversation row
+# records the segment name, byte offset and length needed to read it back.
+
+SEGMENT_SUFFIX = ".jsonl.gz"
+
+_COLUMNS = ConversationMessage.__table__.columns
+
+def _encode(message: ConversationMessage) -> str:
+    values = {}
+    for column in _COLUMNS:
+        value = getattr(message, column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, UUID):
+            value = str(value)
+        values[column.key] = value
+    return json.dumps(values, separators=(",", ":"))
+
+def _decode(line: str) -> Dict[str, Any]:
+    data = json.loads(line)
+    for column in _COLUMNS:
+        value = data.get(column.key)
+        if value is None:
+            continue
+        if isinstance(column.type, DateTime):
+            data[column.key] = datetime.fromisoformat(value)
+        elif column.key in ("id", "conversation_id"):
+            data[column.key] = UUID(value)
+    return data
+
+def _fsync_dir(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def write_segment(conversations: List[Conversation]) -> Tuple[str, Dict[UUID, Tuple[int, int]]]:
+    """
+    Write the conversations' loaded messages to a new segment file, durably,
+    and return its name with each conversation's (offset, length)
+    """
+    os.makedirs(settings.MESSAGE_ARCHIVE_DIR, exist_ok=True)
+    name = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid4().hex[:8]}{SEGMENT_SUFFIX}"
+    path = os.path.join(settings.MESSAGE_ARCHIVE_DIR, name)
+    locations = {}
+    with open(path + ".tmp", "wb") as f:
+        for conversation in conversations:
+            offset = f.tell()
+            lines = "".join(_encode(message) + "\n" for message in conversation.messages)
+            f.write(gzip.compress(lines.encode(), mtime=0))
+            locations[conversation.id] = (offset, f.tell() - offset)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + ".tmp", path)
+    _fsync_dir(settings.MESSAGE_ARCHIVE_DIR)
+    return name, locations
+
+def archive_conversations(
+    db: Session, *, older_than_days: Optional[int] = None, batch_size: Optional[int] = None, max_batches: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Move the messages of conversations that ended more than older_than_days
+    ago into segment files, one segment per batch. Each segment is on disk
+    (fsynced) before its rows are deleted, in the same transaction that
+    records where each transcript went; a crash in between leaves an unused
+    segment file, never lost messages. Returns (conversations, messages).
+    """
+    if older_than_days is None:
+        older_than_days = settings.MESSAGE_ARCHIVE_AFTER_DAYS
+    if batch_size is None:
+        batch_size = settings.MESSAGE_ARCHIVE_BATCH_SIZE
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    archived_conversations = archived_messages = batches = 0
+    while max_batches is None or batches < max_batches:
+        # SKIP LOCKED: concurrent archive runs take different conversations
+        conversations = db.execute(
+            select(Conversation)
+            .where(Conversation.ended_at < cutoff, Conversation.archive_segment.is_(None))
+            .options(selectinload(Conversation.messages))
+            .order_by(Conversation.ended_at)
+            .limit(batch_size)
+            .with_for_update(of=Conversation, skip_locked=True)
+        ).scalars().all()
+        if not conversations:
+            break
+
+        name, locations = write_segment(conversations)
+        message_ids = [message.id for conversation in conversations for message in conversation.messages]
+        for conversation in conversations:
+            conversation.archive_segment = name
+            conversation.archive_offset, conversation.archive_length = locations[conversation.id]
+        # Only the messages written out: anything added since stays in the table
+        if message_ids:
+            db.execute(
+                delete(ConversationMessage).where(ConversationMessage.id.in_(message_ids))
+                .execution_options(synchronize_session=False)
+            )
+        db.commit()
+        db.expunge_all()
+
+        archived_conversations += len(conversations)
+        archived_messages += len(message_ids)
+        batches += 1
+    return archived_conversations, archived_messages
+
+def load_messages(conversation: Conversation) -> List[ConversationMessage]:
+    path = os.path.join(settings.MESSAGE_ARCHIVE_DIR, conversation.archive_segment)
+    with open(path, "rb") as f:
+        f.seek(conversation.archive_offset)
+        member = f.read(conversation.archive_length)
+    # Unsaved instances: they are only serialized, never flushed back
+    return [ConversationMessage(**_decode(line)) for line in gzip.decompress(member).decode().splitlines()]
+
+def rehydrate(conversation: Conversation) -> Conversation:
+    """
+    Put an archived conversation's transcript back in front of any messages
+    still in the table. The collection is set as already loaded, so nothing
+    is written on the next flush.
+    """
+    if conversation.archive_segment is None:
+        return conversation
+    messages = load_messages(conversation) + list(conversation.messages)
+    messages.sort(key=lambda message: message.timestamp)
+    set_committed_value(conversation, "messages", messages)
+    return conversation
@@ -0,0 +1,180 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Union
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.conversation import ConversationMessage
+from app.schemas.conversation import MessageCreate
+
+logger = logging.getLogger(__name__)
+
+# Coalescing buffer for conversation messages (CONVERSATION_MESSAGE_BUFFER).
+# Messages are acknowledged once they are queued here, not once they are
+# committed: they live only in this process until the flusher writes them, so
+# a crash (not a graceful shutdown) loses up to CONVERSATION_MESSAGE_BUFFER_SECONDS
+# of messages, and other workers see them only after the flush.
+
+_Pending = Dict[str, List[Dict[str, Any]]]  # conversation id -> rows in arrival order
+
+_pending: _Pending = OrderedDict()
+_first_queued: Dict[str, float] = {}
+_last_timestamp = datetime.min
+_lock = threading.Lock()
+_wake = threading.Event()
+_stop = threading.Event()
+_flusher: Optional[threading.Thread] = None
+_stats = {"queued": 0, "flushes": 0, "flushed_messages": 0, "dropped_messages": 0, "flush_errors": 0}
+
+def enqueue(*, conversation_id: Union[str, UUID], messages_create: Sequence[MessageCreate]) -> List[ConversationMessage]:
+    """
+    Queue messages for a conversation and return them as unsaved models. Ids
+    and timestamps are assigned here, in arrival order, so the response is
+    final before the rows are written.
+    """
+    global _last_timestamp
+    key = str(conversation_id)
+    with _lock:
+        rows = []
+        for message_create in messages_create:
+            # Strictly increasing, so the flushed rows keep their order
+            _last_timestamp = max(datetime.utcnow(), _last_timestamp + timedelta(microseconds=1))
+            rows.append(dict(
+                id=uuid4(), conversation_id=UUID(key), timestamp=_last_timestamp, **message_create.model_dump(),
+            ))
+        _pending.setdefault(key, []).extend(rows)
+        _first_queued.setdefault(key, time.monotonic())
+        full = len(_pending[key]) >= settings.CONVERSATION_MESSAGE_BUFFER_SIZE
+    _stats["queued"] += len(rows)
+    if full:
+        _wake.set()
+    return [ConversationMessage(**row) for row in rows]
+
+def has_pending(conversation_id: Union[str, UUID]) -> bool:
+    with _lock:
+        return str(conversation_id) in _pending
+
+def _take(conversation_id: Optional[str], due_only: bool) -> _Pending:
+    now = time.monotonic()
+    with _lock:
+        if conversation_id is not None:
+            keys = [conversation_id] if conversation_id in _pending else []
+        elif due_only:
+            keys = [
+                key for key, rows in _pending.items()
+                if len(rows) >= settings.CONVERSATION_MESSAGE_BUFFER_SIZE
+                or now - _first_queued[key] >= settings.CONVERSATION_MESSAGE_BUFFER_SECONDS
+            ]
+        else:
+            keys = list(_pending)
+        taken = OrderedDict()
+        for key in keys:
+            taken[key] = _pending.pop(key)
+            del _first_queued[key]
+    return taken
+
+def _requeue(taken: _Pending) -> None:
+    # Put back in front of anything queued meanwhile, keeping arrival order
+    now = time.monotonic()
+    with _lock:
+        for key, rows in taken.items():
+            rows.extend(_pending.pop(key, []))
+            _pending[key] = rows
+            _pending.move_to_end(key, last=False)
+            _first_queued[key] = min(_first_queued.get(key, now), now)
+
+def flush(*, conversation_id: Optional[Union[str, UUID]] = None, due_only: bool = False) -> int:
+    """
+    Write queued messages: one conversation's, the ones past their size or
+    time threshold (due_only), or all. Each conversation is inserted under
+    its own savepoint, so one that is rejected by the database (e.g. it was
+    deleted) is dropped without losing the others. Returns the number of
+    messages written; on other failures they are queued again.
+    """
+    taken = _take(str(conversation_id) if conversation_id is not None else None, due_only)
+    if not taken:
+        return 0
+
+    written = 0
+    db = SessionLocal()
+    try:
+        for key, rows in taken.items():
+            try:
+                with db.begin_nested():
+                    db.execute(insert(ConversationMessage), rows)
+                written += len(rows)
+            except DBAPIError as e:
+                if e.connection_invalidated:
+                    raise
+                _stats["dropped_messages"] += len(rows)
+                logger.error("Dropping %d buffered messages for conversation %s: %s", len(rows), key, e.orig)
+        db.commit()
+    except Exception:
+        db.rollback()
+        _stats["flush_errors"] += 1
+        _requeue(taken)
+        raise
+    finally:
+        db.close()
+    _stats["flushes"] += 1
+    _stats["flushed_messages"] += written
+    return written
+
+def _next_due_in() -> float:
+    with _lock:
+        oldest = min(_first_queued.values(), default=None)
+    if oldest is None:
+        return settings.CONVERSATION_MESSAGE_BUFFER_SECONDS
+    return max(0.0, oldest + settings.CONVERSATION_MESSAGE_BUFFER_SECONDS - time.monotonic())
+
+def _run() -> None:
+    while not _stop.is_set():
+        _wake.wait(_next_due_in())
+        _wake.clear()
+        if _stop.is_set():
+            break
+        try:
+            flush(due_only=True)
+        except Exception:
+            logger.warning("Conversation message flush failed, will retry", exc_info=True)
+            _stop.wait(1.0)
+
+def start_message_flusher() -> None:
+    global _flusher
+    if not settings.CONVERSATION_MESSAGE_BUFFER or _flusher is not None:
+        return
+    _stop.clear()
+    _flusher = threading.Thread(target=_run, name="conversation-message-flusher", daemon=True)
+    _flusher.start()
+
+def stop_message_flusher() -> None:
+    global _flusher
+    _stop.set()
+    _wake.set()
+    if _flusher is not None:
+        _flusher.join(timeout=5)
+        _flusher = None
+    if settings.CONVERSATION_MESSAGE_BUFFER:
+        try:
+            flush()
+        except Exception:
+            logger.error("Final conversation message flush failed; buffered messages are lost", exc_info=True)
+
+def stats() -> dict:
+    with _lock:
+        pending_conversations = len(_pending)
+        pending_messages = sum(len(rows) for rows in _pending.values())
+    return dict(
+        _stats,
+        enabled=settings.CONVERSATION_MESSAGE_BUFFER,
+        pending_conversations=pending_conversations,
+        pending_messages=pending_messages,
+        flusher_running=_flusher is not None and _flusher.is_alive(),
+    )
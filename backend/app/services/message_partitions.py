@@ -0,0 +1,171 @@
+import logging
+import re
+import threading
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.models.conversation import ConversationMessage
+
+logger = logging.getLogger(__name__)
+
+# conversation_messages is range-partitioned on timestamp, one partition per
+# month (conversation_messages_pYYYYMM) plus a default partition that catches
+# rows no monthly partition covers. Partitions are created ahead of time and
+# dropped once archival has emptied them.
+
+PARENT = ConversationMessage.__tablename__
+DEFAULT_PARTITION = f"{PARENT}_default"
+_PARTITION_NAME = re.compile(rf"^{PARENT}_p(\d{{4}})(\d{{2}})$")
+
+# pg_advisory_xact_lock key: one maintenance run at a time across workers
+LOCK_KEY = 0x6D736770  # "msgp"
+
+_stop = threading.Event()
+_worker: Optional[threading.Thread] = None
+_stats = {"runs": 0, "created": 0, "dropped": 0, "errors": 0, "skipped_locked": 0}
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+def add_months(month: date, n: int) -> date:
+    index = month.year * 12 + month.month - 1 + n
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_p{month:%Y%m}"
+
+def partition_month(name: str) -> Optional[date]:
+    match = _PARTITION_NAME.match(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+def is_partitioned(db: Session) -> bool:
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    return bool(db.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = :parent AND pg_table_is_visible(c.oid))"
+    ), {"parent": PARENT}).scalar())
+
+def partition_names(db: Session) -> List[str]:
+    return list(db.execute(text(
+        "SELECT child.relname FROM pg_inherits i "
+        "JOIN pg_class child ON child.oid = i.inhrelid "
+        "JOIN pg_class parent ON parent.oid = i.inhparent "
+        "WHERE parent.relname = :parent AND pg_table_is_visible(parent.oid) "
+        "ORDER BY child.relname"
+    ), {"parent": PARENT}).scalars())
+
+def _lock(db: Session) -> bool:
+    # Waiting on DDL locks held by live traffic would queue that traffic behind us
+    db.execute(text("SET LOCAL lock_timeout = '5s'"))
+    return bool(db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": LOCK_KEY}).scalar())
+
+def _create_partition(db: Session, month: date) -> str:
+    name, start, end = partition_name(month), month, add_months(month, 1)
+    # Built standalone and attached, so rows that reached the default partition
+    # while this month had none can be moved over first (PARTITION OF would fail)
+    db.execute(text(f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    db.execute(text(
+        f'WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE "timestamp" >= :start AND "timestamp" < :end RETURNING *) '
+        f"INSERT INTO {name} SELECT * FROM moved"
+    ), {"start": start, "end": end})
+    db.execute(text(f"ALTER TABLE {PARENT} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')"))
+    return name
+
+def ensure_partitions(db: Session, *, months_ahead: Optional[int] = None, today: Optional[date] = None) -> List[str]:
+    """
+    Create the default partition and the monthly partitions from the current
+    month through months_ahead. Returns the names created; a no-op when the
+    table is not partitioned or another worker holds the maintenance lock.
+    """
+    if not is_partitioned(db):
+        return []
+    if not _lock(db):
+        db.rollback()
+        _stats["skipped_locked"] += 1
+        return []
+    if months_ahead is None:
+        months_ahead = settings.MESSAGE_PARTITION_MONTHS_AHEAD
+    existing = set(partition_names(db))
+    if DEFAULT_PARTITION not in existing:
+        db.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARENT} DEFAULT"))
+    month = month_start(today or datetime.utcnow().date())
+    created = []
+    for _ in range(months_ahead + 1):
+        if partition_name(month) not in existing:
+            created.append(_create_partition(db, month))
+        month = add_months(month, 1)
+    db.commit()
+    _stats["created"] += len(created)
+    return created
+
+def drop_empty_partitions(db: Session, *, before: date) -> List[str]:
+    """
+    Drop monthly partitions that end on or before `before` and hold no rows
+    (their conversations have been archived). Returns the names dropped.
+    """
+    if not is_partitioned(db):
+        return []
+    if not _lock(db):
+        db.rollback()
+        _stats["skipped_locked"] += 1
+        return []
+    dropped = []
+    for name in partition_names(db):
+        month = partition_month(name)
+        if month is None or add_months(month, 1) > before:
+            continue
+        if db.execute(text(f"SELECT EXISTS (SELECT 1 FROM {name})")).scalar():
+            continue
+        db.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    db.commit()
+    _stats["dropped"] += len(dropped)
+    return dropped
+
+def maintain(db: Session) -> dict:
+    """Create upcoming partitions and drop emptied ones past the archive window"""
+    created = ensure_partitions(db)
+    cutoff = datetime.utcnow().date() - timedelta(days=settings.MESSAGE_ARCHIVE_AFTER_DAYS)
+    dropped = drop_empty_partitions(db, before=month_start(cutoff))
+    _stats["runs"] += 1
+    return {"created": created, "dropped": dropped}
+
+def _run() -> None:
+    while True:
+        db = SessionLocal()
+        try:
+            result = maintain(db)
+            if result["created"] or result["dropped"]:
+                logger.info("Message partitions created %s, dropped %s", result["created"], result["dropped"])
+        except Exception:
+            db.rollback()
+            _stats["errors"] += 1
+            logger.warning("Message partition maintenance failed, will retry", exc_info=True)
+        finally:
+            db.close()
+        if _stop.wait(settings.MESSAGE_PARTITION_MAINTENANCE_HOURS * 3600):
+            return
+
+def start_partition_maintenance() -> None:
+    global _worker
+    if engine.dialect.name != "postgresql" or _worker is not None:
+        return
+    _stop.clear()
+    _worker = threading.Thread(target=_run, name="message-partition-maintenance", daemon=True)
+    _worker.start()
+
+def stop_partition_maintenance() -> None:
+    global _worker
+    _stop.set()
+    if _worker is not None:
+        _worker.join(timeout=5)
+        _worker = None
+
+def stats() -> dict:
+    return dict(_stats, running=_worker is not None and _worker.is_alive())
@@ -0,0 +1,98 @@
+import logging
+from typing import Any, Mapping, Union
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import AsyncSessionLocal, SessionLocal
+from app.models.candidate import Candidate
+from app.models.job import JobPosting
+from app.services import candidate_ranks
+from app.services.scoring import weighted_score_expression
+
+logger = logging.getLogger(__name__)
+
+# Job fields that each candidate's weighted_score and meets_cutoff derive from
+RESCORE_FIELDS = ("skill_weights", "cutoff_percentage")
+
+_stats = {"runs": 0, "rescored_candidates": 0, "errors": 0}
+
+def needs_rescore(update_data: Mapping[str, Any]) -> bool:
+    return any(update_data.get(field) is not None for field in RESCORE_FIELDS)
+
+def rescore_statement(*, job_id: Union[str, UUID], skill_weights: Mapping[str, Any], cutoff_percentage: float):
+    """
+    One UPDATE recomputing weighted_score and meets_cutoff for all of a job's
+    candidates inside the database. Rows already holding the new values are
+    left alone, so a cutoff change only writes the candidates crossing it.
+    """
+    weighted = weighted_score_expression(skill_weights)
+    meets = weighted >= float(cutoff_percentage)
+    return (
+        update(Candidate)
+        .where(
+            Candidate.job_id == job_id,
+            or_(Candidate.weighted_score.is_distinct_from(weighted), Candidate.meets_cutoff.is_distinct_from(meets)),
+        )
+        .values(weighted_score=weighted, meets_cutoff=meets)
+        .execution_options(synchronize_session=False)
+    )
+
+def _job_statement(job_id: Union[str, UUID]):
+    return select(JobPosting.skill_weights, JobPosting.cutoff_percentage).where(JobPosting.id == job_id)
+
+def rescore_job(db: Session, *, job_id: Union[str, UUID]) -> int:
+    """
+    Rescore a job's candidates from its committed weights and cutoff, and
+    commit. Returns the number of candidates whose values changed.
+    """
+    job = db.execute(_job_statement(job_id)).first()
+    if job is None:
+        return 0
+    updated = db.execute(rescore_statement(job_id=job_id, **job._mapping)).rowcount
+    db.commit()
+    if updated:
+        candidate_ranks.invalidate(job_id)
+    return updated
+
+async def rescore_job_async(db: AsyncSession, *, job_id: Union[str, UUID]) -> int:
+    job = (await db.execute(_job_statement(job_id))).first()
+    if job is None:
+        return 0
+    updated = (await db.execute(rescore_statement(job_id=job_id, **job._mapping))).rowcount
+    await db.commit()
+    if updated:
+        await candidate_ranks.invalidate_async(job_id)
+    return updated
+
+def _record(updated: int) -> None:
+    _stats["runs"] += 1
+    _stats["rescored_candidates"] += updated
+
+def _failed(job_id: Union[str, UUID]) -> None:
+    _stats["errors"] += 1
+    logger.warning("Rescoring candidates of job %s failed; run scripts/rescore_candidates.py", job_id, exc_info=True)
+
+def rescore_in_background(job_id: Union[str, UUID]) -> None:
+    # Background task after update_job's response, on its own session
+    db = SessionLocal()
+    try:
+        _record(rescore_job(db, job_id=job_id))
+    except Exception:
+        db.rollback()
+        _failed(job_id)
+    finally:
+        db.close()
+
+async def rescore_in_background_async(job_id: Union[str, UUID]) -> None:
+    async with AsyncSessionLocal() as db:
+        try:
+            _record(await rescore_job_async(db, job_id=job_id))
+        except Exception:
+            await db.rollback()
+            _failed(job_id)
+
+def stats() -> dict:
+    return dict(_stats)
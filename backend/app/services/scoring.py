@@ -0,0 +1,43 @@
+from typing import Any, Dict, Mapping
+
+from app.models.candidate import Candidate
+
+SKILLS = ("technical", "soft", "leadership", "communication")
+
+def _weights(skill_weights: Mapping[str, Any]) -> Dict[str, float]:
+    return {skill: float(skill_weights.get(skill) or 0) for skill in SKILLS}
+
+def weighted_score(scores: Mapping[str, Any], skill_weights: Mapping[str, Any]) -> float:
+    """
+    Skill scores averaged by the job's skill weights; the overall score when
+    the job assigns no weight.
+    """
+    weights = _weights(skill_weights)
+    total = sum(weights.values())
+    if total <= 0:
+        return float(scores["overall"])
+    return sum(weights[skill] * float(scores[skill]) for skill in SKILLS) / total
+
+def meets_cutoff(weighted: float, cutoff_percentage: Any) -> bool:
+    return weighted >= float(cutoff_percentage)
+
+def score_columns(scores: Mapping[str, Any], job: Any) -> Dict[str, Any]:
+    """
+    Values for the typed score columns on Candidate, for a job (or row) with
+    skill_weights and cutoff_percentage.
+    """
+    columns: Dict[str, Any] = {f"{key}_score": float(scores[key]) for key in ("overall",) + SKILLS}
+    columns["weighted_score"] = weighted_score(scores, job.skill_weights)
+    columns["meets_cutoff"] = meets_cutoff(columns["weighted_score"], job.cutoff_percentage)
+    return columns
+
+def weighted_score_expression(skill_weights: Mapping[str, Any]):
+    """
+    SQL equivalent of weighted_score over Candidate's score columns, for
+    recomputing every candidate of a job in one UPDATE.
+    """
+    weights = _weights(skill_weights)
+    total = sum(weights.values())
+    if total <= 0:
+        return Candidate.overall_score
+    return sum(weights[skill] * getattr(Candidate, f"{skill}_score") for skill in SKILLS) / total
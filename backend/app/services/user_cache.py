@@ -0,0 +1,158 @@
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+from uuid import UUID
+
+import redis
+from sqlalchemy import DateTime, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "recruitai:user:v2:"
+# Credentials never enter either cache tier; on a cached user they stay
+# unloaded and are read from the database only if something asks for them
+EXCLUDED_COLUMNS = frozenset({"hashed_password"})
+
+_local = TTLCache(maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+_redis_stats = {"hits": 0, "misses": 0, "errors": 0}
+
+def _snapshot(user: User) -> Dict[str, Any]:
+    return {
+        column.key: getattr(user, column.key)
+        for column in User.__table__.columns
+        if column.key not in EXCLUDED_COLUMNS
+    }
+
+def _encode(snapshot: Dict[str, Any]) -> str:
+    return json.dumps({
+        key: value.isoformat() if isinstance(value, datetime) else str(value) if isinstance(value, UUID) else value
+        for key, value in snapshot.items()
+    })
+
+def _decode(raw: Union[str, bytes]) -> Dict[str, Any]:
+    data = json.loads(raw)
+    for column in User.__table__.columns:
+        value = data.get(column.key)
+        if value is None:
+            continue
+        if isinstance(column.type, DateTime):
+            data[column.key] = datetime.fromisoformat(value)
+        elif column.key == "id":
+            data[column.key] = UUID(value)
+    return data
+
+def _attach(db: Session, snapshot: Dict[str, Any]) -> User:
+    # Rebuild a detached instance and merge it without emitting a SELECT, so
+    # the returned user behaves like one loaded by this request's session.
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+def _redis_get(key: str) -> Optional[Dict[str, Any]]:
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        raw = client.get(REDIS_KEY_PREFIX + key)
+    except redis.RedisError:
+        _redis_stats["errors"] += 1
+        logger.warning("Redis unavailable for user cache read", exc_info=True)
+        return None
+    if raw is None:
+        _redis_stats["misses"] += 1
+        return None
+    _redis_stats["hits"] += 1
+    return _decode(raw)
+
+def _redis_set(key: str, snapshot: Dict[str, Any]) -> None:
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.set(REDIS_KEY_PREFIX + key, _encode(snapshot), ex=settings.USER_CACHE_TTL_SECONDS)
+    except redis.RedisError:
+        _redis_stats["errors"] += 1
+        logger.warning("Redis unavailable for user cache write", exc_info=True)
+
+def get_user(db: Session, *, user_id: Union[str, UUID]) -> Optional[User]:
+    """
+    Resolve a user by id through the local cache, then Redis, then the database.
+    """
+    if not settings.USER_CACHE_ENABLED:
+        return db.query(User).filter(User.id == user_id).first()
+
+    key = str(user_id)
+    snapshot = _local.get(key)
+    if snapshot is None:
+        snapshot = _redis_get(key)
+        if snapshot is None:
+            user = db.query(User).filter(User.id == user_id).first()
+            if not user:
+                return None
+            snapshot = _snapshot(user)
+            _redis_set(key, snapshot)
+            _local.set(key, snapshot)
+            return user
+        _local.set(key, snapshot)
+
+    return _attach(db, snapshot)
+
+async def get_user_async(db: AsyncSession, *, user_id: Union[str, UUID]) -> Optional[User]:
+    """
+    AsyncSession variant of get_user; Redis calls run in the thread pool.
+    """
+    query = select(User).where(User.id == user_id)
+    if not settings.USER_CACHE_ENABLED:
+        return (await db.execute(query)).scalars().first()
+
+    key = str(user_id)
+    snapshot = _local.get(key)
+    if snapshot is None:
+        if get_redis() is not None:
+            snapshot = await run_in_threadpool(_redis_get, key)
+        if snapshot is None:
+            user = (await db.execute(query)).scalars().first()
+            if not user:
+                return None
+            snapshot = _snapshot(user)
+            if get_redis() is not None:
+                await run_in_threadpool(_redis_set, key, snapshot)
+            _local.set(key, snapshot)
+            return user
+        _local.set(key, snapshot)
+
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+def invalidate_user(user_id: Union[str, UUID]) -> None:
+    """
+    Drop a user from every cache tier. Call after the change is committed.
+    Other workers' local tiers expire within USER_CACHE_TTL_SECONDS.
+    """
+    key = str(user_id)
+    _local.delete(key)
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.delete(REDIS_KEY_PREFIX + key)
+    except redis.RedisError:
+        _redis_stats["errors"] += 1
+        logger.warning("Redis unavailable for user cache invalidation", exc_info=True)
+
+def stats() -> Dict[str, Any]:
+    return {
+        "enabled": settings.USER_CACHE_ENABLED,
+        "local": _local.stats(),
+        "redis": dict(_redis_stats, enabled=get_redis() is not None),
+    }
@@ -1,9 +1,13 @@
 from typing import Optional
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from uuid import UUID
 
+from app.core.revocation import revoke_user_tokens
+from app.core.security import get_password_hash
 from app.models.user import User
 from app.schemas.user import UserUpdate, UserProfile
+from app.services.user_cache import invalidate_user
 
 def update_user(db: Session, *, user: User, user_update: UserUpdate) -> User:
     update_data = user_update.dict(exclude_unset=True)
@@ -11,9 +15,34 @@ def update_user(db: Session, *, user: User, user_update: UserUpdate) -> User:
         setattr(user, field, value)
     
     db.commit()
-    db.refresh(user)
+    invalidate_user(user.id)
     return user
 
+def _revoke_issued_tokens(db: Session, user: User, **values) -> User:
+    # Tokens carry role/active claims, so any change to them must retire
+    # every token issued so far. The version is bumped atomically and the
+    # row read back by the same UPDATE ... RETURNING
+    user = db.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(token_version=User.token_version + 1, **values)
+        .returning(User)
+        .execution_options(populate_existing=True)
+    ).scalar_one()
+    db.commit()
+    invalidate_user(user.id)
+    revoke_user_tokens(user.id, user.token_version)
+    return user
+
+def deactivate_user(db: Session, *, user: User) -> User:
+    return _revoke_issued_tokens(db, user, is_active=False)
+
+def change_user_role(db: Session, *, user: User, role: str) -> User:
+    return _revoke_issued_tokens(db, user, role=role)
+
+def change_password(db: Session, *, user: User, new_password: str) -> User:
+    return _revoke_issued_tokens(db, user, hashed_password=get_password_hash(new_password))
+
 def get_user_profile(db: Session, *, user_id: str) -> Optional[UserProfile]:
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
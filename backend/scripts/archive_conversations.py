@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+
+import sys
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services import message_archive, message_partitions
+
+def archive_conversations(older_than_days=None):
+    """Move transcripts of long-ended conversations to segment files and drop emptied partitions"""
+    db = SessionLocal()
+    try:
+        conversations, messages = message_archive.archive_conversations(db, older_than_days=older_than_days)
+        print(f"Archived {messages} message(s) of {conversations} conversation(s) to {settings.MESSAGE_ARCHIVE_DIR}")
+        result = message_partitions.maintain(db)
+        if result["dropped"]:
+            print(f"Dropped emptied partitions: {', '.join(result['dropped'])}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    archive_conversations(int(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+"""
+Per-request CPU of serializing the heaviest read responses, the way FastAPI
+does it by default (response_model validation of ORM objects, stdlib json,
+emails re-validated) against app.core.responses (validated once,
+pydantic-core JSON, StoredEmail):
+
+    python scripts/benchmark_serialization.py [--candidates 100] [--messages 300] [--requests 200]
+
+Responses are built from in-memory model instances, so no database is
+needed and only serialization differs between the two apps.
+"""
+
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+from pydantic import EmailStr
+
+from app.core.responses import schema_response
+from app.models import Candidate, Conversation, ConversationMessage
+from app.schemas.candidate import Candidate as CandidateSchema
+from app.schemas.conversation import Conversation as ConversationSchema
+
+FEEDBACK = {
+    "strengths": ["Clear communication", "Strong SQL"],
+    "weaknesses": ["Limited leadership experience"],
+    "recommendations": ["Pair with a senior engineer"],
+    "overall_assessment": "Recommended for the next round",
+}
+
+class EmailCheckedCandidate(CandidateSchema):
+    # The response schema before StoredEmail: emails re-validated on every response
+    email: EmailStr
+
+def make_candidates(n: int) -> List[Candidate]:
+    job_id, now = uuid.uuid4(), datetime.utcnow()
+    candidates = []
+    for i in range(n):
+        score = 50 + i % 50
+        candidates.append(Candidate(
+            id=uuid.uuid4(), name=f"Candidate {i}", email=f"candidate{i}@example.com", phone="+1 555 0100",
+            location="Remote", status="completed", applied_at=now, completed_at=now, job_id=job_id,
+            scores={"overall": score, "technical": score, "soft": score, "leadership": score, "communication": score},
+            weighted_score=score, feedback=FEEDBACK, cv_filename="cv.pdf", assessment_duration=1800,
+        ))
+    return candidates
+
+def make_conversation(n: int) -> Conversation:
+    started = datetime.utcnow()
+    messages = [
+        ConversationMessage(
+            id=uuid.uuid4(), sender="ai" if i % 2 == 0 else "candidate", message="Tell me about a project you led. " * 4,
+            timestamp=started + timedelta(seconds=i),
+            analysis={"sentiment": 0.6, "confidence": 0.8, "key_points": ["ownership", "delivery"]},
+        )
+        for i in range(n)
+    ]
+    return Conversation(
+        id=uuid.uuid4(), candidate_id=uuid.uuid4(), job_id=uuid.uuid4(), started_at=started, messages=messages,
+    )
+
+def build_apps(candidates: List[Candidate], conversation: Conversation):
+    before = FastAPI()
+
+    @before.get("/candidates", response_model=List[EmailCheckedCandidate])
+    def before_candidates():
+        return candidates
+
+    @before.get("/conversation", response_model=ConversationSchema)
+    def before_conversation():
+        return conversation
+
+    after = FastAPI(default_response_class=ORJSONResponse)
+
+    @after.get("/candidates", response_model=List[CandidateSchema])
+    def after_candidates():
+        return schema_response(List[CandidateSchema], candidates)
+
+    @after.get("/conversation", response_model=ConversationSchema)
+    def after_conversation():
+        return schema_response(ConversationSchema, conversation)
+
+    return before, after
+
+def cpu_per_request(client: TestClient, path: str, requests: int) -> float:
+    body = client.get(path).content  # warm up
+    start = time.process_time()
+    for _ in range(requests):
+        assert client.get(path).content == body
+    return (time.process_time() - start) / requests * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=100)
+    parser.add_argument("--messages", type=int, default=300)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    before, after = build_apps(make_candidates(args.candidates), make_conversation(args.messages))
+    print(f"{'response':<32}{'before ms':>10}{'after ms':>10}{'speedup':>9}")
+    with TestClient(before) as before_client, TestClient(after) as after_client:
+        for label, path in ((f"{args.candidates} candidates", "/candidates"), (f"conversation, {args.messages} messages", "/conversation")):
+            assert before_client.get(path).json() == after_client.get(path).json()
+            old = cpu_per_request(before_client, path, args.requests)
+            new = cpu_per_request(after_client, path, args.requests)
+            print(f"{label:<32}{old:>10.2f}{new:>10.2f}{old / new:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.core.query_count import count_queries
+from app.models.application import JobApplication
+from app.models.candidate import Candidate
+from app.models.conversation import Conversation, ConversationMessage
+from app.models.job import JobPosting
+from app.models.user import User
+from app.schemas.application import JobApplication as ApplicationSchema, JobApplicationCreate, JobApplicationUpdate
+from app.schemas.candidate import Candidate as CandidateSchema, CandidateRank, CandidateRanking, CandidateUpdate
+from app.schemas.conversation import Conversation as ConversationSchema, ConversationCreate, ConversationMessage as MessageSchema, MessageCreate
+from app.schemas.job import JobPosting as JobSchema, JobPostingCreate
+from app.services.applications import create_application, get_application_for_user, update_application
+from app.services.candidates import (
+    get_candidate_for_user, get_candidate_rank, get_candidate_ranking, get_candidates_version, reject_candidate, select_candidate,
+    update_candidate,
+)
+from app.services.conversations import add_message, add_messages, create_conversation, get_conversation_for_user, get_conversation_version
+from app.services.jobs import create_job
+from app.services.scoring import score_columns
+
+def check_query_counts():
+    """Run each ownership-checked and write path and assert its query count"""
+    connection = engine.connect()
+    transaction = connection.begin()
+    try:
+        # Services commit; with savepoints those commits stay inside the
+        # outer transaction, which is rolled back at the end
+        def session() -> Session:
+            return SessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+
+        db = session()
+        recruiter = User(email=f"count-check-{uuid.uuid4().hex}@example.com", hashed_password="x", name="Count check", role="recruiter")
+        applicant = User(email=f"count-check-{uuid.uuid4().hex}@example.com", hashed_password="x", name="Count check", role="candidate")
+        db.add_all([recruiter, applicant])
+        db.flush()
+        job = JobPosting(
+            title="Count check", company="Count check", description="", requirements=[], location="", employment_type="full-time",
+            skill_weights={"technical": 1}, cutoff_percentage=0, max_candidates=1, expires_at=datetime.utcnow() + timedelta(days=1),
+            recruiter_id=recruiter.id,
+        )
+        db.add(job)
+        db.flush()
+        scores = {"overall": 50, "technical": 50, "soft": 50, "leadership": 50, "communication": 50}
+        candidate = Candidate(
+            name="Count check", email="count-check@example.com", location="", scores=scores,
+            **score_columns(scores, job), job_id=job.id, user_id=applicant.id,
+        )
+        application = JobApplication(job_id=job.id, candidate_id=applicant.id)
+        conversation = Conversation(candidate_id=applicant.id, job_id=job.id)
+        db.add_all([candidate, application, conversation])
+        db.flush()
+        db.add_all([ConversationMessage(conversation_id=conversation.id, sender="ai", message=str(i)) for i in range(3)])
+        db.commit()
+        ids = dict(
+            recruiter=recruiter.id, applicant=applicant.id, candidate=candidate.id,
+            application=application.id, conversation=conversation.id,
+        )
+        job_id = job.id
+        db.close()
+
+        # Buffered messages are queued in memory and written later by the flusher
+        append_queries = 0 if settings.CONVERSATION_MESSAGE_BUFFER else 1
+
+        # One UPDATE ... RETURNING, plus the job counter UPDATE unless it is
+        # deferred to the flusher in write-behind mode
+        decision_queries = 1 if settings.JOB_COUNTERS_WRITE_BEHIND else 2
+
+        def read_candidate(s, role, user):
+            found, allowed = get_candidate_for_user(s, candidate_id=ids["candidate"], user_id=ids[user], role=role)
+            assert found and allowed
+            CandidateSchema.model_validate(found)
+
+        def update_candidate_application(s):
+            found, allowed = get_candidate_for_user(s, candidate_id=ids["candidate"], user_id=ids["recruiter"], role="recruiter")
+            assert found and allowed
+            CandidateSchema.model_validate(update_candidate(s, candidate=found, candidate_update=CandidateUpdate(scores=dict(scores, technical=80))))
+
+        def read_candidate_rank(s):
+            found, allowed = get_candidate_for_user(s, candidate_id=ids["candidate"], user_id=ids["applicant"], role="candidate")
+            assert found and allowed
+            CandidateRank.model_validate(get_candidate_rank(s, candidate=found))
+
+        def read_application(s, role, user):
+            found, allowed = get_application_for_user(s, application_id=ids["application"], user_id=ids[user], role=role)
+            assert found and allowed
+            ApplicationSchema.model_validate(found)
+
+        def update_job_application(s):
+            found, allowed = get_application_for_user(s, application_id=ids["application"], user_id=ids["recruiter"], role="recruiter")
+            assert found and allowed
+            ApplicationSchema.model_validate(update_application(s, application=found, application_update=JobApplicationUpdate(status="completed")))
+
+        def read_conversation(s, role, user):
+            found, allowed = get_conversation_for_user(s, conversation_id=ids["conversation"], user_id=ids[user], role=role)
+            assert found and allowed
+            assert len(ConversationSchema.model_validate(found).messages) == 3
+
+        checks = [
+            ("read_candidate (recruiter)", lambda s: read_candidate(s, "recruiter", "recruiter"), 1),
+            ("read_candidate (candidate)", lambda s: read_candidate(s, "candidate", "applicant"), 1),
+            ("update_candidate_application", update_candidate_application, 2),
+            ("select_candidate",
+             lambda s: CandidateSchema.model_validate(select_candidate(s, candidate_id=ids["candidate"], recruiter_id=ids["recruiter"])),
+             decision_queries),
+            ("reject_candidate",
+             lambda s: CandidateSchema.model_validate(reject_candidate(s, candidate_id=ids["candidate"], recruiter_id=ids["recruiter"])),
+             decision_queries),
+            ("read_application (recruiter)", lambda s: read_application(s, "recruiter", "recruiter"), 1),
+            ("read_application (candidate)", lambda s: read_application(s, "candidate", "applicant"), 1),
+            ("update_job_application", update_job_application, 2),
+            ("read_conversation (recruiter)", lambda s: read_conversation(s, "recruiter", "recruiter"), 2),
+            ("read_conversation (candidate)", lambda s: read_conversation(s, "candidate", "applicant"), 2),
+            # ETag version probes, run before the reads above
+            ("candidates_version",
+             lambda s: get_candidates_version(s, job_id=job_id, recruiter_id=ids["recruiter"]),
+             1),
+            ("conversation_version",
+             lambda s: get_conversation_version(s, conversation_id=ids["conversation"], user_id=ids["applicant"], role="candidate"),
+             1),
+            # The permission check, then one count in SQL or, with Redis, the
+            # rank index rebuild for this job; the ranking after it is then
+            # answered from Redis
+            ("read_candidate_rank", read_candidate_rank, 2),
+            ("read_candidate_ranking",
+             lambda s: CandidateRanking.model_validate(get_candidate_ranking(s, job_id=job_id, recruiter_id=ids["recruiter"])),
+             1 if settings.REDIS_ENABLED else 2),
+            # Inserts read server defaults back through RETURNING
+            ("create_job",
+             lambda s: JobSchema.model_validate(create_job(s, job_create=JobPostingCreate(
+                 title="Count check", company="Count check", description="", requirements=[], location="", employment_type="full-time",
+                 skill_weights={"technical": 1, "soft": 0, "leadership": 0, "communication": 0}, cutoff_percentage=0, max_candidates=1,
+             ), recruiter_id=ids["recruiter"])),
+             1),
+            ("create_application",
+             lambda s: ApplicationSchema.model_validate(create_application(
+                 s, application_create=JobApplicationCreate(job_id=job_id, candidate_id=ids["applicant"]), candidate_id=ids["applicant"],
+             )),
+             1 if settings.JOB_COUNTERS_WRITE_BEHIND else 2),
+            ("create_conversation",
+             lambda s: ConversationSchema.model_validate(create_conversation(
+                 s, conversation_create=ConversationCreate(job_id=job_id, candidate_id=ids["applicant"]), candidate_id=ids["applicant"],
+             )),
+             1),
+            ("add_message",
+             lambda s: MessageSchema.model_validate(add_message(
+                 s, conversation_id=ids["conversation"], message_create=MessageCreate(sender="candidate", message="Count check"),
+             )),
+             append_queries),
+            ("add_messages",
+             lambda s: [MessageSchema.model_validate(m) for m in add_messages(
+                 s, conversation_id=ids["conversation"],
+                 messages_create=[MessageCreate(sender=sender, message="Count check") for sender in ("ai", "candidate", "ai")],
+             )],
+             append_queries),
+        ]
+
+        failures = 0
+        for label, fn, expected in checks:
+            s = session()
+            try:
+                with count_queries(engine) as statements:
+                    fn(s)
+            finally:
+                s.close()
+            ok = len(statements) == expected
+            status = "ok" if ok else f"EXPECTED {expected}"
+            print(f"{label:35} {len(statements):3} queries  {status}")
+            if not ok:
+                for statement in statements:
+                    print("    " + " ".join(statement.split())[:160])
+            failures += not ok
+    finally:
+        transaction.rollback()
+        connection.close()
+
+    if failures:
+        print(f"{failures} paths ran an unexpected number of queries")
+        sys.exit(1)
+    print("All paths ran their expected number of queries")
+
+if __name__ == "__main__":
+    check_query_counts()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+import sys
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterator, List, Set, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal, engine
+from app.models.conversation import Conversation, ConversationMessage
+from app.models.job import JobPosting
+from app.models.user import User
+from app.services.applications import get_applications_by_job, get_applications_by_user
+from app.services.candidates import get_candidates_by_job
+from app.services.jobs import JOB_ORDER, get_active_jobs, get_jobs, get_jobs_by_recruiter, search_jobs
+
+def _index_names(plan: dict) -> Iterator[str]:
+    if "Index Name" in plan:
+        yield plan["Index Name"]
+    for child in plan.get("Plans", []):
+        yield from _index_names(child)
+
+def _capture(db: Session, fn: Callable[[Session], Any]) -> List[Tuple[str, Any]]:
+    statements = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        # Reads only; a WITH ... SELECT (such as the job search) counts too
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        fn(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return statements
+
+def _explain(db: Session, statement: str, parameters: Any) -> Set[str]:
+    plan = db.connection().exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()
+    names = set(_index_names(plan[0]["Plan"]))
+    if not names:
+        return names
+    # Indexes of a partition count as the partitioned index they belong to
+    roots = db.execute(
+        text("SELECT COALESCE(pg_partition_root(oid), oid)::regclass::text FROM pg_class WHERE relname = ANY(:names)"),
+        {"names": list(names)},
+    ).scalars()
+    return names | set(roots)
+
+def check_query_plans():
+    """Run EXPLAIN on each service list query and confirm it uses its index"""
+    db = SessionLocal()
+    try:
+        # Throwaway rows so ownership checks pass and the list queries run;
+        # everything is rolled back at the end
+        recruiter = User(email=f"plan-check-{uuid.uuid4().hex}@example.com", hashed_password="x", name="Plan check", role="recruiter")
+        db.add(recruiter)
+        db.flush()
+        job = JobPosting(
+            title="Plan check", company="Plan check", description="", requirements=[], location="", employment_type="full-time",
+            skill_weights={}, cutoff_percentage=0, max_candidates=1, expires_at=datetime.utcnow() + timedelta(days=1),
+            recruiter_id=recruiter.id,
+        )
+        db.add(job)
+        db.flush()
+
+        # Tiny tables make sequential scans cheapest; disable them so the plan
+        # shows whether an index is usable for the query at all
+        db.connection().exec_driver_sql("SET LOCAL enable_seqscan = off")
+
+        checks = [
+            ("active jobs", lambda s: get_active_jobs(s), {"ix_job_postings_status_created_at"}),
+            ("jobs by recruiter", lambda s: get_jobs_by_recruiter(s, recruiter_id=recruiter.id), {"ix_job_postings_recruiter_id_created_at"}),
+            ("jobs, next page",
+             lambda s: get_jobs(s, cursor=JOB_ORDER.encode(job)),
+             {"ix_job_postings_created_at"}),
+            ("job search", lambda s: search_jobs(s, q="python engineer"), {"ix_job_postings_search_vector"}),
+            ("candidates by job, ranked",
+             lambda s: get_candidates_by_job(s, job_id=job.id, recruiter_id=recruiter.id),
+             {"ix_candidates_job_id_weighted_score"}),
+            ("candidates by job and status",
+             lambda s: get_candidates_by_job(s, job_id=job.id, recruiter_id=recruiter.id, status="pending"),
+             {"ix_candidates_job_id_status_weighted_score"}),
+            ("candidates by job and minimum score",
+             lambda s: get_candidates_by_job(s, job_id=job.id, recruiter_id=recruiter.id, min_score=50),
+             {"ix_candidates_job_id_overall_score", "ix_candidates_job_id_weighted_score"}),
+            ("candidates by job and minimum weighted score",
+             lambda s: get_candidates_by_job(s, job_id=job.id, recruiter_id=recruiter.id, min_weighted_score=50),
+             {"ix_candidates_job_id_weighted_score"}),
+            ("applications by candidate", lambda s: get_applications_by_user(s, user_id=recruiter.id), {"ix_job_applications_candidate_id_applied_at"}),
+            ("applications by job and status",
+             lambda s: get_applications_by_job(s, job_id=job.id, recruiter_id=recruiter.id, status="pending"),
+             {"ix_job_applications_job_id_status_applied_at"}),
+            ("conversation messages",
+             lambda s: s.query(ConversationMessage).filter(ConversationMessage.conversation_id == uuid.uuid4()).order_by(ConversationMessage.timestamp).all(),
+             {"ix_conversation_messages_conversation_id_timestamp"}),
+            ("conversations by candidate", lambda s: s.query(Conversation).filter(Conversation.candidate_id == recruiter.id).all(), {"ix_conversations_candidate_id"}),
+        ]
+
+        failures = 0
+        for label, fn, expected in checks:
+            used: Set[str] = set()
+            for statement, parameters in _capture(db, fn):
+                used |= _explain(db, statement, parameters)
+            # A query passes if its plan uses any of the expected indexes
+            ok = bool(expected & used)
+            status = "ok" if ok else "EXPECTED " + " or ".join(sorted(expected))
+            print(f"{label:45} {status:45} uses: {', '.join(sorted(used)) or '-'}")
+            failures += not ok
+    finally:
+        db.rollback()
+        db.close()
+
+    if failures:
+        print(f"{failures} queries are not using their index")
+        sys.exit(1)
+    print("All service queries use their indexes")
+
+if __name__ == "__main__":
+    check_query_plans()
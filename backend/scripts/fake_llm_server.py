@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+"""
+Local stand-in for an OpenAI-compatible chat completions API, for tests and
+benchmarks of job description generation without a real model:
+
+    python scripts/fake_llm_server.py --port 8001 --delay 2
+    LLM_API_URL=http://127.0.0.1:8001/v1 uvicorn app.main:app
+
+Each completion sleeps --delay seconds, like a model would, and echoes the
+prompt into a deterministic description. GET /stats returns how many
+completions were served, so a benchmark can check that repeated and
+concurrent identical requests reached it once.
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_lock = threading.Lock()
+_stats = {"completions": 0}
+
+def make_handler(delay: float):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body: dict) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path.rstrip("/") != "/stats":
+                return self._send(404, {"error": "not found"})
+            with _lock:
+                self._send(200, dict(_stats))
+
+        def do_POST(self):
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                return self._send(404, {"error": "not found"})
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            prompt = request["messages"][-1]["content"]
+            time.sleep(delay)
+            with _lock:
+                _stats["completions"] += 1
+            content = f"Generated by the local stand-in model.\n\n{prompt}"
+            self._send(200, {
+                "object": "chat.completion",
+                "model": request.get("model"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            })
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--delay", type=float, default=1.0, help="seconds each completion takes")
+    args = parser.parse_args()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.delay))
+    print(f"Fake LLM listening on http://{args.host}:{args.port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
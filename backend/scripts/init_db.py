@@ -1,15 +1,24 @@
 #!/usr/bin/env python3
 
 import asyncio
+from alembic import command
+from alembic.config import Config
 from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.core.database import Base
 from app.models import *  # Import all models
+from app.services import message_partitions
 
 def init_db():
     """Initialize database with tables"""
     engine = create_engine(settings.DATABASE_URL)
     Base.metadata.create_all(bind=engine)
+    # conversation_messages is created partitioned; it needs partitions before the first insert
+    with Session(engine) as db:
+        message_partitions.ensure_partitions(db)
+    # Tables now match the models, so mark every migration as applied
+    command.stamp(Config("alembic.ini"), "head")
     print("Database initialized successfully!")
 
 if __name__ == "__main__":
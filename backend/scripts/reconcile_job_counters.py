@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+
+import sys
+from app.core.database import SessionLocal
+from app.services import job_counters
+
+def reconcile_job_counters(job_id=None):
+    """Recompute job counters from the applications and candidates tables"""
+    # Apply anything still buffered here first so it is not added on top later.
+    # With local (non-Redis) write-behind, run this while API workers are stopped.
+    job_counters.flush()
+    db = SessionLocal()
+    try:
+        updated = job_counters.reconcile(db, job_id=job_id)
+    finally:
+        db.close()
+    print(f"Reconciled counters for {updated} job(s)")
+
+if __name__ == "__main__":
+    reconcile_job_counters(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+
+import sys
+from sqlalchemy import select
+from app.core.database import SessionLocal
+from app.models.job import JobPosting
+from app.services import rescoring
+
+def rescore_candidates(job_id=None):
+    """Recompute weighted scores and cutoff results from each job's current settings"""
+    db = SessionLocal()
+    try:
+        job_ids = [job_id] if job_id else db.execute(select(JobPosting.id)).scalars().all()
+        updated = sum(rescoring.rescore_job(db, job_id=job) for job in job_ids)
+    finally:
+        db.close()
+    print(f"Rescored {updated} candidate(s) across {len(job_ids)} job(s)")
+
+if __name__ == "__main__":
+    rescore_candidates(sys.argv[1] if len(sys.argv) > 1 else None)